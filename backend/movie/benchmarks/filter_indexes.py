@@ -0,0 +1,150 @@
+"""
+Бенчмарк фильтрующих запросов каталога до и после индексов миграции 4b7e1d9a2c31.
+
+Создает отдельную схему bench_filter в базе MOVIE_DATABASE_URL, заполняет ее
+синтетическим каталогом (по умолчанию 100 000 тайтлов), замеряет запросы
+листинга и фильтров без индексов, затем с индексами, и удаляет схему.
+
+Запуск: uv run python -m benchmarks.filter_indexes [--titles 100000] [--runs 20]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.core.config import get_settings
+
+settings = get_settings()
+
+SCHEMA = "bench_filter"
+
+DDL = [
+    f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE",
+    f"CREATE SCHEMA {SCHEMA}",
+    f"""CREATE TABLE {SCHEMA}.films (
+        id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+        film_name varchar NOT NULL UNIQUE,
+        type varchar NOT NULL,
+        year_prod integer NOT NULL,
+        rating double precision NOT NULL
+    )""",
+    f"""CREATE TABLE {SCHEMA}.genres (
+        id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+        genre_name varchar NOT NULL UNIQUE
+    )""",
+    f"""CREATE TABLE {SCHEMA}.film_genre_association (
+        film_id uuid REFERENCES {SCHEMA}.films(id),
+        genre_id uuid REFERENCES {SCHEMA}.genres(id),
+        PRIMARY KEY (film_id, genre_id)
+    )""",
+    f"""CREATE TABLE {SCHEMA}.comments (
+        id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+        film_id uuid NOT NULL REFERENCES {SCHEMA}.films(id),
+        rating double precision NOT NULL
+    )""",
+]
+
+SEED = [
+    f"""INSERT INTO {SCHEMA}.films (film_name, type, year_prod, rating)
+        SELECT 'title-' || n,
+               CASE WHEN n % 3 = 0 THEN 'serial' ELSE 'movie' END,
+               1950 + (n % 75),
+               round((random() * 10)::numeric, 1)
+        FROM generate_series(1, :titles) AS n""",
+    f"""INSERT INTO {SCHEMA}.genres (genre_name)
+        SELECT 'genre-' || n FROM generate_series(1, 30) AS n""",
+    f"""INSERT INTO {SCHEMA}.film_genre_association (film_id, genre_id)
+        SELECT f.id, g.id
+        FROM {SCHEMA}.films f
+        JOIN {SCHEMA}.genres g ON g.genre_name IN (
+            'genre-' || (1 + abs(hashtext(f.film_name)) % 30),
+            'genre-' || (1 + abs(hashtext(f.film_name || '#')) % 30)
+        )""",
+    f"""INSERT INTO {SCHEMA}.comments (film_id, rating)
+        SELECT id, random() * 10 FROM {SCHEMA}.films, generate_series(1, 3)""",
+]
+
+INDEXES = [
+    f"CREATE INDEX ix_films_type_rating ON {SCHEMA}.films (type, rating, id)",
+    f"CREATE INDEX ix_comments_film_id ON {SCHEMA}.comments (film_id)",
+    f"""CREATE INDEX ix_film_genre_association_genre_id
+        ON {SCHEMA}.film_genre_association (genre_id)""",
+]
+
+QUERIES = {
+    "listing (type, ORDER BY rating)": f"""
+        SELECT id FROM {SCHEMA}.films
+        WHERE type = 'movie'
+        ORDER BY rating DESC, id DESC LIMIT 11""",
+    "filter rating >= 8": f"""
+        SELECT id FROM {SCHEMA}.films
+        WHERE type = 'movie' AND rating >= 8
+        ORDER BY rating DESC, id DESC LIMIT 51""",
+    "filter genre + rating": f"""
+        SELECT f.id FROM {SCHEMA}.films f
+        JOIN {SCHEMA}.film_genre_association fg ON fg.film_id = f.id
+        JOIN {SCHEMA}.genres g ON g.id = fg.genre_id
+        WHERE f.type = 'movie' AND f.rating >= 5 AND g.genre_name = 'genre-7'
+        ORDER BY f.rating DESC, f.id DESC LIMIT 51""",
+    "comments for a page": f"""
+        SELECT c.id FROM {SCHEMA}.comments c
+        WHERE c.film_id IN (
+            SELECT id FROM {SCHEMA}.films WHERE type = 'movie'
+            ORDER BY rating DESC, id DESC LIMIT 10
+        )""",
+}
+
+
+async def measure(conn, runs: int) -> dict:
+    timings = {}
+    for name, query in QUERIES.items():
+        await conn.execute(text(query))  # прогрев
+        samples = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            await conn.execute(text(query))
+            samples.append((time.perf_counter() - started) * 1000)
+        timings[name] = statistics.median(samples)
+    return timings
+
+
+async def main(titles: int, runs: int):
+    engine = create_async_engine(settings.database_url)
+    try:
+        async with engine.begin() as conn:
+            for statement in DDL:
+                await conn.execute(text(statement))
+            print(f"Заполнение каталога: {titles} тайтлов...")
+            for statement in SEED:
+                await conn.execute(text(statement), {"titles": titles})
+            await conn.execute(text(f"ANALYZE {SCHEMA}.films"))
+            await conn.execute(text(f"ANALYZE {SCHEMA}.film_genre_association"))
+            await conn.execute(text(f"ANALYZE {SCHEMA}.comments"))
+
+            before = await measure(conn, runs)
+
+            for statement in INDEXES:
+                await conn.execute(text(statement))
+            await conn.execute(text(f"ANALYZE {SCHEMA}.films"))
+            await conn.execute(text(f"ANALYZE {SCHEMA}.film_genre_association"))
+            await conn.execute(text(f"ANALYZE {SCHEMA}.comments"))
+
+            after = await measure(conn, runs)
+
+        print(f"{'запрос':<36}{'без индексов, мс':>18}{'с индексами, мс':>18}")
+        for name in QUERIES:
+            print(f"{name:<36}{before[name]:>18.2f}{after[name]:>18.2f}")
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--titles", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.titles, args.runs))
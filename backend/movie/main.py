@@ -4,18 +4,41 @@ from fastapi import FastAPI
 from strawberry import Schema
 from loguru import logger
 from fastapi.middleware.cors import CORSMiddleware
+from src.controller.context import get_context
 from src.controller.route import Mutations, Queries
+from src.core.kafka.consumer.consumer import comment_consumer
+from src.core.redis.cache import response_cache
+from src.core.s3.base import s3_client_pool
+from src.core.s3.cache import presigned_url_cache
+from src.core.s3.index import s3_key_index
 import uvicorn
 
 schema = Schema(query=Queries, mutation=Mutations)
 
-graphql_app = GraphQLRouter(schema=schema)
+graphql_app = GraphQLRouter(schema=schema, context_getter=get_context)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting Fastapi server...")
+    await s3_client_pool.start()
+    try:
+        await s3_key_index.load()
+    except Exception as e:
+        logger.error(f"Не удалось загрузить индекс ключей S3: {e}")
+    await s3_key_index.start()
+    try:
+        await comment_consumer.start()
+    except Exception as e:
+        logger.error(
+            f"Kafka недоступна, потребитель топика comment подключится позже: {e}"
+        )
     yield
+    await comment_consumer.stop()
+    await s3_key_index.stop()
+    await presigned_url_cache.close()
+    await response_cache.close()
+    await s3_client_pool.stop()
     logger.info("Fastapi server stopped.")
 
 
@@ -31,5 +54,10 @@ app.add_middleware(
 
 app.include_router(graphql_app, prefix="/film")
 
+
+@app.get("/film/metrics/s3-url-cache")
+async def s3_url_cache_metrics():
+    return presigned_url_cache.stats()
+
 if __name__ == "__main__":
     uvicorn.run(app="main:app", host="0.0.0.0", port=8010, reload=True)
@@ -0,0 +1,63 @@
+"""add indexes for listing filters and joins
+
+Revision ID: 4b7e1d9a2c31
+Revises: 68c22525f815
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4b7e1d9a2c31"
+down_revision: Union[str, None] = "68c22525f815"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_films_type_rating", "films", ["type", "rating", "id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_comments_film_id"), "comments", ["film_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_film_actor_film_id"), "film_actor", ["film_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_film_actor_actor_id"), "film_actor", ["actor_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_film_genre_association_genre_id"),
+        "film_genre_association",
+        ["genre_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_film_country_association_country_id"),
+        "film_country_association",
+        ["country_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_film_country_association_country_id"),
+        table_name="film_country_association",
+    )
+    op.drop_index(
+        op.f("ix_film_genre_association_genre_id"),
+        table_name="film_genre_association",
+    )
+    op.drop_index(op.f("ix_film_actor_actor_id"), table_name="film_actor")
+    op.drop_index(op.f("ix_film_actor_film_id"), table_name="film_actor")
+    op.drop_index(op.f("ix_comments_film_id"), table_name="comments")
+    op.drop_index("ix_films_type_rating", table_name="films")
@@ -0,0 +1,35 @@
+from strawberry.dataloader import DataLoader
+from strawberry.fastapi import BaseContext
+from src.repositories.batch.batches import BatchRepository
+
+batch_repository = BatchRepository()
+
+
+class Context(BaseContext):
+    """
+    Контекст одного GraphQL-запроса. DataLoader-ы собирают ключи со всех
+    резолверов запроса в один пакет и кэшируют результат до конца запроса,
+    поэтому актер или аватарка, встреченные на странице несколько раз,
+    загружаются один раз.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.actors_loader = DataLoader(
+            load_fn=batch_repository.get_actors_by_film_ids
+        )
+        self.comments_loader = DataLoader(
+            load_fn=batch_repository.get_comments_by_film_ids
+        )
+        self.film_poster_loader = DataLoader(
+            load_fn=batch_repository.get_film_posters
+        )
+        self.video_url_loader = DataLoader(load_fn=batch_repository.get_video_urls)
+        self.actor_poster_loader = DataLoader(
+            load_fn=batch_repository.get_actor_posters
+        )
+        self.user_image_loader = DataLoader(load_fn=batch_repository.get_user_images)
+
+
+async def get_context() -> Context:
+    return Context()
@@ -4,12 +4,23 @@ from src.controller.schema.schemas import (
     FilmResponse,
     FilmInput,
     FilmType,
+    FilmPageType,
+    FilmCardPageType,
     CommentInput, GenresCountriesType, FiltersResponseType,
 )
+from src.core.config import get_settings
 from src.core.schemas import CreateCommentModel, GenresCountries
-from src.utils.converter import convert_film_model, convert_comment_film_model
+from src.utils.converter import (
+    convert_film_model,
+    convert_comment_film_model,
+    convert_film_type,
+    convert_film_page_type,
+    convert_film_card_page_type,
+)
 from src.service.films import FilmService
 
+settings = get_settings()
+
 
 @type
 class AddFilm:
@@ -29,35 +40,36 @@ class AddFilm:
 class GetFilms:
     @field
     @staticmethod
-    async def get_films() -> List[FilmType]:
+    async def get_films(
+        first: int = settings.page_size_default, after: Optional[str] = None
+    ) -> List[FilmType]:
         """
-        Query запрос для получения всех фильмов
+        Query запрос для получения страницы фильмов
         """
-        films = await FilmService.get_all_films()
-
-        film_data = []
-        for film in films:
-            film_data.append(
-                FilmType(
-                    film_name=film.film_name,
-                    type=film.type,
-                    description=film.description,
-                    year_prod=film.year_prod,
-                    age_rating=film.age_rating,
-                    watch_time=film.watch_time,
-                    rating=film.rating,
-                    poster_url=film.poster_url,
-                    comment=film.comments,
-                    genres=film.genres,
-                    countries=film.countries,
-                    actors=film.actors,
-                    preview_url=film.preview_url,
-                    text_url=film.text_url,
-                    video_url=film.video_url,
-                )
-            )
-
-        return film_data
+        films = await FilmService.get_all_films(first=first, after=after)
+        return [convert_film_type(film) for film in films.items]
+
+    @field
+    @staticmethod
+    async def get_films_page(
+        first: int = settings.page_size_default, after: Optional[str] = None
+    ) -> FilmPageType:
+        """
+        Query запрос для получения страницы фильмов с курсором следующей страницы
+        """
+        films = await FilmService.get_all_films(first=first, after=after)
+        return convert_film_page_type(films)
+
+    @field
+    @staticmethod
+    async def get_film_cards(
+        first: int = settings.page_size_default, after: Optional[str] = None
+    ) -> FilmCardPageType:
+        """
+        Query запрос для получения облегченных карточек фильмов для сетки
+        """
+        cards = await FilmService.get_film_cards(first=first, after=after)
+        return convert_film_card_page_type(cards)
 
 
 @type
@@ -79,25 +91,7 @@ class GetFilmForName:
     async def get_film_name(film_name: str) -> FilmType:
         film = await FilmService.get_film_name(film_name=film_name)
 
-        film_type = FilmType(
-            film_name=film.film_name,
-            type=film.type,
-            description=film.description,
-            year_prod=film.year_prod,
-            age_rating=film.age_rating,
-            watch_time=film.watch_time,
-            rating=film.rating,
-            genres=film.genres,
-            countries=film.countries,
-            comment=film.comments,
-            actors=film.actors,
-            poster_url=film.poster_url,
-            preview_url=film.preview_url,
-            text_url=film.text_url,
-            video_url=film.video_url,
-        )
-
-        return film_type
+        return convert_film_type(film)
 
 
 @type
@@ -108,55 +102,35 @@ class GetFilmForFilter:
         film_genre: Optional[str] = None,
         country_name: Optional[str] = None,
         rating: Optional[float] = None,
+        first: int = settings.page_size_max,
+        after: Optional[str] = None,
     ) -> Optional[List[FilmType]]:
         films = await FilmService.get_film_filter(
-            film_genre=film_genre, country_name=country_name, rating=rating
+            film_genre=film_genre,
+            country_name=country_name,
+            rating=rating,
+            first=first,
+            after=after,
         )
+        return [convert_film_type(film) for film in films.items]
 
-        # Если найден один фильм, возвращаем его в виде списка
-        if len(films) == 1:
-            film = films[0]
-            return [
-                FilmType(
-                    film_name=film.film_name,
-                    type=film.type,
-                    description=film.description,
-                    year_prod=film.year_prod,
-                    age_rating=film.age_rating,
-                    watch_time=film.watch_time,
-                    rating=film.rating,
-                    genres=film.genres,
-                    comment=film.comments if hasattr(film, "comments") else [],
-                    countries=film.countries,
-                    actors=film.actors,
-                    poster_url=film.poster_url,
-                    preview_url=film.preview_url,
-                    text_url=film.text_url,
-                    video_url=film.video_url,
-                )
-            ]
-
-        # Если фильмов несколько, возвращаем список
-        return [
-            FilmType(
-                film_name=film.film_name,
-                type=film.type,
-                description=film.description,
-                year_prod=film.year_prod,
-                age_rating=film.age_rating,
-                watch_time=film.watch_time,
-                rating=film.rating,
-                genres=film.genres,
-                comment=film.comments if hasattr(film, "comments") else [],
-                countries=film.countries,
-                actors=film.actors,
-                poster_url=film.poster_url,
-                preview_url=film.preview_url,
-                text_url=film.text_url,
-                video_url=film.video_url,
-            )
-            for film in films
-        ]
+    @field
+    @staticmethod
+    async def get_film_filter_page(
+        film_genre: Optional[str] = None,
+        country_name: Optional[str] = None,
+        rating: Optional[float] = None,
+        first: int = settings.page_size_max,
+        after: Optional[str] = None,
+    ) -> FilmPageType:
+        films = await FilmService.get_film_filter(
+            film_genre=film_genre,
+            country_name=country_name,
+            rating=rating,
+            first=first,
+            after=after,
+        )
+        return convert_film_page_type(films)
 
 @type
 class GetFilmFilter:
@@ -1,5 +1,7 @@
 from datetime import datetime
+from uuid import UUID
 import strawberry
+from strawberry.types import Info
 from typing import List, Optional
 
 from src.core.schemas import FiltersResponse
@@ -29,9 +31,14 @@ class CommentType:
     comment: str
     rating: float
     username: str
-    user_id: str
-    film_name: str
-    user_image: Optional[str]
+    user_id: Optional[str] = None
+    film_name: Optional[str] = None
+
+    @strawberry.field
+    async def user_image(self, info: Info) -> Optional[str]:
+        if self.user_id is None:
+            return None
+        return await info.context.user_image_loader.load(self.user_id)
 
 
 @strawberry.input
@@ -44,6 +51,15 @@ class GenresInput:
     genre_name: str
 
 
+@strawberry.type
+class FilmActorType:
+    film_name: str
+    type: str
+    year_prod: int
+    rating: float
+    poster_url: Optional[str] = None
+
+
 @strawberry.type
 class ActorType:
     actor_name: str
@@ -54,12 +70,25 @@ class ActorType:
     age: int
     growth: str
     biography: str
-    films: Optional[List["FilmType"]]
-    poster_url: Optional[str] = None
+    films: Optional[List[FilmActorType]] = None
+    loaded_poster_url: strawberry.Private[Optional[str]] = None
+    prefetched: strawberry.Private[bool] = False
+
+    @strawberry.field
+    async def poster_url(self, info: Info) -> Optional[str]:
+        if self.prefetched:
+            return self.loaded_poster_url
+        return await info.context.actor_poster_loader.load(self.actor_name)
 
 
 @strawberry.type
 class FilmType:
+    """
+    Фильм или сериал. Актеры, комментарии и ссылки S3 резолвятся на уровне
+    полей: их пакетно догружают DataLoader-ы из контекста запроса и только
+    если клиент их запросил.
+    """
+
     film_name: str
     type: str
     description: str
@@ -68,13 +97,88 @@ class FilmType:
     watch_time: str
     countries: List[str]
     rating: float
-    actors: List[ActorType]
     genres: List[str]
-    comment: Optional[List[CommentType]] = strawberry.field(default_factory=list)
+    film_id: strawberry.Private[Optional[UUID]] = None
+
+    @strawberry.field
+    async def actors(self, info: Info) -> List[ActorType]:
+        actors = await info.context.actors_loader.load(self.film_id)
+        return [
+            ActorType(
+                actor_name=actor.actor_name,
+                career=actor.career,
+                date_of_birth=actor.date_of_birth,
+                place_of_birth=actor.place_of_birth,
+                sex=actor.sex,
+                age=actor.age,
+                growth=actor.growth,
+                biography=actor.biography,
+            )
+            for actor in actors
+        ]
+
+    @strawberry.field
+    async def comment(self, info: Info) -> Optional[List[CommentType]]:
+        comments = await info.context.comments_loader.load(self.film_id)
+        return [
+            CommentType(
+                comment=comment.comment,
+                rating=comment.rating,
+                username=comment.username,
+                user_id=str(comment.user_id),
+                film_name=self.film_name,
+            )
+            for comment in comments
+        ]
+
+    async def _poster(self, info: Info) -> dict:
+        return await info.context.film_poster_loader.load(self.film_name)
+
+    @strawberry.field
+    async def poster_url(self, info: Info) -> Optional[str]:
+        return (await self._poster(info)).get("poster_url")
+
+    @strawberry.field
+    async def preview_url(self, info: Info) -> Optional[str]:
+        return (await self._poster(info)).get("preview_url")
+
+    @strawberry.field
+    async def text_url(self, info: Info) -> Optional[str]:
+        return (await self._poster(info)).get("text_url")
+
+    @strawberry.field
+    async def video_url(self, info: Info) -> Optional[str]:
+        return await info.context.video_url_loader.load((self.type, self.film_name))
+
+
+@strawberry.type
+class PageInfoType:
+    end_cursor: Optional[str] = None
+    has_next_page: bool = False
+
+
+@strawberry.type
+class FilmPageType:
+    items: List[FilmType]
+    page_info: PageInfoType
+
+
+@strawberry.type
+class FilmCardType:
+    film_name: str
+    type: str
+    year_prod: int
+    rating: float
+    genres: List[str]
     poster_url: Optional[str] = None
     preview_url: Optional[str] = None
     text_url: Optional[str] = None
-    video_url: Optional[str] = None
+
+
+@strawberry.type
+class FilmCardPageType:
+    items: List[FilmCardType]
+    page_info: PageInfoType
 
 
 @strawberry.type
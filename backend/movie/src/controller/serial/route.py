@@ -3,14 +3,25 @@ from strawberry import type, mutation, field
 from src.controller.schema.schemas import (
     FilmInput,
     FilmType,
+    FilmPageType,
+    FilmCardPageType,
     FilmResponse,
     CommentType,
     CommentInput, GenresCountriesType,
 )
+from src.core.config import get_settings
 from src.core.schemas import CreateCommentModel
-from src.utils.converter import convert_film_model, convert_comment_film_model
+from src.utils.converter import (
+    convert_film_model,
+    convert_comment_film_model,
+    convert_film_type,
+    convert_film_page_type,
+    convert_film_card_page_type,
+)
 from src.service.serials import SerialService
 
+settings = get_settings()
+
 
 @type
 class AddSerial:
@@ -43,35 +54,36 @@ class CreateCommentSerial:
 class GetSerials:
     @field
     @staticmethod
-    async def get_serials() -> List[FilmType]:
+    async def get_serials(
+        first: int = settings.page_size_default, after: Optional[str] = None
+    ) -> List[FilmType]:
         """
-        Query запрос для получения всех сериалов
+        Query запрос для получения страницы сериалов
         """
-        serials = await SerialService.get_all_serials()
-
-        serial_data = []
-        for serial in serials:
-            serial_data.append(
-                FilmType(
-                    film_name=serial.film_name,
-                    type=serial.type,
-                    description=serial.description,
-                    year_prod=serial.year_prod,
-                    comment=serial.comments if hasattr(serial, "comments") else [],
-                    age_rating=serial.age_rating,
-                    watch_time=serial.watch_time,
-                    rating=serial.rating,
-                    poster_url=serial.poster_url,
-                    genres=serial.genres,
-                    countries=serial.countries,
-                    actors=serial.actors,
-                    preview_url=serial.preview_url,
-                    text_url=serial.text_url,
-                    video_url=serial.video_url,
-                )
-            )
+        serials = await SerialService.get_all_serials(first=first, after=after)
+        return [convert_film_type(serial) for serial in serials.items]
 
-        return serial_data
+    @field
+    @staticmethod
+    async def get_serials_page(
+        first: int = settings.page_size_default, after: Optional[str] = None
+    ) -> FilmPageType:
+        """
+        Query запрос для получения страницы сериалов с курсором следующей страницы
+        """
+        serials = await SerialService.get_all_serials(first=first, after=after)
+        return convert_film_page_type(serials)
+
+    @field
+    @staticmethod
+    async def get_serial_cards(
+        first: int = settings.page_size_default, after: Optional[str] = None
+    ) -> FilmCardPageType:
+        """
+        Query запрос для получения облегченных карточек сериалов для сетки
+        """
+        cards = await SerialService.get_serial_cards(first=first, after=after)
+        return convert_film_card_page_type(cards)
 
 
 @type
@@ -81,23 +93,7 @@ class GetSerialForName:
     async def get_serial_name(serial_name: str) -> FilmType:
         serial = await SerialService.get_serial_name(serial_name=serial_name)
 
-        return FilmType(
-            film_name=serial.film_name,
-            type=serial.type,
-            description=serial.description,
-            year_prod=serial.year_prod,
-            age_rating=serial.age_rating,
-            watch_time=serial.watch_time,
-            comment=serial.comments if hasattr(serial, "comments") else [],
-            rating=serial.rating,
-            genres=serial.genres,
-            countries=serial.countries,
-            actors=serial.actors,
-            poster_url=serial.poster_url,
-            preview_url=serial.preview_url,
-            text_url=serial.text_url,
-            video_url=serial.video_url,
-        )
+        return convert_film_type(serial)
 
 
 @type
@@ -108,55 +104,35 @@ class GetSerialForGenre:
         film_genre: Optional[str] = None,
         country_name: Optional[str] = None,
         rating: Optional[float] = None,
+        first: int = settings.page_size_max,
+        after: Optional[str] = None,
     ) -> Optional[List[FilmType]]:
         serials = await SerialService.get_serial_filter(
-            film_genre=film_genre, country_name=country_name, rating=rating
+            film_genre=film_genre,
+            country_name=country_name,
+            rating=rating,
+            first=first,
+            after=after,
         )
+        return [convert_film_type(serial) for serial in serials.items]
 
-        # Если найден один фильм, возвращаем его в виде списка
-        if len(serials) == 1:
-            serial = serials[0]
-            return [
-                FilmType(
-                    film_name=serial.film_name,
-                    type=serial.type,
-                    description=serial.description,
-                    year_prod=serial.year_prod,
-                    age_rating=serial.age_rating,
-                    watch_time=serial.watch_time,
-                    rating=serial.rating,
-                    genres=serial.genres,
-                    comment=serial.comments if hasattr(serial, "comments") else [],
-                    countries=serial.countries,
-                    actors=serial.actors,
-                    poster_url=serial.poster_url,
-                    preview_url=serial.preview_url,
-                    text_url=serial.text_url,
-                    video_url=serial.video_url,
-                )
-            ]
-
-        # Если фильмов несколько, возвращаем список
-        return [
-            FilmType(
-                film_name=serial.film_name,
-                type=serial.type,
-                description=serial.description,
-                year_prod=serial.year_prod,
-                age_rating=serial.age_rating,
-                watch_time=serial.watch_time,
-                rating=serial.rating,
-                genres=serial.genres,
-                comment=serial.comments if hasattr(serial, "comments") else [],
-                countries=serial.countries,
-                actors=serial.actors,
-                poster_url=serial.poster_url,
-                preview_url=serial.preview_url,
-                text_url=serial.text_url,
-                video_url=serial.video_url,
-            )
-            for serial in serials
-        ]
+    @field
+    @staticmethod
+    async def get_serial_filter_page(
+        film_genre: Optional[str] = None,
+        country_name: Optional[str] = None,
+        rating: Optional[float] = None,
+        first: int = settings.page_size_max,
+        after: Optional[str] = None,
+    ) -> FilmPageType:
+        serials = await SerialService.get_serial_filter(
+            film_genre=film_genre,
+            country_name=country_name,
+            rating=rating,
+            first=first,
+            after=after,
+        )
+        return convert_film_page_type(serials)
 
 @field
 class GetSerialFilters:
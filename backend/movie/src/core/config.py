@@ -4,6 +4,9 @@ from pydantic import Field
 
 class KafkaConfig(BaseSettings):
     bootstrap_servers: str = Field(..., alias='KAFKA_BOOTSTRAP_SERVERS')
+    comment_topic: str = Field("comment", alias="KAFKA_COMMENT_TOPIC")
+    username_cache_size: int = Field(100000, alias="KAFKA_USERNAME_CACHE_SIZE")
+    username_wait_timeout: float = Field(5, alias="KAFKA_USERNAME_WAIT_TIMEOUT")
 
     model_config = SettingsConfigDict(
         extra='allow',
@@ -16,6 +19,25 @@ class S3Config(BaseSettings):
     AWS_SECRET_ACCESS_KEY: str = Field(..., alias="S3_AWS_SECRET_ACCESS_KEY")
     AWS_ACCESS_KEY_ID: str = Field(..., alias="S3_AWS_ACCESS_KEY_ID")
     endpoint_url: str = Field(..., alias="S3_ENDPOINT_URL")
+    max_pool_connections: int = Field(50, alias="S3_MAX_POOL_CONNECTIONS")
+    connect_timeout: float = Field(5, alias="S3_CONNECT_TIMEOUT")
+    read_timeout: float = Field(30, alias="S3_READ_TIMEOUT")
+    tcp_keepalive: bool = Field(True, alias="S3_TCP_KEEPALIVE")
+    keepalive_timeout: float = Field(60, alias="S3_KEEPALIVE_TIMEOUT")
+    presigned_url_expires: int = Field(36000, alias="S3_PRESIGNED_URL_EXPIRES")
+    avatar_thumbnail_size: int = Field(64, alias="S3_AVATAR_THUMBNAIL_SIZE")
+    key_index_refresh_interval: float = Field(
+        30, alias="S3_KEY_INDEX_REFRESH_INTERVAL"
+    )
+    key_index_full_reload_interval: float = Field(
+        300, alias="S3_KEY_INDEX_FULL_RELOAD_INTERVAL"
+    )
+    fanout_limit: int = Field(16, alias="S3_FANOUT_LIMIT")
+    item_timeout: float = Field(2, alias="S3_ITEM_TIMEOUT")
+    presigned_url_cache_size: int = Field(10000, alias="S3_PRESIGNED_URL_CACHE_SIZE")
+    presigned_url_cache_margin: int = Field(
+        600, alias="S3_PRESIGNED_URL_CACHE_MARGIN"
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="S3_", extra="allow"
@@ -25,6 +47,11 @@ class S3Config(BaseSettings):
 class Settings(BaseSettings):
     database_url: str = Field(..., alias="MOVIE_DATABASE_URL")
     redis_url: str = Field(..., alias="REDIS_URL")
+    response_cache_ttl: int = Field(300, alias="RESPONSE_CACHE_TTL")
+    page_size_default: int = Field(10, alias="PAGE_SIZE_DEFAULT")
+    page_size_max: int = Field(50, alias="PAGE_SIZE_MAX")
+    detail_coalesce_redis: bool = Field(False, alias="DETAIL_COALESCE_REDIS")
+    detail_coalesce_ttl: int = Field(5, alias="DETAIL_COALESCE_TTL")
     kafka: KafkaConfig = Field(default_factory=KafkaConfig)
     s3_conf: S3Config = Field(default_factory=S3Config)
 
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Integer, ForeignKey, Float, Column, Table, DateTime
+from sqlalchemy import String, Integer, ForeignKey, Float, Column, Table, DateTime, Index
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from src.core.database.base import Base
 
@@ -20,6 +20,7 @@ film_genre_association = Table(
         UUID(as_uuid=True),
         ForeignKey("genres.id"),
         primary_key=True,
+        index=True,
     ),
 )
 
@@ -37,12 +38,17 @@ film_country_association = Table(
         UUID(as_uuid=True),
         ForeignKey("countries.id"),
         primary_key=True,
+        index=True,
     ),
 )
 
 
 class FilmTable(Base):
     __tablename__ = "films"
+    __table_args__ = (
+        # Листинги и фильтры: WHERE type = ... ORDER BY rating, id (keyset)
+        Index("ix_films_type_rating", "type", "rating", "id"),
+    )
 
     film_name: Mapped[str] = mapped_column(
         String,
@@ -141,6 +147,7 @@ class CommentFilm(Base):
         UUID(as_uuid=True),
         ForeignKey("films.id"),
         nullable=False,
+        index=True,
     )
     user_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     username: Mapped[str] = mapped_column(String, nullable=False)
@@ -159,11 +166,13 @@ class FilmActor(Base):
         UUID(as_uuid=True),
         ForeignKey("films.id"),
         nullable=False,
+        index=True,
     )
     actor_id = Column(
         UUID(as_uuid=True),
         ForeignKey("actors.id"),
         nullable=False,
+        index=True,
     )
     film: Mapped["FilmTable"] = relationship(
         back_populates="film_actors",
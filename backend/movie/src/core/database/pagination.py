@@ -0,0 +1,42 @@
+import base64
+import json
+from typing import Optional, Tuple
+from uuid import UUID
+from sqlalchemy import Select, tuple_
+from src.core.config import get_settings
+from src.core.database.models import FilmTable
+
+settings = get_settings()
+
+
+def clamp_page_size(first: Optional[int]) -> int:
+    """Ограничивает размер страницы диапазоном [1, page_size_max]."""
+    if first is None:
+        return settings.page_size_default
+    return max(1, min(first, settings.page_size_max))
+
+
+def encode_cursor(film: FilmTable) -> str:
+    """Кодирует позицию фильма в выдаче (rating, id) в непрозрачный курсор."""
+    payload = json.dumps({"rating": film.rating, "id": str(film.id)})
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[float, UUID]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return float(payload["rating"]), UUID(payload["id"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Некорректный курсор: {cursor}") from e
+
+
+def paginate_films(query: Select, first: int, after: Optional[str] = None) -> Select:
+    """
+    Добавляет к запросу фильмов keyset-пагинацию по (rating, id) по убыванию.
+    Выбирается first + 1 строка, чтобы понять, есть ли следующая страница.
+    """
+    query = query.order_by(FilmTable.rating.desc(), FilmTable.id.desc())
+    if after:
+        rating, film_id = decode_cursor(after)
+        query = query.where(tuple_(FilmTable.rating, FilmTable.id) < (rating, film_id))
+    return query.limit(first + 1)
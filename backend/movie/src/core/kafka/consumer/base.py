@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict
+from typing import Optional
 
 class KafkaAbstractConsumer(ABC):
     @abstractmethod
@@ -12,4 +12,4 @@ class KafkaAbstractConsumer(ABC):
     async def stop(self): ...
 
     @abstractmethod
-    async def get_messages(self, timeout_ms: int = 5000) -> list[Any] | List[Dict[str, Any]] | Dict[str, str]: ...
\ No newline at end of file
+    async def get_username(self, user_id: str, timeout: float) -> Optional[str]: ...
@@ -1,66 +1,142 @@
+import asyncio
 import json
+from collections import OrderedDict
+from typing import Dict, Optional
 from aiokafka import AIOKafkaConsumer
-from src.core.config import get_settings
 from loguru import logger
-from typing import Any, Dict, List
+from src.core.config import get_settings
 from src.core.kafka.consumer.base import KafkaAbstractConsumer
 
 settings = get_settings()
 
+
 class KafkaConsumer(KafkaAbstractConsumer):
+    """
+    Долгоживущий потребитель топика comment. Запускается один раз в lifespan
+    и держит в памяти актуальный кэш user_id -> username, поэтому создание
+    комментария не ходит в Kafka.
+
+    Потребитель работает без группы: каждый экземпляр сервиса читает топик
+    целиком с начала и не участвует в ребалансировках.
+    """
+
     def __init__(self, topic: str):
-        self.consumer = AIOKafkaConsumer(
-            topic,
+        self.topic = topic
+        self.consumer: Optional[AIOKafkaConsumer] = None
+        self._task: Optional[asyncio.Task] = None
+        self._usernames: "OrderedDict[str, str]" = OrderedDict()
+        self._waiters: Dict[str, asyncio.Event] = {}
+
+    async def start(self):
+        """
+        Запуск потребителя и фоновой задачи чтения топика. Если Kafka
+        недоступна, ошибка пробрасывается, а фоновая задача продолжает
+        подключаться.
+        """
+        if self._task is not None:
+            return
+        try:
+            await self._connect()
+        finally:
+            self._task = asyncio.create_task(self._run())
+
+    async def _connect(self):
+        consumer = AIOKafkaConsumer(
+            self.topic,
             bootstrap_servers=f"{settings.kafka.bootstrap_servers}",
             security_protocol="PLAINTEXT",
-            group_id="notification",
-            enable_auto_commit=True,
+            group_id=None,
+            enable_auto_commit=False,
             auto_offset_reset="earliest",
         )
-        self._is_started = False
-
-    async def start(self):
-        """Запуск потребителя"""
-        if not self._is_started:
-            await self.consumer.start()
-            self._is_started = True
+        try:
+            await consumer.start()
+        except BaseException:
+            # Клиент мог успеть открыть соединения и фоновые задачи
+            try:
+                await consumer.stop()
+            except Exception as e:
+                logger.error(f"Ошибка остановки потребителя топика {self.topic}: {e}")
+            raise
+        self.consumer = consumer
 
     async def stop(self):
         """Остановка потребителя"""
-        if self._is_started:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.consumer is not None:
             await self.consumer.stop()
-            self._is_started = False
+            self.consumer = None
+
+    async def _run(self):
+        while True:
+            try:
+                if self.consumer is None:
+                    await self._connect()
+                    logger.info(f"Потребитель топика {self.topic} подключился к Kafka")
+                async for msg in self.consumer:
+                    self._handle(msg.value)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Ошибка чтения топика {self.topic}: {e}")
+                await asyncio.sleep(1)
+
+    def _handle(self, value: bytes):
+        decoded_msg = value.decode("utf-8")
+        if not decoded_msg.strip():
+            logger.warning("Пустое сообщение.")
+            return
 
-    async def get_messages(self, timeout_ms: int = 5000) -> list[Any] | List[Dict[str, Any]] | Dict[str, str]:
-        """Получение сообщений с декодированием текста и возвратом в формате JSON"""
-        messages = []
         try:
-            records = await self.consumer.getmany(timeout_ms=timeout_ms, max_records=1)
-            for tp, batch in records.items():
-                for msg in batch:
-                    decoded_msg = msg.value.decode("utf-8")
-                    if not decoded_msg.strip():
-                        logger.warning("Пустое сообщение.")
-                        continue
-
-                    try:
-                        parsed_message = json.loads(decoded_msg)
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Ошибка парсинга JSON: {e} для сообщения: {decoded_msg}")
-                        continue
-
-                    # Извлекаем данные из ключа "data"
-                    if not all([parsed_message.get("username")]):
-                        logger.error(f"Некорректные данные для шаблона: {parsed_message}")
-                        return {
-                            "message": "Ошибка: некорректные данные для рендеринга шаблона"
-                        }
-
-                    messages.append({
-                        "username": parsed_message.get("username"),
-                    })
-
-            return messages
-        except Exception as e:
-            logger.error(f"Ошибка получения сообщений: {e}")
-            return []
\ No newline at end of file
+            parsed_message = json.loads(decoded_msg)
+        except json.JSONDecodeError as e:
+            logger.error(f"Ошибка парсинга JSON: {e} для сообщения: {decoded_msg}")
+            return
+
+        user_id = parsed_message.get("user_id")
+        username = parsed_message.get("username")
+        if not user_id or not username:
+            logger.warning(f"Сообщение без user_id или username: {parsed_message}")
+            return
+
+        self.put(str(user_id), username)
+
+    def put(self, user_id: str, username: str):
+        self._usernames[user_id] = username
+        self._usernames.move_to_end(user_id)
+        while len(self._usernames) > settings.kafka.username_cache_size:
+            self._usernames.popitem(last=False)
+
+        waiter = self._waiters.pop(user_id, None)
+        if waiter is not None:
+            waiter.set()
+
+    async def get_username(
+        self, user_id: str, timeout: float = settings.kafka.username_wait_timeout
+    ) -> Optional[str]:
+        """
+        Возвращает имя пользователя из кэша. Если сообщение о пользователе
+        еще не прочитано, ждет его не дольше timeout секунд.
+        """
+        username = self._usernames.get(user_id)
+        if username is not None:
+            self._usernames.move_to_end(user_id)
+            return username
+
+        waiter = self._waiters.setdefault(user_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(waiter.wait(), timeout)
+        except asyncio.TimeoutError:
+            if not waiter.is_set():
+                self._waiters.pop(user_id, None)
+            return None
+        return self._usernames.get(user_id)
+
+
+comment_consumer = KafkaConsumer(topic=settings.kafka.comment_topic)
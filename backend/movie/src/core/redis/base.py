@@ -87,6 +87,13 @@ class RedisService:
             logger.error(f"Failed to delete key {key}: {str(e)}")
             raise
 
+    async def lock(self, name: str, timeout: float = 30, blocking_timeout: float = 10):
+        """Возвращает распределенную блокировку Redis."""
+        await self._ensure_connection()
+        return self.redis.lock(
+            name, timeout=timeout, blocking_timeout=blocking_timeout
+        )
+
     async def __aenter__(self):
         await self._ensure_connection()
         return self
@@ -0,0 +1,103 @@
+import asyncio
+import weakref
+from typing import Any, Awaitable, Callable, Optional
+from loguru import logger
+from redis.exceptions import RedisError
+from src.core.config import get_settings
+from src.core.redis.base import RedisService
+
+settings = get_settings()
+
+
+class ResponseCache:
+    """
+    Read-through кэш готовых ответов в Redis. Промах по ключу перестраивает
+    значение только один раз: внутри процесса запросы ждут общий asyncio.Lock,
+    между репликами - блокировку Redis.
+    """
+
+    KEY_PREFIX = "response:"
+
+    def __init__(self, redis_service: Optional[RedisService] = None):
+        self._redis = redis_service or RedisService()
+        # Блокировка живет, пока ее держит или ждет хотя бы один запрос:
+        # ключи деталей приходят от клиента, и словарь не должен расти
+        # на каждое несуществующее название
+        self._locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = (
+            weakref.WeakValueDictionary()
+        )
+
+    async def _get(self, key: str) -> Optional[Any]:
+        try:
+            return await self._redis.get(f"{self.KEY_PREFIX}{key}")
+        except Exception as e:
+            logger.warning(f"Кэш ответов недоступен, ключ {key}: {e}")
+            return None
+
+    async def _set(self, key: str, value: Any, ttl: int):
+        try:
+            await self._redis.set(f"{self.KEY_PREFIX}{key}", value, ex=ttl)
+        except Exception as e:
+            logger.warning(f"Не удалось сохранить ответ в кэш, ключ {key}: {e}")
+
+    async def _build_locked(
+        self, key: str, build: Callable[[], Awaitable[Any]], ttl: int
+    ) -> Any:
+        lock = None
+        acquired = False
+        try:
+            lock = await self._redis.lock(f"{self.KEY_PREFIX}lock:{key}")
+            acquired = await lock.acquire()
+        except RedisError as e:
+            logger.warning(f"Блокировка кэша недоступна, ключ {key}: {e}")
+
+        try:
+            if acquired:
+                # Пока ждали блокировку, значение могла построить другая реплика
+                cached = await self._get(key)
+                if cached is not None:
+                    return cached
+            value = await build()
+            await self._set(key, value, ttl)
+            return value
+        finally:
+            if acquired:
+                try:
+                    await lock.release()
+                except RedisError as e:
+                    logger.warning(f"Не удалось снять блокировку кэша {key}: {e}")
+
+    async def get_or_build(
+        self,
+        key: str,
+        build: Callable[[], Awaitable[Any]],
+        ttl: int = settings.response_cache_ttl,
+    ) -> Any:
+        """Возвращает значение из кэша либо строит его под блокировкой."""
+        cached = await self._get(key)
+        if cached is not None:
+            return cached
+
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[key] = lock
+        async with lock:
+            cached = await self._get(key)
+            if cached is not None:
+                return cached
+            return await self._build_locked(key, build, ttl)
+
+    async def invalidate(self, *keys: str):
+        """Удаляет значения из кэша после изменения данных."""
+        for key in keys:
+            try:
+                await self._redis.delete(f"{self.KEY_PREFIX}{key}")
+            except Exception as e:
+                logger.error(f"Не удалось сбросить кэш ответа {key}: {e}")
+
+    async def close(self):
+        await self._redis.close()
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,97 @@
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+from loguru import logger
+from src.core.config import get_settings
+from src.core.redis.base import RedisService
+
+settings = get_settings()
+
+
+class PresignedUrlCache:
+    """
+    Кэш подписанных ссылок по ключу объекта S3: локальный LRU перед Redis.
+    Запись живет на settings.s3_conf.presigned_url_cache_margin секунд меньше,
+    чем сама ссылка, чтобы клиент не получил почти истекший URL.
+    """
+
+    KEY_PREFIX = "s3:presigned:"
+
+    def __init__(self, redis_service: Optional[RedisService] = None):
+        self._redis = redis_service or RedisService()
+        self._local: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._maxsize = settings.s3_conf.presigned_url_cache_size
+        self._ttl = (
+            settings.s3_conf.presigned_url_expires
+            - settings.s3_conf.presigned_url_cache_margin
+        )
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    def _get_local(self, key: str) -> Optional[str]:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        url, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._local[key]
+            return None
+        self._local.move_to_end(key)
+        return url
+
+    def _set_local(self, key: str, url: str, ttl: float):
+        self._local[key] = (url, time.monotonic() + ttl)
+        self._local.move_to_end(key)
+        while len(self._local) > self._maxsize:
+            self._local.popitem(last=False)
+
+    async def get_or_sign(self, key: str, sign: Callable[[], Awaitable[str]]) -> str:
+        """Возвращает ссылку из кэша либо подписывает новую и кэширует ее."""
+        if self._ttl <= 0:
+            return await sign()
+
+        url = self._get_local(key)
+        if url is not None:
+            self.local_hits += 1
+            return url
+
+        try:
+            cached = await self._redis.get(f"{self.KEY_PREFIX}{key}")
+        except Exception as e:
+            logger.warning(f"Кэш ссылок S3 в Redis недоступен: {e}")
+            cached = None
+
+        if cached and cached.get("url") and cached.get("expires_at", 0) > time.time():
+            self.redis_hits += 1
+            self._set_local(key, cached["url"], cached["expires_at"] - time.time())
+            return cached["url"]
+
+        self.misses += 1
+        url = await sign()
+        self._set_local(key, url, self._ttl)
+        try:
+            await self._redis.set(
+                f"{self.KEY_PREFIX}{key}",
+                {"url": url, "expires_at": time.time() + self._ttl},
+                ex=self._ttl,
+            )
+        except Exception as e:
+            logger.warning(f"Не удалось сохранить ссылку S3 в Redis: {e}")
+        return url
+
+    def stats(self) -> dict:
+        total = self.local_hits + self.redis_hits + self.misses
+        return {
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": (self.local_hits + self.redis_hits) / total if total else 0.0,
+        }
+
+    async def close(self):
+        logger.info(f"Статистика кэша ссылок S3: {self.stats()}")
+        await self._redis.close()
+
+
+presigned_url_cache = PresignedUrlCache()
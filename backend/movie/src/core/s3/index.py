@@ -0,0 +1,141 @@
+import asyncio
+import time
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional
+from loguru import logger
+from src.core.config import get_settings
+from src.core.s3.base import S3ClientPool, s3_client_pool
+
+settings = get_settings()
+
+# Префиксы бакета, в которых лежат объекты, отдаваемые сервисом
+INDEXED_PREFIXES = ("films/", "serials/", "poster/", "userimage/")
+
+
+class S3KeyIndex:
+    """
+    Индекс существующих ключей бакета. Позволяет проверять наличие объекта
+    без запроса list_objects_v2 на каждый вызов.
+
+    Фоновая задача один раз перечитывает все индексируемые префиксы, а затем
+    периодически дочитывает только ключи после последнего известного
+    (StartAfter). Ключи, появившиеся в середине диапазона, подхватываются
+    полной перезагрузкой раз в key_index_full_reload_interval секунд.
+    """
+
+    def __init__(self, client_pool: S3ClientPool = s3_client_pool):
+        self._client_pool = client_pool
+        self._keys: set[str] = set()
+        self._sorted_keys: List[str] = []
+        self._last_keys: Dict[str, str] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._loaded_at = 0.0
+        self.is_loaded = False
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def find_prefix(self, prefix: str) -> Optional[str]:
+        """Возвращает первый ключ, начинающийся с prefix, либо None."""
+        position = bisect_left(self._sorted_keys, prefix)
+        if position < len(self._sorted_keys) and self._sorted_keys[
+            position
+        ].startswith(prefix):
+            return self._sorted_keys[position]
+        return None
+
+    def add(self, key: str):
+        if key not in self._keys:
+            self._keys.add(key)
+            insort(self._sorted_keys, key)
+
+    def replace(self, keys: Iterable[str]):
+        self._keys = set(keys)
+        self._sorted_keys = sorted(self._keys)
+
+    async def _list_prefix(
+        self, client, prefix: str, start_after: Optional[str] = None
+    ) -> List[str]:
+        """Постранично читает ключи префикса, продолжая через ContinuationToken."""
+        params = {"Bucket": settings.s3_conf.bucket_name, "Prefix": prefix}
+        if start_after:
+            params["StartAfter"] = start_after
+
+        keys = []
+        paginator = client.get_paginator("list_objects_v2")
+        async for page in paginator.paginate(**params):
+            keys.extend(obj["Key"] for obj in page.get("Contents", []))
+        return keys
+
+    async def load(self):
+        """Полностью перечитывает ключи всех индексируемых префиксов бакета."""
+        keys = []
+        last_keys = {}
+        async with self._client_pool.client() as client:
+            for prefix in INDEXED_PREFIXES:
+                prefix_keys = await self._list_prefix(client, prefix)
+                if prefix_keys:
+                    last_keys[prefix] = prefix_keys[-1]
+                keys.extend(prefix_keys)
+
+        self.replace(keys)
+        self._last_keys = last_keys
+        self._loaded_at = time.monotonic()
+        self.is_loaded = True
+        logger.info(f"Индекс ключей S3 загружен: {len(self._keys)} объектов")
+
+    async def refresh(self):
+        """Дочитывает ключи, появившиеся после последнего известного ключа."""
+        added = 0
+        async with self._client_pool.client() as client:
+            for prefix in INDEXED_PREFIXES:
+                new_keys = await self._list_prefix(
+                    client, prefix, start_after=self._last_keys.get(prefix)
+                )
+                for key in new_keys:
+                    self.add(key)
+                if new_keys:
+                    self._last_keys[prefix] = new_keys[-1]
+                added += len(new_keys)
+
+        if added:
+            logger.info(f"Индекс ключей S3 дополнен: {added} новых объектов")
+
+    async def _run(self):
+        while True:
+            try:
+                if (
+                    not self.is_loaded
+                    or time.monotonic() - self._loaded_at
+                    >= settings.s3_conf.key_index_full_reload_interval
+                ):
+                    await self.load()
+                else:
+                    await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Ошибка обновления индекса ключей S3: {e}")
+
+            await asyncio.sleep(settings.s3_conf.key_index_refresh_interval)
+
+    async def start(self):
+        """Запускает фоновое обновление индекса."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Останавливает фоновое обновление индекса."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+s3_key_index = S3KeyIndex()
@@ -85,6 +85,7 @@ class CommentModel(BaseModel):
 
 
 class FilmModel(BaseModel):
+    id: Optional[UUID] = None
     film_name: str
     type: str
     description: str
@@ -96,9 +97,10 @@ class FilmModel(BaseModel):
     preview_url: Optional[str] = None
     text_url: Optional[str] = None
     video_url: Optional[str] = None
-    comments: Optional[List[CommentModel]] = []
+    # None — связи не загружались (листинги), их догружают DataLoader-ы
+    comments: Optional[List[CommentModel]] = None
     countries: List[CountryModel]
-    actors: List[ActorModel]
+    actors: Optional[List[ActorModel]] = None
     genres: List[GenreModel]
 
     class Config:
@@ -120,3 +122,26 @@ class FilmModel(BaseModel):
         if rating is not None and (rating < 0 or rating > 10):
             raise ValueError("Рейтинг может быть только в диапазоне от 0 до 10!")
         return values
+
+
+class FilmPage(BaseModel):
+    items: List[FilmModel]
+    end_cursor: Optional[str] = None
+    has_next_page: bool = False
+
+
+class FilmCardModel(BaseModel):
+    film_name: str
+    type: str
+    year_prod: int
+    rating: float
+    genres: List[str] = []
+    poster_url: Optional[str] = None
+    preview_url: Optional[str] = None
+    text_url: Optional[str] = None
+
+
+class FilmCardPage(BaseModel):
+    items: List[FilmCardModel]
+    end_cursor: Optional[str] = None
+    has_next_page: bool = False
@@ -1,7 +1,9 @@
+import asyncio
 from typing import Optional
 from src.core.database.base import async_session
 from src.core.database.models import ActorTable, FilmActor, FilmTable
 from src.repositories.s3.s3 import S3Repository
+from src.utils.gather import gather_limited
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from src.core.schemas import ActorModel, FilmModel, CountryModel, GenreModel, FilmActorModel
@@ -34,37 +36,43 @@ class ActorRepository(AbstractActorRepository):
                     )
                     return None
 
-                for film_actor in actor.actor_films:
-                    try:
-                        if film_actor.film.type == "movie":
-                            film_poster = await s3_repository.get_poster_film(film_actor.film.film_name)
-                            poster_url = film_poster[0]["poster_url"] if film_poster and isinstance(film_poster, list) else None
-                        elif film_actor.film.type == "serial":
-                            film_poster = await s3_repository.get_poster_film(film_actor.film.film_name)
-                            poster_url = film_poster[0]["poster_url"] if film_poster and isinstance(film_poster, list) else None
-                        else:
-                            poster_url = None
-                    except Exception as e:
-                        logger.error(f"Ошибка загрузки постера: {str(e)}")
-                        poster_url = None
+                # Параллельно получаем постеры фильмов и постер актера из S3
+                film_posters, actor_posters = await asyncio.gather(
+                    gather_limited(
+                        s3_repository.get_poster_film(film_actor.film.film_name)
+                        for film_actor in actor.actor_films
+                    ),
+                    gather_limited(
+                        [s3_repository.get_poster_actor(actor_name=actor.actor_name)]
+                    ),
+                )
 
                 # Получаем список фильмов и сериалов, в которых снимался актер
-                films = [
-                    FilmActorModel(
-                        film_name=film_actor.film.film_name,
-                        type=film_actor.film.type,
-                        year_prod=film_actor.film.year_prod,
-                        rating=film_actor.film.rating,
-                        poster_url=poster_url
+                films = []
+                for film_actor, film_poster in zip(actor.actor_films, film_posters):
+                    if isinstance(film_poster, Exception):
+                        logger.error(f"Ошибка загрузки постера: {film_poster!r}")
+                        film_poster = None
+
+                    films.append(
+                        FilmActorModel(
+                            film_name=film_actor.film.film_name,
+                            type=film_actor.film.type,
+                            year_prod=film_actor.film.year_prod,
+                            rating=film_actor.film.rating,
+                            poster_url=(
+                                film_poster[0]["poster_url"]
+                                if film_poster and isinstance(film_poster, list)
+                                else None
+                            ),
+                        )
                     )
-                    for film_actor in actor.actor_films
-                ]
 
                 # Получаем постер актера (предположим, что это внешний сервис)
                 try:
-                    actor_poster = await s3_repository.get_poster_actor(
-                        actor_name=actor.actor_name
-                    )
+                    actor_poster = actor_posters[0]
+                    if isinstance(actor_poster, Exception):
+                        raise actor_poster
                     poster_url = (
                         actor_poster[0]["poster_url"]
                         if actor_poster and isinstance(actor_poster, list)
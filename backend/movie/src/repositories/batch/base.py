@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+from uuid import UUID
+from src.core.schemas import ActorModel, CommentModel
+
+
+class AbstractBatchRepository(ABC):
+    @abstractmethod
+    async def get_actors_by_film_ids(
+        self, film_ids: List[UUID]
+    ) -> List[List[ActorModel]]: ...
+
+    @abstractmethod
+    async def get_comments_by_film_ids(
+        self, film_ids: List[UUID]
+    ) -> List[List[CommentModel]]: ...
+
+    @abstractmethod
+    async def get_film_posters(self, film_names: List[str]) -> List[dict]: ...
+
+    @abstractmethod
+    async def get_video_urls(
+        self, keys: List[Tuple[str, str]]
+    ) -> List[Optional[str]]: ...
+
+    @abstractmethod
+    async def get_actor_posters(
+        self, actor_names: List[str]
+    ) -> List[Optional[str]]: ...
+
+    @abstractmethod
+    async def get_user_images(self, user_ids: List[str]) -> List[Optional[str]]: ...
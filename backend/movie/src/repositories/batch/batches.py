@@ -0,0 +1,172 @@
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from loguru import logger
+from src.core.config import get_settings
+from src.core.database.base import async_session
+from src.core.database.models import ActorTable, CommentFilm, FilmActor
+from src.core.schemas import ActorModel, CommentModel
+from src.repositories.batch.base import AbstractBatchRepository
+from src.repositories.s3.s3 import S3Repository
+from src.utils.gather import gather_limited
+
+settings = get_settings()
+s3_repository = S3Repository()
+
+
+class BatchRepository(AbstractBatchRepository):
+    """
+    Пакетные загрузки для DataLoader-ов GraphQL: каждый метод получает список
+    ключей, собранных за один тик резолвинга, и возвращает результаты в том же
+    порядке.
+    """
+
+    async def get_actors_by_film_ids(
+        self, film_ids: List[UUID]
+    ) -> List[List[ActorModel]]:
+        """
+        Получает актеров сразу для всех фильмов одним запросом. Актер,
+        снимавшийся в нескольких фильмах страницы, создается один раз.
+        """
+        query = (
+            select(FilmActor.film_id, ActorTable)
+            .join(ActorTable, ActorTable.id == FilmActor.actor_id)
+            .where(FilmActor.film_id.in_(film_ids))
+        )
+
+        async with async_session() as session:
+            try:
+                result = await session.execute(query)
+                rows = result.all()
+            except SQLAlchemyError as e:
+                logger.error(f"Database error: {str(e)}", exc_info=True)
+                raise HTTPException(status_code=500, detail="Database operation failed")
+
+        actors: Dict[UUID, ActorModel] = {}
+        by_film: Dict[UUID, List[ActorModel]] = defaultdict(list)
+        for film_id, actor in rows:
+            if actor.id not in actors:
+                actors[actor.id] = ActorModel(
+                    actor_name=actor.actor_name,
+                    career=actor.career,
+                    date_of_birth=actor.date_of_birth,
+                    place_of_birth=actor.place_of_birth,
+                    sex=actor.sex,
+                    age=actor.age,
+                    growth=actor.growth,
+                    biography=actor.biography,
+                )
+            by_film[film_id].append(actors[actor.id])
+
+        return [by_film.get(film_id, []) for film_id in film_ids]
+
+    async def get_comments_by_film_ids(
+        self, film_ids: List[UUID]
+    ) -> List[List[CommentModel]]:
+        """
+        Получает комментарии сразу для всех фильмов одним запросом.
+        """
+        query = select(CommentFilm).where(CommentFilm.film_id.in_(film_ids))
+
+        async with async_session() as session:
+            try:
+                result = await session.execute(query)
+                comments = result.scalars().all()
+            except SQLAlchemyError as e:
+                logger.error(f"Database error: {str(e)}", exc_info=True)
+                raise HTTPException(status_code=500, detail="Database operation failed")
+
+        by_film: Dict[UUID, List[CommentModel]] = defaultdict(list)
+        for comment in comments:
+            by_film[comment.film_id].append(
+                CommentModel(
+                    film_id=comment.film_id,
+                    user_id=comment.user_id,
+                    username=comment.username,
+                    rating=comment.rating,
+                    comment=comment.comment,
+                )
+            )
+
+        return [by_film.get(film_id, []) for film_id in film_ids]
+
+    async def get_film_posters(self, film_names: List[str]) -> List[dict]:
+        """
+        Получает постер, превью и текст для каждого фильма из S3.
+        """
+        posters = await gather_limited(
+            s3_repository.get_poster_film(film_name) for film_name in film_names
+        )
+
+        results = []
+        for film_name, poster in zip(film_names, posters):
+            if isinstance(poster, Exception):
+                logger.error(f"Ошибка загрузки постера для {film_name}: {poster!r}")
+                poster = None
+            results.append(poster[0] if poster else {})
+        return results
+
+    async def get_video_urls(
+        self, keys: List[Tuple[str, str]]
+    ) -> List[Optional[str]]:
+        """
+        Получает ссылки на видео по парам (тип, название): фильмы и сериалы
+        лежат в S3 под разными префиксами.
+        """
+        videos = await gather_limited(
+            s3_repository.get_url_serial(film_name)
+            if film_type == "serial"
+            else s3_repository.get_url_movie(film_name)
+            for film_type, film_name in keys
+        )
+
+        results = []
+        for (film_type, film_name), video in zip(keys, videos):
+            if isinstance(video, Exception):
+                logger.error(f"Ошибка загрузки видео для {film_name}: {video!r}")
+                video = None
+            url_key = "serial_url" if film_type == "serial" else "movie_url"
+            results.append(video[0].get(url_key) if video else None)
+        return results
+
+    async def get_actor_posters(
+        self, actor_names: List[str]
+    ) -> List[Optional[str]]:
+        """
+        Получает постеры актеров из S3.
+        """
+        posters = await gather_limited(
+            s3_repository.get_poster_actor(actor_name) for actor_name in actor_names
+        )
+
+        results = []
+        for actor_name, poster in zip(actor_names, posters):
+            if isinstance(poster, Exception):
+                logger.error(f"Ошибка загрузки постера актера {actor_name}: {poster!r}")
+                poster = None
+            results.append(poster[0].get("poster_url") if poster else None)
+        return results
+
+    async def get_user_images(self, user_ids: List[str]) -> List[Optional[str]]:
+        """
+        Получает аватарки пользователей из S3.
+        """
+        images = await gather_limited(
+            s3_repository.get_user_profile_image(
+                user_id=user_id, size=settings.s3_conf.avatar_thumbnail_size
+            )
+            for user_id in user_ids
+        )
+
+        results = []
+        for user_id, image in zip(user_ids, images):
+            if isinstance(image, Exception):
+                logger.error(
+                    f"Ошибка при получении изображения пользователя {user_id}: {image!r}"
+                )
+                image = None
+            results.append(image)
+        return results
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from src.core.schemas import FilmCardPage
+
+
+class AbstractCardRepository(ABC):
+    @abstractmethod
+    async def get_cards(
+        self, film_type: str, first: int = 10, after: Optional[str] = None
+    ) -> FilmCardPage: ...
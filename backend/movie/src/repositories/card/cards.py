@@ -0,0 +1,118 @@
+from typing import Optional
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+from loguru import logger
+from src.core.config import get_settings
+from src.core.database.base import async_session
+from src.core.database.models import FilmTable, GenreTable, film_genre_association
+from src.core.database.pagination import clamp_page_size, encode_cursor, paginate_films
+from src.core.redis.cache import response_cache
+from src.core.schemas import FilmCardModel, FilmCardPage
+from src.repositories.card.base import AbstractCardRepository
+from src.repositories.s3.s3 import S3Repository
+from src.utils.gather import gather_limited
+
+settings = get_settings()
+s3_repository = S3Repository()
+
+CARDS_CACHE_KEY = "cards:{}:list"
+
+
+class CardRepository(AbstractCardRepository):
+    async def get_cards(
+        self,
+        film_type: str,
+        first: int = settings.page_size_default,
+        after: Optional[str] = None,
+    ) -> FilmCardPage:
+        """
+        Получает страницу карточек фильмов или сериалов. Первая страница
+        главной отдается из кэша ответов и собирается из БД только при
+        промахе.
+        """
+        first = clamp_page_size(first)
+        if after is not None or first != settings.page_size_default:
+            return await self._load_cards(film_type, first=first, after=after)
+
+        page = await response_cache.get_or_build(
+            CARDS_CACHE_KEY.format(film_type),
+            lambda: self._build_cards_cache(film_type),
+        )
+        return FilmCardPage(**page)
+
+    async def _build_cards_cache(self, film_type: str) -> dict:
+        page = await self._load_cards(film_type, first=settings.page_size_default)
+        return page.model_dump(mode="json")
+
+    async def _load_cards(
+        self, film_type: str, first: int, after: Optional[str] = None
+    ) -> FilmCardPage:
+        """
+        Загружает страницу карточек одним запросом: только название, рейтинг,
+        год, жанры (array_agg) и постеры, без актеров и комментариев.
+        """
+        query = paginate_films(
+            select(
+                FilmTable.id,
+                FilmTable.film_name,
+                FilmTable.type,
+                FilmTable.year_prod,
+                FilmTable.rating,
+                func.array_remove(
+                    func.array_agg(GenreTable.genre_name), None
+                ).label("genres"),
+            )
+            .outerjoin(
+                film_genre_association,
+                film_genre_association.c.film_id == FilmTable.id,
+            )
+            .outerjoin(GenreTable, GenreTable.id == film_genre_association.c.genre_id)
+            .where(FilmTable.type == film_type)
+            .group_by(FilmTable.id),
+            first=first,
+            after=after,
+        )
+
+        async with async_session() as session:
+            try:
+                result = await session.execute(query)
+                rows = result.all()
+            except SQLAlchemyError as e:
+                logger.error(f"Database error: {str(e)}", exc_info=True)
+                raise HTTPException(status_code=500, detail="Database operation failed")
+
+        has_next_page = len(rows) > first
+        rows = rows[:first]
+
+        posters = await gather_limited(
+            s3_repository.get_poster_film(row.film_name) for row in rows
+        )
+
+        cards = []
+        for row, poster in zip(rows, posters):
+            if isinstance(poster, Exception) or not poster:
+                if isinstance(poster, Exception):
+                    logger.error(
+                        f"Ошибка загрузки постера для {row.film_name}: {poster!r}"
+                    )
+                poster = [{}]
+
+            cards.append(
+                FilmCardModel(
+                    film_name=row.film_name,
+                    type=row.type,
+                    year_prod=row.year_prod,
+                    rating=row.rating,
+                    genres=row.genres or [],
+                    poster_url=poster[0].get("poster_url"),
+                    preview_url=poster[0].get("preview_url"),
+                    text_url=poster[0].get("text_url"),
+                )
+            )
+
+        return FilmCardPage(
+            items=cards,
+            end_cursor=encode_cursor(rows[-1]) if rows else None,
+            has_next_page=has_next_page,
+        )
@@ -1,6 +1,6 @@
 from abc import abstractmethod, ABC
 from typing import List, Optional
-from src.core.schemas import FilmModel, CreateCommentModel
+from src.core.schemas import FilmModel, FilmPage, CreateCommentModel
 from src.core.database.models import FilmTable
 
 
@@ -17,15 +17,22 @@ class AbstractFilmRepository(ABC):
     ): ...
 
     @abstractmethod
-    async def get_films(self) -> List[FilmModel]: ...
+    async def get_films(
+        self, first: int = 10, after: Optional[str] = None
+    ) -> FilmPage: ...
 
     @abstractmethod
     async def get_film_name_info(self, film_name: str) -> FilmModel: ...
 
     @abstractmethod
     async def get_film_filter_info(
-        self, genre_name: str = None, country_name: str = None, rating: str = None
-    ) -> Optional[List[FilmModel]]: ...
+        self,
+        genre_name: str = None,
+        country_name: str = None,
+        rating: str = None,
+        first: int = 50,
+        after: Optional[str] = None,
+    ) -> Optional[FilmPage]: ...
 
     @abstractmethod
     async def get_filters(self): ...
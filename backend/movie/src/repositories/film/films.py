@@ -1,27 +1,28 @@
-import asyncio
-from contextlib import asynccontextmanager
 from fastapi import HTTPException
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy.orm import selectinload
-from sqlalchemy import select
+from sqlalchemy.orm import noload, selectinload
+from sqlalchemy import insert, select
 from src.core.database.models import *
-from src.core.kafka.consumer.consumer import KafkaConsumer
+from src.core.kafka.consumer.consumer import comment_consumer
 from src.core.schemas import *
 from src.core.database.base import async_session
-from src.repositories.s3.s3 import S3Repository
+from src.core.database.pagination import (
+    clamp_page_size,
+    encode_cursor,
+    paginate_films,
+)
+from src.core.config import get_settings
+from src.core.redis.cache import response_cache
+from src.repositories.card.cards import CARDS_CACHE_KEY
+from src.utils.single_flight import SingleFlight
 from src.repositories.film.base import AbstractFilmRepository
 from loguru import logger
 
-s3_repository = S3Repository()
+settings = get_settings()
+film_lookups = SingleFlight()
 
-@asynccontextmanager
-async def kafka_consumer():
-    consumer = KafkaConsumer(topic="comment")
-    try:
-        await consumer.start()
-        yield consumer
-    finally:
-        await consumer.stop()
+FILMS_CACHE_KEY = "films:list"
+FILM_DETAIL_CACHE_KEY = "films:detail:{}"
 
 
 class FilmRepository(AbstractFilmRepository):
@@ -157,9 +158,9 @@ class FilmRepository(AbstractFilmRepository):
                 session.add(film)
 
                 await session.commit()
-
-                # film_dict = self._serialize_film(film)
-                # await redis_service.set(key=f"{film.film_name}", value=film_dict)
+                await response_cache.invalidate(
+                    FILMS_CACHE_KEY, CARDS_CACHE_KEY.format("movie")
+                )
 
                 return film
 
@@ -169,67 +170,102 @@ class FilmRepository(AbstractFilmRepository):
                 raise
 
     async def create_comment_to_film(self, create_comment_model: CreateCommentModel):
-        async with async_session() as session, kafka_consumer() as consumer:
-            messages = await consumer.get_messages()
-            message_data = messages[0] if isinstance(messages, list) and messages else {}
-            logger.debug(messages)
-            try:
-                film_result = await session.execute(
-                    select(FilmTable).where(
-                        FilmTable.film_name == create_comment_model.film_name
-                    )
-                )
-                film = film_result.scalars().first()
+        """
+        Добавляет комментарий одним INSERT: имя пользователя берется из кэша
+        потребителя топика comment, id фильма — подзапросом по названию.
+        """
+        username = await comment_consumer.get_username(
+            str(create_comment_model.user_id)
+        )
+        if username is None:
+            raise ValueError(
+                f"Не удалось определить имя пользователя {create_comment_model.user_id}"
+            )
 
-                if not film:
-                    raise ValueError(
-                        f"Фильм с именем '{create_comment_model.film_name}' не найден"
+        async with async_session() as session:
+            try:
+                result = await session.execute(
+                    insert(CommentFilm)
+                    .values(
+                        film_id=select(FilmTable.id)
+                        .where(FilmTable.film_name == create_comment_model.film_name)
+                        .where(FilmTable.type == "movie")
+                        .scalar_subquery(),
+                        user_id=create_comment_model.user_id,
+                        username=username,
+                        rating=create_comment_model.rating,
+                        comment=create_comment_model.comment,
                     )
-
-                username = message_data.get("username") if message_data else None
-
-                new_comment = CommentFilm(
-                    film_id=film.id,
-                    user_id=create_comment_model.user_id,
-                    username=username,
-                    rating=create_comment_model.rating,
-                    comment=create_comment_model.comment,
+                    .returning(CommentFilm.id)
                 )
-
-                session.add(new_comment)
-                await session.flush()
-
-                if not new_comment.id:
-                    raise ValueError("Ошибка при добавлении комментария в базу данных")
-
+                comment_id = result.scalar_one()
                 await session.commit()
-                return new_comment
-
             except IntegrityError as e:
                 await session.rollback()
                 logger.error(f"Ошибка при добавлении комментария: {e}")
-                raise ValueError("Ошибка при добавлении комментария в базу данных")
+                raise ValueError(
+                    f"Фильм с именем '{create_comment_model.film_name}' не найден"
+                    " или комментарий не может быть добавлен"
+                )
             except Exception as e:
                 await session.rollback()
                 logger.error(f"Неизвестная ошибка: {e}")
                 raise e
 
-    async def get_films(self) -> List[FilmModel]:
+        await response_cache.invalidate(
+            FILMS_CACHE_KEY,
+            CARDS_CACHE_KEY.format("movie"),
+            FILM_DETAIL_CACHE_KEY.format(create_comment_model.film_name),
+        )
+        return comment_id
+
+    async def get_films(
+        self, first: int = settings.page_size_default, after: Optional[str] = None
+    ) -> FilmPage:
+        """
+        Возвращает страницу фильмов с keyset-пагинацией. Первая страница
+        главной отдается из кэша ответов и собирается из БД только при
+        промахе.
+        """
+        first = clamp_page_size(first)
+        if after is not None or first != settings.page_size_default:
+            return await self._load_films(first=first, after=after)
+
+        page = await response_cache.get_or_build(
+            FILMS_CACHE_KEY, self._build_films_cache
+        )
+        return FilmPage(**page)
+
+    async def _build_films_cache(self) -> dict:
+        page = await self._load_films(first=settings.page_size_default)
+        return page.model_dump(mode="json")
+
+    async def _load_films(
+        self, first: int, after: Optional[str] = None
+    ) -> FilmPage:
+        """
+        Загружает страницу фильмов без актеров, комментариев и ссылок S3:
+        их догружают DataLoader-ы GraphQL, если клиент запросил эти поля.
+        """
+        query = paginate_films(
+            select(FilmTable)
+            .options(
+                noload(FilmTable.comments),
+                selectinload(FilmTable.countries),
+                selectinload(FilmTable.genres),
+            )
+            .where(FilmTable.type == "movie")
+            .execution_options(populate_existing=True),
+            first=first,
+            after=after,
+        )
+
         async with async_session() as session:
             try:
-                result = await session.execute(
-                    select(FilmTable)
-                    .options(
-                        selectinload(FilmTable.comments),
-                        selectinload(FilmTable.countries),
-                        selectinload(FilmTable.genres),
-                        selectinload(FilmTable.film_actors).joinedload(FilmActor.actor),
-                    )
-                    .where(FilmTable.type == "movie")
-                    .limit(10)
-                    .execution_options(populate_existing=True)
-                )
+                result = await session.execute(query)
                 films = result.unique().scalars().all()
+                has_next_page = len(films) > first
+                films = films[:first]
             except SQLAlchemyError as e:
                 logger.error(f"Database error: {str(e)}", exc_info=True)
                 raise HTTPException(status_code=500, detail="Database operation failed")
@@ -237,297 +273,111 @@ class FilmRepository(AbstractFilmRepository):
                 logger.error(f"Unexpected error: {str(e)}", exc_info=True)
                 raise HTTPException(status_code=500, detail="Internal server error")
 
-            # Параллельная загрузка данных из S3
-            film_posters_tasks = [
-                s3_repository.get_poster_film(film.film_name) for film in films
-            ]
-
-            film_video_url = [
-                s3_repository.get_url_movie(film.film_name) for film in films
-            ]
-
-            actors_posters_cache = {}
-
-            async def get_actor_poster(actor_name: str) -> Optional[str]:
-                try:
-                    if actor_name not in actors_posters_cache:
-                        poster = await s3_repository.get_poster_actor(actor_name)
-                        actors_posters_cache[actor_name] = (
-                            poster[0].get("poster_url") if poster else None
-                        )
-                    return actors_posters_cache[actor_name]
-                except Exception as e:
-                    logger.error(f"Actor poster error: {actor_name} - {str(e)}")
-                    return None
-
-            # Запускаем все задачи параллельно
-            film_posters, _ = await asyncio.gather(
-                asyncio.gather(*film_posters_tasks, return_exceptions=True),
-                asyncio.gather(
-                    *[
-                        get_actor_poster(actor.actor.actor_name)
-                        for film in films
-                        for actor in film.film_actors
-                    ],
-                    return_exceptions=True,
-                ),
+            return FilmPage(
+                items=[self._listing_film_model(film) for film in films],
+                end_cursor=encode_cursor(films[-1]) if films else None,
+                has_next_page=has_next_page,
             )
 
-            film_movie_url = await asyncio.gather(
-                *film_video_url,  # Распаковываем список корутин
-                return_exceptions=True,
-            )
+    def _listing_film_model(self, film: FilmTable) -> FilmModel:
+        """
+        Формирует модель фильма для листинга: только собственные поля, жанры
+        и страны.
+        """
+        return FilmModel(
+            id=film.id,
+            film_name=film.film_name,
+            description=film.description,
+            type=film.type,
+            year_prod=film.year_prod,
+            age_rating=film.age_rating,
+            watch_time=film.watch_time,
+            rating=film.rating,
+            countries=[
+                CountryModel(country_name=country.country_name)
+                for country in film.countries
+            ],
+            genres=[GenreModel(genre_name=genre.genre_name) for genre in film.genres],
+        )
 
-            films_data = []
-            for film, posters_data, film_video_urls in zip(
-                films, film_posters, film_movie_url
-            ):
-                try:
-                    if isinstance(posters_data, Exception):
-                        logger.error(
-                            f"Ошибка загрузки постера для фильма {film.film_name}: {str(posters_data)}"
-                        )
-                        posters_data = None
-
-                    poster_url = None
-                    preview_url = None
-                    text_url = None
-
-                    if (
-                        posters_data
-                        and isinstance(posters_data, list)
-                        and len(posters_data) > 0
-                    ):
-                        poster_data = posters_data[0]
-                        video_urls = film_video_urls[0]
-                        poster_url = poster_data.get("poster_url")
-                        preview_url = poster_data.get("preview_url")
-                        text_url = poster_data.get("text_url")
-                        video_url = video_urls.get("movie_url")
-
-                    # Формируем данные об актерах
-                    actors_data = []
-                    for film_actor in film.film_actors:
-                        actor = film_actor.actor
-                        actors_data.append(
-                            ActorModel(
-                                actor_name=actor.actor_name,
-                                career=actor.career,
-                                date_of_birth=actor.date_of_birth,
-                                place_of_birth=actor.place_of_birth,
-                                sex=actor.sex,
-                                age=actor.age,
-                                growth=actor.growth,
-                                biography=actor.biography,
-                                poster_url=actors_posters_cache.get(actor.actor_name),
-                            )
-                        )
-
-                    # Формируем модель фильма
-                    film_model = FilmModel(
-                        film_name=film.film_name,
-                        description=film.description,
-                        type=film.type,
-                        year_prod=film.year_prod,
-                        age_rating=film.age_rating,
-                        watch_time=film.watch_time,
-                        rating=film.rating,
-                        comments=(
-                            [
-                                CommentModel(
-                                    film_id=comment.film_id,
-                                    user_id=comment.user_id,
-                                    rating=comment.rating,
-                                    comment=comment.comment,
-                                )
-                                for comment in film.comments
-                            ]
-                            if film.comments
-                            else []
-                        ),
-                        countries=(
-                            [
-                                CountryModel(country_name=c.country_name)
-                                for c in film.countries
-                            ]
-                            if film.countries
-                            else []
-                        ),
-                        genres=(
-                            [GenreModel(genre_name=g.genre_name) for g in film.genres]
-                            if film.genres
-                            else []
-                        ),
-                        actors=actors_data,
-                        poster_url=poster_url,
-                        preview_url=preview_url,
-                        text_url=text_url,
-                        video_url=video_url,
-                    )
-                    films_data.append(film_model)
-                except Exception as e:
-                    logger.error(f"Error processing film {film.film_name}: {str(e)}")
-                    continue
+    async def get_film_name_info(self, film_name: str) -> Optional[FilmModel]:
+        """
+        Получает данные о фильме. Одновременные запросы одного названия
+        объединяются в один запрос к БД и S3.
+        """
+        return await film_lookups.do(
+            film_name, lambda: self._get_film_name_info_shared(film_name)
+        )
+
+    async def _get_film_name_info_shared(
+        self, film_name: str
+    ) -> Optional[FilmModel]:
+        if not settings.detail_coalesce_redis:
+            return await self._load_film_name_info(film_name)
+
+        # Между репликами результат делится через Redis с коротким TTL
+        film = await response_cache.get_or_build(
+            FILM_DETAIL_CACHE_KEY.format(film_name),
+            lambda: self._build_film_name_info_cache(film_name),
+            ttl=settings.detail_coalesce_ttl,
+        )
+        return FilmModel(**film) if film else None
 
-            return films_data
+    async def _build_film_name_info_cache(
+        self, film_name: str
+    ) -> Optional[dict]:
+        film = await self._load_film_name_info(film_name)
+        return film.model_dump(mode="json") if film else None
 
-    async def get_film_name_info(self, film_name: str) -> Optional[FilmModel]:
+    async def _load_film_name_info(self, film_name: str) -> Optional[FilmModel]:
         """
-        Получает полностью данные о фильме, включая постеры из S3.
+        Получает фильм по названию: собственные поля, жанры и страны.
+        Актеры, комментарии и ссылки S3 догружают DataLoader-ы GraphQL,
+        только если клиент запросил эти поля.
         """
         async with async_session() as session:
             try:
-                # Запрос для получения фильма по имени с загрузкой связанных данных
                 result = await session.execute(
                     select(FilmTable)
                     .options(
-                        selectinload(FilmTable.comments),
+                        noload(FilmTable.comments),
                         selectinload(FilmTable.countries),
                         selectinload(FilmTable.genres),
-                        selectinload(FilmTable.film_actors).selectinload(FilmActor.actor),
                     )
                     .where(FilmTable.film_name == film_name)
                     .where(FilmTable.type == "movie")
                 )
                 film = result.scalars().first()
-
-                if film is None:
-                    logger.error(f"Фильм '{film_name}' не найден в базе данных!")
-                    return None
-
-                # Получаем данные постера и видео из S3
-                try:
-                    film_poster = await s3_repository.get_poster_film(film.film_name)
-                    film_video_url = await s3_repository.get_url_movie(film_name=film.film_name)
-
-                    poster_url = film_poster[0]["poster_url"] if film_poster else None
-                    preview_url = film_poster[0]["preview_url"] if film_poster else None
-                    text_url = film_poster[0]["text_url"] if film_poster else None
-                    video_url = film_video_url[0]["movie_url"] if film_video_url else None
-                except Exception as e:
-                    logger.error(f"Ошибка загрузки данных из S3: {str(e)}")
-                    poster_url = preview_url = text_url = video_url = None
-
-                # Обработка комментариев
-                processed_comments = []
-                for comment in film.comments:
-                    try:
-                        user_image = await s3_repository.get_user_profile_image(user_id=str(comment.user_id))
-                        comment_model = CommentModel(
-                            film_id=comment.film_id,
-                            username=comment.username,
-                            rating=comment.rating,
-                            comment=comment.comment,
-                            user_image=user_image,
-                        )
-                        processed_comments.append(comment_model)
-                    except Exception as e:
-                        logger.error(f"Ошибка при получении изображения пользователя {comment.user_id}: {e}")
-                        comment_model = CommentModel(
-                            film_id=comment.film_id,
-                            username=comment.username,
-                            rating=comment.rating,
-                            comment=comment.comment,
-                            user_image=None,  # Используем None в случае ошибки
-                        )
-                        processed_comments.append(comment_model)
-
-                # Обработка стран
-                processed_countries = [
-                    CountryModel(country_name=country.country_name)
-                    for country in film.countries
-                ]
-
-                # Обработка жанров
-                processed_genres = [
-                    GenreModel(genre_name=genre.genre_name)
-                    for genre in film.genres
-                ]
-
-                # Обработка актеров
-                processed_actors = []
-                for film_actor in film.film_actors:
-                    actor = film_actor.actor
-                    if not actor:
-                        logger.warning(f"⚠️ Actor missing for FilmActor {film_actor.id}")
-                        continue
-
-                    try:
-                        actor_poster = await s3_repository.get_poster_actor(actor.actor_name)
-                        poster_url_actor = None
-                        if actor_poster:
-                            if isinstance(actor_poster, list) and len(actor_poster) > 0:
-                                first_item = actor_poster[0]
-                                poster_url_actor = (
-                                        first_item.get("url")
-                                        or first_item.get("poster_url")
-                                        or first_item.get("image_url")
-                                )
-                            elif isinstance(actor_poster, dict):
-                                poster_url_actor = (
-                                        actor_poster.get("url")
-                                        or actor_poster.get("poster_url")
-                                        or actor_poster.get("image_url")
-                                )
-
-                        processed_actors.append(
-                            ActorModel(
-                                actor_name=actor.actor_name,
-                                career=actor.career,
-                                date_of_birth=actor.date_of_birth,
-                                place_of_birth=actor.place_of_birth,
-                                sex=actor.sex,
-                                age=actor.age,
-                                growth=actor.growth,
-                                biography=actor.biography,
-                                poster_url=poster_url_actor,
-                            )
-                        )
-                    except Exception as e:
-                        logger.error(f"❌ Ошибка при обработке актера {actor.actor_name}: {str(e)}")
-                        continue
-
-                # Создаем объект FilmModel
-                film_data = FilmModel(
-                    film_name=film.film_name,
-                    description=film.description,
-                    type=film.type,
-                    year_prod=film.year_prod,
-                    age_rating=film.age_rating,
-                    watch_time=film.watch_time,
-                    rating=film.rating,
-                    comments=processed_comments,
-                    countries=processed_countries,
-                    genres=processed_genres,
-                    actors=processed_actors,
-                    poster_url=poster_url,
-                    preview_url=preview_url,
-                    text_url=text_url,
-                    video_url=video_url,
-                )
-
-                return film_data
-
             except Exception as e:
                 logger.error(f"Ошибка при получении данных о фильме {film_name}: {e}")
                 return None
 
+        if film is None:
+            logger.error(f"Фильм '{film_name}' не найден в базе данных!")
+            return None
+
+        return self._listing_film_model(film)
+
     async def get_film_filter_info(
-        self, genre_name: str = None, country_name: str = None, rating: str = None
-    ) -> Optional[List[FilmModel]]:
+        self,
+        genre_name: str = None,
+        country_name: str = None,
+        rating: str = None,
+        first: int = settings.page_size_max,
+        after: Optional[str] = None,
+    ) -> Optional[FilmPage]:
         """
         Получение фильмов по фильтрам
         """
         async with async_session() as session:
             try:
-                # Инициализация запроса с подгрузкой связанных данных
+                # Связи и ссылки S3 догружают DataLoader-ы GraphQL
                 query = (
                     select(FilmTable)
                     .options(
+                        noload(FilmTable.comments),
                         selectinload(FilmTable.genres),
                         selectinload(FilmTable.countries),
-                        selectinload(FilmTable.film_actors).joinedload(FilmActor.actor),
-                        selectinload(FilmTable.comments),
                     )
                     .where(FilmTable.type == "movie")
                 )
@@ -545,145 +395,25 @@ class FilmRepository(AbstractFilmRepository):
                         CountryTable.country_name == country_name
                     )
 
+                first = clamp_page_size(first)
+                query = paginate_films(query, first=first, after=after)
+
                 result = await session.execute(query)
                 films = result.scalars().all()
+                has_next_page = len(films) > first
+                films = films[:first]
 
                 if not films:
                     logger.error("Фильмы по заданным параметрам не найдены!")
-                    return None
+                    return FilmPage(items=[])
 
-                # Загружаем постеры для всех фильмов
-                film_posters = await asyncio.gather(
-                    *[s3_repository.get_poster_film(film.film_name) for film in films],
-                    return_exceptions=True,  # Позволяет продолжить выполнение, даже если один из запросов завершится с ошибкой
+                return FilmPage(
+                    items=[self._listing_film_model(film) for film in films],
+                    end_cursor=encode_cursor(films[-1]),
+                    has_next_page=has_next_page,
                 )
-
-                film_video_url = await asyncio.gather(
-                    *[s3_repository.get_url_movie(film.film_name) for film in films],
-                    return_exceptions=True,
-                )
-
-                film_list = []
-                for film, posters_data, film_video_urls in zip(
-                    films, film_posters, film_video_url
-                ):
-                    try:
-                        if isinstance(posters_data, Exception):
-                            logger.error(
-                                f"Ошибка загрузки постера для фильма {film.film_name}: {str(posters_data)}"
-                            )
-                            posters_data = None
-
-                        poster_url = None
-                        preview_url = None
-                        text_url = None
-
-                        if (
-                            posters_data
-                            and isinstance(posters_data, list)
-                            and len(posters_data) > 0
-                        ):
-                            poster_data = posters_data[
-                                0
-                            ]  # Получаем первый (и единственный) элемент
-                            video_urls = film_video_urls[0]
-                            poster_url = poster_data.get("poster_url")
-                            preview_url = poster_data.get(
-                                "preview_url"
-                            )  # Исправлена опечатка в ключе (preview_url)
-                            text_url = poster_data.get("text_url")
-                            video_url = video_urls.get("movie_url")
-
-                        actor_posters = await asyncio.gather(
-                            *[
-                                s3_repository.get_poster_actor(
-                                    film_actor.actor.actor_name
-                                )
-                                for film_actor in film.film_actors
-                            ],
-                            return_exceptions=True,  # Позволяет продолжить выполнение, даже если один из запросов завершится с ошибкой
-                        )
-
-                        processed_actors = []
-                        for film_actor, actor_posters_data in zip(
-                            film.film_actors, actor_posters
-                        ):
-                            try:
-                                # Проверяем, что actor_posters_data не является исключением
-                                if isinstance(actor_posters_data, Exception):
-                                    logger.error(
-                                        f"Ошибка загрузки постера актера {film_actor.actor.actor_name}: {str(actor_posters_data)}"
-                                    )
-                                    actor_posters_data = None
-
-                                # Если actor_posters_data является списком и содержит данные
-                                actor_poster_url = None
-                                if (
-                                    actor_posters_data
-                                    and isinstance(actor_posters_data, list)
-                                    and len(actor_posters_data) > 0
-                                ):
-                                    actor_poster_url = actor_posters_data[0].get(
-                                        "poster_url"
-                                    )  # Получаем URL первого постера
-
-                                processed_actors.append(
-                                    ActorModel(
-                                        actor_name=film_actor.actor.actor_name,
-                                        career=film_actor.actor.career,
-                                        date_of_birth=film_actor.actor.date_of_birth,
-                                        place_of_birth=film_actor.actor.place_of_birth,
-                                        sex=film_actor.actor.sex,
-                                        age=film_actor.actor.age,
-                                        growth=film_actor.actor.growth,
-                                        biography=film_actor.actor.biography,
-                                        poster_url=actor_poster_url,
-                                    )
-                                )
-                            except Exception as e:
-                                logger.error(
-                                    f"Ошибка обработки данных актера {film_actor.actor.actor_name}: {str(e)}"
-                                )
-
-                        # Создаём объект для фильма с актёрами и постерами
-                        film_data = FilmModel(
-                            film_name=film.film_name,
-                            description=film.description,
-                            type=film.type,
-                            year_prod=film.year_prod,
-                            age_rating=film.age_rating,
-                            watch_time=film.watch_time,
-                            rating=film.rating,
-                            comments=[
-                                CommentModel(
-                                    film_id=comment.film_id,
-                                    user_id=comment.user_id,
-                                    rating=comment.rating,
-                                    comment=comment.comment,
-                                )
-                                for comment in film.comments
-                            ],
-                            countries=[
-                                CountryModel(country_name=country.country_name)
-                                for country in film.countries
-                            ],
-                            genres=[
-                                GenreModel(genre_name=genre.genre_name)
-                                for genre in film.genres
-                            ],
-                            actors=processed_actors,
-                            poster_url=poster_url,
-                            preview_url=preview_url,
-                            text_url=text_url,
-                            video_url=video_url,
-                        )
-                        film_list.append(film_data)
-                    except Exception as e:
-                        logger.error(
-                            f"Ошибка обработки данных фильма {film.film_name}: {str(e)}"
-                        )
-
-                return film_list
+            except ValueError:
+                raise
             except Exception as e:
                 logger.error(f"Ошибка выполнения запроса: {str(e)}")
                 return None
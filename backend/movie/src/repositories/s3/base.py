@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 
 class AbstractS3Repository(ABC):
@@ -18,4 +19,6 @@ class AbstractS3Repository(ABC):
     async def get_poster_serial(self, serial_name: str): ...
 
     @abstractmethod
-    async def get_user_profile_image(self, user_id: str): ...
+    async def get_user_profile_image(
+        self, user_id: str, size: Optional[int] = None
+    ): ...
@@ -1,49 +1,75 @@
+from typing import Optional
 from uuid import UUID
 from fastapi import HTTPException, status
 from loguru import logger
-from aiobotocore.session import get_session
 from src.core.config import get_settings
+from src.core.s3.base import S3ClientPool, s3_client_pool
+from src.core.s3.cache import PresignedUrlCache, presigned_url_cache
+from src.core.s3.index import S3KeyIndex, s3_key_index
 from src.repositories.s3.base import AbstractS3Repository
 
 settings = get_settings()
 
 
 class S3Repository(AbstractS3Repository):
+    def __init__(
+        self,
+        client_pool: S3ClientPool = s3_client_pool,
+        key_index: S3KeyIndex = s3_key_index,
+        url_cache: PresignedUrlCache = presigned_url_cache,
+    ):
+        self._client_pool = client_pool
+        self._key_index = key_index
+        self._url_cache = url_cache
+
+    async def _find_key(self, client, prefix: str) -> Optional[str]:
+        """
+        Возвращает ключ объекта по префиксу из индекса ключей бакета. Запрос
+        list_objects_v2 выполняется, только пока индекс еще не загружен.
+        """
+        if self._key_index.is_loaded:
+            return self._key_index.find_prefix(prefix)
+
+        response = await client.list_objects_v2(
+            Bucket=settings.s3_conf.bucket_name,
+            Prefix=prefix,
+        )
+        if "Contents" not in response or len(response["Contents"]) == 0:
+            return None
+        return response["Contents"][0]["Key"]
+
+    async def _presign(self, client, file_key: str) -> str:
+        """
+        Подписывает ссылку на объект. Подпись считается локально, без сетевых
+        запросов, и кэшируется по ключу объекта.
+        """
+        return await self._url_cache.get_or_sign(
+            file_key,
+            lambda: client.generate_presigned_url(
+                ClientMethod="get_object",
+                Params={
+                    "Bucket": settings.s3_conf.bucket_name,
+                    "Key": file_key,
+                },
+                ExpiresIn=settings.s3_conf.presigned_url_expires,
+            ),
+        )
+
     async def get_url_movie(self, film_name: str):
         """
         Получает URL ссылку на фильм из S3
         """
-        session = get_session()
         results = []
         try:
-            async with session.create_client(
-                "s3",
-                region_name=settings.s3_conf.region_name,
-                endpoint_url=settings.s3_conf.endpoint_url,
-                aws_secret_access_key=settings.s3_conf.AWS_SECRET_ACCESS_KEY,
-                aws_access_key_id=settings.s3_conf.AWS_ACCESS_KEY_ID,
-                verify=False,
-            ) as client:
-                response = await client.list_objects_v2(
-                    Bucket=settings.s3_conf.bucket_name,
-                    Prefix=f"films/{film_name}.mp4",
-                )
+            async with self._client_pool.client() as client:
+                file_key = await self._find_key(client, f"films/{film_name}.mp4")
 
-                if "Contents" not in response or len(response["Contents"]) == 0:
+                if file_key is None:
                     logger.info(f"Видео с названием фильма {film_name} не найдена!")
                     results.append({"film_name": film_name, "url": None})
                     return results
 
-                file_key = response["Contents"][0]["Key"]
-
-                url = await client.generate_presigned_url(
-                    ClientMethod="get_object",
-                    Params={
-                        "Bucket": settings.s3_conf.bucket_name,
-                        "Key": file_key,
-                    },
-                    ExpiresIn=36000,  # Срок действия ссылки (в секундах)
-                )
+                url = await self._presign(client, file_key)
                 results.append({"film_name": film_name, "movie_url": url})
                 return results
 
@@ -57,37 +83,17 @@ class S3Repository(AbstractS3Repository):
         """
         Получает URL ссылку на сериал из S3
         """
-        session = get_session()
         results = []
         try:
-            async with session.create_client(
-                "s3",
-                region_name=settings.s3_conf.region_name,
-                endpoint_url=settings.s3_conf.endpoint_url,
-                aws_secret_access_key=settings.s3_conf.AWS_SECRET_ACCESS_KEY,
-                aws_access_key_id=settings.s3_conf.AWS_ACCESS_KEY_ID,
-                verify=False,
-            ) as client:
-                response = await client.list_objects_v2(
-                    Bucket=settings.s3_conf.bucket_name,
-                    Prefix=f"serials/{serial_name}.mp4",
-                )
+            async with self._client_pool.client() as client:
+                file_key = await self._find_key(client, f"serials/{serial_name}.mp4")
 
-                if "Contents" not in response or len(response["Contents"]) == 0:
+                if file_key is None:
                     logger.info(f"Видео с названием сериала {serial_name} не найдена!")
                     results.append({"serial_name": serial_name, "url": None})
                     return results
 
-                file_key = response["Contents"][0]["Key"]
-
-                url = await client.generate_presigned_url(
-                    ClientMethod="get_object",
-                    Params={
-                        "Bucket": settings.s3_conf.bucket_name,
-                        "Key": file_key,
-                    },
-                    ExpiresIn=36000,  # Срок действия ссылки (в секундах)
-                )
+                url = await self._presign(client, file_key)
                 results.append({"serial_name": serial_name, "serial_url": url})
                 return results
 
@@ -101,36 +107,18 @@ class S3Repository(AbstractS3Repository):
         """
         Получает URL изображение актера из S3
         """
-        session = get_session()
         results = []
         try:
-            async with session.create_client(
-                "s3",
-                region_name=settings.s3_conf.region_name,
-                endpoint_url=settings.s3_conf.endpoint_url,
-                aws_secret_access_key=settings.s3_conf.AWS_SECRET_ACCESS_KEY,
-                aws_access_key_id=settings.s3_conf.AWS_ACCESS_KEY_ID,
-                verify=False,
-            ) as client:
-                response = await client.list_objects_v2(
-                    Bucket=settings.s3_conf.bucket_name,
-                    Prefix=f"poster/actors/{actor_name}.jpg",
+            async with self._client_pool.client() as client:
+                file_key = await self._find_key(
+                    client, f"poster/actors/{actor_name}.jpg"
                 )
-                if "Contents" not in response or len(response["Contents"]) == 0:
+                if file_key is None:
                     logger.info(f"Постер с именем актера {actor_name} не найдена!")
                     results.append({"actor_name": actor_name, "poster_url": None})
                     return results
 
-                file_key = response["Contents"][0]["Key"]
-
-                url = await client.generate_presigned_url(
-                    ClientMethod="get_object",
-                    Params={
-                        "Bucket": settings.s3_conf.bucket_name,
-                        "Key": file_key,
-                    },
-                    ExpiresIn=36000,  # Срок действия ссылки (в секундах)
-                )
+                url = await self._presign(client, file_key)
                 results.append({"actor_name": actor_name, "poster_url": url})
                 return results
 
@@ -145,16 +133,8 @@ class S3Repository(AbstractS3Repository):
         Получает URL изображения фильма из S3.
         """
         results = []
-        session = get_session()
         try:
-            async with session.create_client(
-                "s3",
-                region_name=settings.s3_conf.region_name,
-                endpoint_url=settings.s3_conf.endpoint_url,
-                aws_secret_access_key=settings.s3_conf.AWS_SECRET_ACCESS_KEY,
-                aws_access_key_id=settings.s3_conf.AWS_ACCESS_KEY_ID,
-                verify=False,
-            ) as client:
+            async with self._client_pool.client() as client:
 
                 # Инициализация переменных
                 poster_url = None
@@ -163,73 +143,37 @@ class S3Repository(AbstractS3Repository):
 
                 # Получение постера
                 try:
-                    poster_response = await client.list_objects_v2(
-                        Bucket=settings.s3_conf.bucket_name,
-                        Prefix=f"poster/films/{film_name}/poster.jpg",
+                    poster_file_key = await self._find_key(
+                        client, f"poster/films/{film_name}/poster.jpg"
                     )
-                    if (
-                        "Contents" not in poster_response
-                        or len(poster_response["Contents"]) == 0
-                    ):
+                    if poster_file_key is None:
                         logger.info(f"Постер для фильма {film_name} не найден!")
                     else:
-                        poster_file_key = poster_response["Contents"][0]["Key"]
-                        poster_url = await client.generate_presigned_url(
-                            ClientMethod="get_object",
-                            Params={
-                                "Bucket": settings.s3_conf.bucket_name,
-                                "Key": poster_file_key,
-                            },
-                            ExpiresIn=36000,  # Срок действия ссылки (в секундах)
-                        )
+                        poster_url = await self._presign(client, poster_file_key)
                 except Exception as e:
                     logger.error(f"Ошибка при получении постера: {str(e)}")
 
                 # Получение превью
                 try:
-                    preview_response = await client.list_objects_v2(
-                        Bucket=settings.s3_conf.bucket_name,
-                        Prefix=f"poster/films/{film_name}/preview.jpg",
+                    preview_file_key = await self._find_key(
+                        client, f"poster/films/{film_name}/preview.jpg"
                     )
-                    if (
-                        "Contents" not in preview_response
-                        or len(preview_response["Contents"]) == 0
-                    ):
+                    if preview_file_key is None:
                         logger.info(f"Превью для фильма {film_name} не найдено!")
                     else:
-                        preview_file_key = preview_response["Contents"][0]["Key"]
-                        preview_url = await client.generate_presigned_url(
-                            ClientMethod="get_object",
-                            Params={
-                                "Bucket": settings.s3_conf.bucket_name,
-                                "Key": preview_file_key,
-                            },
-                            ExpiresIn=36000,  # Срок действия ссылки (в секундах)
-                        )
+                        preview_url = await self._presign(client, preview_file_key)
                 except Exception as e:
                     logger.error(f"Ошибка при получении превью: {str(e)}")
 
                 # Получение текста
                 try:
-                    text_response = await client.list_objects_v2(
-                        Bucket=settings.s3_conf.bucket_name,
-                        Prefix=f"poster/films/{film_name}/text.jpg",
+                    text_file_key = await self._find_key(
+                        client, f"poster/films/{film_name}/text.jpg"
                     )
-                    if (
-                        "Contents" not in text_response
-                        or len(text_response["Contents"]) == 0
-                    ):
+                    if text_file_key is None:
                         logger.info(f"Текст для фильма {film_name} не найдено!")
                     else:
-                        text_file_key = text_response["Contents"][0]["Key"]
-                        text_url = await client.generate_presigned_url(
-                            ClientMethod="get_object",
-                            Params={
-                                "Bucket": settings.s3_conf.bucket_name,
-                                "Key": text_file_key,
-                            },
-                            ExpiresIn=36000,  # Срок действия ссылки (в секундах)
-                        )
+                        text_url = await self._presign(client, text_file_key)
                 except Exception as e:
                     logger.error(f"Ошибка при получении текста: {str(e)}")
 
@@ -254,35 +198,17 @@ class S3Repository(AbstractS3Repository):
         Получает URL изображения сериала из S3.
         """
         results = []
-        session = get_session()
         try:
-            async with session.create_client(
-                "s3",
-                region_name=settings.s3_conf.region_name,
-                endpoint_url=settings.s3_conf.endpoint_url,
-                aws_secret_access_key=settings.s3_conf.AWS_SECRET_ACCESS_KEY,
-                aws_access_key_id=settings.s3_conf.AWS_ACCESS_KEY_ID,
-                verify=False,
-            ) as client:
-                response = await client.list_objects_v2(
-                    Bucket=settings.s3_conf.bucket_name,
-                    Prefix=f"poster/serials/{serial_name}.jpg",
+            async with self._client_pool.client() as client:
+                file_key = await self._find_key(
+                    client, f"poster/serials/{serial_name}.jpg"
                 )
-                if "Contents" not in response or len(response["Contents"]) == 0:
+                if file_key is None:
                     logger.info(f"Постер с названием сериала {serial_name} не найдена!")
                     results.append({"serial_name": serial_name, "url": None})
                     return results
 
-                file_key = response["Contents"][0]["Key"]
-
-                url = await client.generate_presigned_url(
-                    ClientMethod="get_object",
-                    Params={
-                        "Bucket": settings.s3_conf.bucket_name,
-                        "Key": file_key,
-                    },
-                    ExpiresIn=36000,  # Срок действия ссылки (в секундах)
-                )
+                url = await self._presign(client, file_key)
                 results.append({"serial_name": serial_name, "url": url})
                 return results
 
@@ -292,27 +218,24 @@ class S3Repository(AbstractS3Repository):
             )
             return None
 
-    async def get_user_profile_image(self, user_id: str):
+    async def get_user_profile_image(self, user_id: str, size: Optional[int] = None):
         """
-        Получает URL изображения профиля пользователя из S3.
+        Получает URL изображения профиля пользователя из S3. С size отдает
+        квадратную WebP-копию, которую сервис users строит при загрузке
+        (userimage/thumbs/<user_id>/<size>.webp), а если ее нет — оригинал.
         """
         user_ids = UUID(user_id)
-        session = get_session()
         try:
-            async with session.create_client(
-                    "s3",
-                    region_name=settings.s3_conf.region_name,
-                    endpoint_url=settings.s3_conf.endpoint_url,
-                    aws_secret_access_key=settings.s3_conf.AWS_SECRET_ACCESS_KEY,
-                    aws_access_key_id=settings.s3_conf.AWS_ACCESS_KEY_ID,
-                    verify=False,
-            ) as client:
-                # Ищем файл с любым расширением
-                response = await client.list_objects_v2(
-                    Bucket=settings.s3_conf.bucket_name,
-                    Prefix=f"userimage/{user_ids}.",
-                )
-                if "Contents" not in response or len(response["Contents"]) == 0:
+            async with self._client_pool.client() as client:
+                file_key = None
+                if size:
+                    file_key = await self._find_key(
+                        client, f"userimage/thumbs/{user_ids}/{size}.webp"
+                    )
+                if file_key is None:
+                    # Ищем оригинал с любым расширением
+                    file_key = await self._find_key(client, f"userimage/{user_ids}.")
+                if file_key is None:
                     logger.info(
                         f"Аватарка для пользователя с user_id {user_ids} не найдена!"
                     )
@@ -321,19 +244,10 @@ class S3Repository(AbstractS3Repository):
                         detail="Аватарка для пользователя с таким user_id не найдена!",
                     )
 
-                file_key = response["Contents"][0]["Key"]
-
-                url = await client.generate_presigned_url(
-                    ClientMethod="get_object",
-                    Params={
-                        "Bucket": settings.s3_conf.bucket_name,
-                        "Key": file_key,
-                    },
-                    ExpiresIn=36000,  # Срок действия ссылки (в секундах)
-                )
+                url = await self._presign(client, file_key)
                 return url
         except Exception as e:
             logger.error(
                 f"Ошибка при генерации URL для пользователя с user_id {user_id}: {e}"
             )
-            return None
\ No newline at end of file
+            return None
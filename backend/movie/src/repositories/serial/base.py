@@ -1,6 +1,6 @@
 from abc import abstractmethod, ABC
 from typing import List, Optional
-from src.core.schemas import FilmModel, CreateCommentModel
+from src.core.schemas import FilmModel, FilmPage, CreateCommentModel
 
 
 class AbstractSerialRepository(ABC):
@@ -13,15 +13,22 @@ class AbstractSerialRepository(ABC):
     ): ...
 
     @abstractmethod
-    async def get_serials(self) -> List[FilmModel]: ...
+    async def get_serials(
+        self, first: int = 10, after: Optional[str] = None
+    ) -> FilmPage: ...
 
     @abstractmethod
     async def get_serial_name_info(self, serial_name: str) -> FilmModel: ...
 
     @abstractmethod
     async def get_serial_filter_info(
-        self, genre_name: str = None, country_name: str = None, rating: str = None
-    ) -> Optional[List[FilmModel]]: ...
+        self,
+        genre_name: str = None,
+        country_name: str = None,
+        rating: str = None,
+        first: int = 50,
+        after: Optional[str] = None,
+    ) -> Optional[FilmPage]: ...
 
     @abstractmethod
     async def get_filters(self): ...
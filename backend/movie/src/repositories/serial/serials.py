@@ -1,28 +1,29 @@
-from contextlib import asynccontextmanager
-from src.core.kafka.consumer.consumer import KafkaConsumer
+from src.core.kafka.consumer.consumer import comment_consumer
 from src.core.schemas import *
 from src.core.database.models import *
-from src.repositories.s3.s3 import S3Repository
+from src.utils.single_flight import SingleFlight
 from src.repositories.serial.base import AbstractSerialRepository
 from src.core.database.base import async_session
+from src.core.database.pagination import (
+    clamp_page_size,
+    encode_cursor,
+    paginate_films,
+)
+from src.core.config import get_settings
+from src.core.redis.cache import response_cache
+from src.repositories.card.cards import CARDS_CACHE_KEY
 from fastapi import HTTPException
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import insert, select
+from sqlalchemy.orm import noload, selectinload
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from loguru import logger
 from typing import List, Optional
-import asyncio
 
-s3_repository = S3Repository()
+settings = get_settings()
+serial_lookups = SingleFlight()
 
-@asynccontextmanager
-async def kafka_consumer():
-    consumer = KafkaConsumer(topic="comment")
-    try:
-        await consumer.start()
-        yield consumer
-    finally:
-        await consumer.stop()
+SERIALS_CACHE_KEY = "serials:list"
+SERIAL_DETAIL_CACHE_KEY = "serials:detail:{}"
 
 
 class SerialRepository(AbstractSerialRepository):
@@ -124,9 +125,9 @@ class SerialRepository(AbstractSerialRepository):
                 session.add(film)
 
                 await session.commit()
-
-                # film_dict = self._serialize_film(film)
-                # await redis_service.set(key=f"{film.film_name}", value=film_dict)
+                await response_cache.invalidate(
+                    SERIALS_CACHE_KEY, CARDS_CACHE_KEY.format("serial")
+                )
 
                 return film
 
@@ -136,72 +137,102 @@ class SerialRepository(AbstractSerialRepository):
                 raise
 
     async def create_comment_to_serial(self, create_comment_model: CreateCommentModel):
-        async with async_session() as session, kafka_consumer() as consumer:
-            messages = await consumer.get_messages()
-            message_data = messages[0] if isinstance(messages, list) and messages else {}
-            try:
-                serial_result = await session.execute(
-                    select(FilmTable).where(
-                        FilmTable.film_name == create_comment_model.film_name
-                    )
-                )
-                serial = serial_result.scalars().first()
+        """
+        Добавляет комментарий одним INSERT: имя пользователя берется из кэша
+        потребителя топика comment, id фильма — подзапросом по названию.
+        """
+        username = await comment_consumer.get_username(
+            str(create_comment_model.user_id)
+        )
+        if username is None:
+            raise ValueError(
+                f"Не удалось определить имя пользователя {create_comment_model.user_id}"
+            )
 
-                if not serial:
-                    raise ValueError(
-                        f"Сериал с именем '{create_comment_model.film_name}' не найден"
+        async with async_session() as session:
+            try:
+                result = await session.execute(
+                    insert(CommentFilm)
+                    .values(
+                        film_id=select(FilmTable.id)
+                        .where(FilmTable.film_name == create_comment_model.film_name)
+                        .where(FilmTable.type == "serial")
+                        .scalar_subquery(),
+                        user_id=create_comment_model.user_id,
+                        username=username,
+                        rating=create_comment_model.rating,
+                        comment=create_comment_model.comment,
                     )
-
-                username = message_data.get("username") if message_data else None
-
-                new_comment = CommentFilm(
-                    film_id=serial.id,
-                    user_id=create_comment_model.user_id,
-                    username=username,
-                    rating=create_comment_model.rating,
-                    comment=create_comment_model.comment,
+                    .returning(CommentFilm.id)
                 )
-
-                session.add(new_comment)
-                await session.flush()
-
-                if not new_comment.id:
-                    raise ValueError("Ошибка при добавлении комментария в базу данных")
-
+                comment_id = result.scalar_one()
                 await session.commit()
-                return new_comment
-
             except IntegrityError as e:
                 await session.rollback()
                 logger.error(f"Ошибка при добавлении комментария: {e}")
-                raise ValueError("Ошибка при добавлении комментария в базу данных")
+                raise ValueError(
+                    f"Сериал с именем '{create_comment_model.film_name}' не найден"
+                    " или комментарий не может быть добавлен"
+                )
             except Exception as e:
                 await session.rollback()
                 logger.error(f"Неизвестная ошибка: {e}")
                 raise e
 
-    async def get_serials(self) -> List[FilmModel]:
+        await response_cache.invalidate(
+            SERIALS_CACHE_KEY,
+            CARDS_CACHE_KEY.format("serial"),
+            SERIAL_DETAIL_CACHE_KEY.format(create_comment_model.film_name),
+        )
+        return comment_id
+
+    async def get_serials(
+        self, first: int = settings.page_size_default, after: Optional[str] = None
+    ) -> FilmPage:
         """
-        Получает список первых 10 фильмов
+        Возвращает страницу сериалов с keyset-пагинацией. Первая страница
+        главной отдается из кэша ответов и собирается из БД только при
+        промахе.
         """
-        global video_url
+        first = clamp_page_size(first)
+        if after is not None or first != settings.page_size_default:
+            return await self._load_serials(first=first, after=after)
+
+        page = await response_cache.get_or_build(
+            SERIALS_CACHE_KEY, self._build_serials_cache
+        )
+        return FilmPage(**page)
+
+    async def _build_serials_cache(self) -> dict:
+        page = await self._load_serials(first=settings.page_size_default)
+        return page.model_dump(mode="json")
+
+    async def _load_serials(
+        self, first: int, after: Optional[str] = None
+    ) -> FilmPage:
+        """
+        Загружает страницу сериалов без актеров, комментариев и ссылок S3:
+        их догружают DataLoader-ы GraphQL, если клиент запросил эти поля.
+        """
+        query = paginate_films(
+            select(FilmTable)
+            .options(
+                noload(FilmTable.comments),
+                selectinload(FilmTable.countries),
+                selectinload(FilmTable.genres),
+            )
+            .where(FilmTable.type == "serial")
+            .execution_options(populate_existing=True),
+            first=first,
+            after=after,
+        )
+
         async with async_session() as session:
             try:
-                result = await session.execute(
-                    select(FilmTable)
-                    .options(
-                        selectinload(FilmTable.comments),
-                        selectinload(FilmTable.countries),
-                        selectinload(FilmTable.genres),
-                        selectinload(FilmTable.film_actors).selectinload(
-                            FilmActor.actor
-                        ),
-                    )
-                    .where(FilmTable.type == "serial")
-                    .limit(10)
-                    .execution_options(populate_existing=True)
-                )
+                result = await session.execute(query)
                 serials = result.unique().scalars().all()
+                has_next_page = len(serials) > first
+                serials = serials[:first]
             except SQLAlchemyError as e:
                 logger.error(f"Database error: {str(e)}", exc_info=True)
                 raise HTTPException(status_code=500, detail="Database operation failed")
@@ -209,301 +240,113 @@ class SerialRepository(AbstractSerialRepository):
                 logger.error(f"Unexpected error: {str(e)}", exc_info=True)
                 raise HTTPException(status_code=500, detail="Internal server error")
 
-        # Параллельная загрузка данных из S3
-        serial_posters_tasks = [
-            s3_repository.get_poster_film(serial.film_name) for serial in serials
-        ]
-
-        actors_posters_cache = {}
+            return FilmPage(
+                items=[self._listing_serial_model(serial) for serial in serials],
+                end_cursor=encode_cursor(serials[-1]) if serials else None,
+                has_next_page=has_next_page,
+            )
 
-        async def get_actor_poster(actor_name: str) -> Optional[str]:
-            try:
-                if actor_name not in actors_posters_cache:
-                    poster = await s3_repository.get_poster_actor(actor_name)
-                    if isinstance(poster, list) and len(poster) > 0:
-                        poster = poster[0]  # Берем первый элемент списка
-                    actors_posters_cache[actor_name] = (
-                        poster.get("poster_url") if isinstance(poster, dict) else None
-                    )
-                return actors_posters_cache[actor_name]
-            except Exception as e:
-                logger.error(f"Actor poster error: {actor_name} - {str(e)}")
-                return None
-
-        # Запускаем все задачи параллельно
-        serial_posters, _ = await asyncio.gather(
-            asyncio.gather(*serial_posters_tasks),
-            asyncio.gather(
-                *[
-                    get_actor_poster(actor.actor.actor_name)
-                    for serial in serials
-                    for actor in serial.film_actors
-                ]
-            ),
+    def _listing_serial_model(self, serial: FilmTable) -> FilmModel:
+        """
+        Формирует модель сериала для листинга: только собственные поля, жанры
+        и страны.
+        """
+        return FilmModel(
+            id=serial.id,
+            film_name=serial.film_name,
+            description=serial.description,
+            type=serial.type,
+            year_prod=serial.year_prod,
+            age_rating=serial.age_rating,
+            watch_time=serial.watch_time,
+            rating=serial.rating,
+            countries=[
+                CountryModel(country_name=country.country_name)
+                for country in serial.countries
+            ],
+            genres=[
+                GenreModel(genre_name=genre.genre_name) for genre in serial.genres
+            ],
         )
 
-        serial_video_url = [
-            s3_repository.get_url_serial(serial.film_name) for serial in serials
-        ]
-
-        # Загружаем постеры для всех фильмов
-        film_posters = await asyncio.gather(
-            *[s3_repository.get_poster_film(film.film_name) for film in serials],
-            return_exceptions=True,
+    async def get_serial_name_info(self, serial_name: str) -> Optional[FilmModel]:
+        """
+        Получает данные о сериале. Одновременные запросы одного названия
+        объединяются в один запрос к БД и S3.
+        """
+        return await serial_lookups.do(
+            serial_name, lambda: self._get_serial_name_info_shared(serial_name)
         )
 
-        serial_movie_url = await asyncio.gather(
-            *serial_video_url,  # Распаковываем список корутин
-            return_exceptions=True,
+    async def _get_serial_name_info_shared(
+        self, serial_name: str
+    ) -> Optional[FilmModel]:
+        if not settings.detail_coalesce_redis:
+            return await self._load_serial_name_info(serial_name)
+
+        # Между репликами результат делится через Redis с коротким TTL
+        serial = await response_cache.get_or_build(
+            SERIAL_DETAIL_CACHE_KEY.format(serial_name),
+            lambda: self._build_serial_name_info_cache(serial_name),
+            ttl=settings.detail_coalesce_ttl,
         )
+        return FilmModel(**serial) if serial else None
 
-        films_data = []
-        for film, posters_data, serial_video_urls in zip(
-            serials, film_posters, serial_movie_url
-        ):
-            try:
-                if isinstance(posters_data, Exception):
-                    logger.error(
-                        f"Ошибка загрузки постера для сериала {film.film_name}: {str(posters_data)}"
-                    )
-                    posters_data = None
-
-                poster_url = None
-                preview_url = None
-                text_url = None
-
-                if (
-                    posters_data
-                    and isinstance(posters_data, list)
-                    and len(posters_data) > 0
-                ):
-                    for poster_data in posters_data:
-                        video_urls = serial_video_urls[0]
-                        poster_url = poster_data.get("poster_url")
-                        preview_url = poster_data.get("preview_url")
-                        text_url = poster_data.get("text_url")
-                        video_url = video_urls.get("serial_url")
-
-                actors_data = []
-                for film_actor in film.film_actors:
-                    if film_actor.actor:  # Добавляем проверку
-                        actor = film_actor.actor
-                        actors_data.append(
-                            ActorModel(
-                                actor_name=actor.actor_name,
-                                career=actor.career,
-                                date_of_birth=actor.date_of_birth,
-                                place_of_birth=actor.place_of_birth,
-                                sex=actor.sex,
-                                age=actor.age,
-                                growth=actor.growth,
-                                biography=actor.biography,
-                                poster_url=actors_posters_cache.get(actor.actor_name),
-                            )
-                        )
-
-                # Формируем модель фильма
-                film_model = FilmModel(
-                    film_name=film.film_name,
-                    description=film.description,
-                    type=film.type,
-                    year_prod=film.year_prod,
-                    age_rating=film.age_rating,
-                    watch_time=film.watch_time,
-                    rating=film.rating,
-                    comments=[
-                        CommentModel(
-                            film_id=comment.film_id,
-                            user_id=comment.user_id,
-                            rating=comment.rating,
-                            comment=comment.comment,
-                        )
-                        for comment in film.comments
-                    ],
-                    countries=(
-                        [
-                            CountryModel(country_name=c.country_name)
-                            for c in film.countries
-                        ]
-                        if film.countries
-                        else []
-                    ),
-                    genres=(
-                        [GenreModel(genre_name=g.genre_name) for g in film.genres]
-                        if film.genres
-                        else []
-                    ),
-                    actors=actors_data,
-                    poster_url=poster_url,
-                    preview_url=preview_url,
-                    text_url=text_url,
-                    video_url=video_url,
-                )
-                films_data.append(film_model)
+    async def _build_serial_name_info_cache(
+        self, serial_name: str
+    ) -> Optional[dict]:
+        serial = await self._load_serial_name_info(serial_name)
+        return serial.model_dump(mode="json") if serial else None
 
-            except Exception as e:
-                logger.error(f"Error processing serial {film.film_name}: {str(e)}")
-                continue
-
-        return films_data
-
-    async def get_serial_name_info(self, serial_name: str) -> Optional[FilmModel]:
+    async def _load_serial_name_info(self, serial_name: str) -> Optional[FilmModel]:
         """
-        Получает полностью данные о фильме, включая постеры из S3.
+        Получает сериал по названию: собственные поля, жанры и страны.
+        Актеры, комментарии и ссылки S3 догружают DataLoader-ы GraphQL,
+        только если клиент запросил эти поля.
         """
         async with async_session() as session:
             try:
-                # Запрос для получения фильма по имени с загрузкой связанных данных
                 result = await session.execute(
                     select(FilmTable)
                     .options(
-                        selectinload(FilmTable.comments),
+                        noload(FilmTable.comments),
                         selectinload(FilmTable.countries),
                         selectinload(FilmTable.genres),
-                        selectinload(FilmTable.film_actors).selectinload(FilmActor.actor),
                     )
                     .where(FilmTable.film_name == serial_name)
                     .where(FilmTable.type == "serial")
                 )
                 serial = result.scalars().first()
-
-                if serial is None:
-                    logger.error(f"Сериал '{serial_name}' не найден в базе данных!")
-                    return None
-
-                # Получаем данные постера и видео из S3
-                try:
-                    serial_poster = await s3_repository.get_poster_film(serial.film_name)
-                    serial_video_url = await s3_repository.get_url_serial(serial_name=serial.film_name)
-
-                    poster_url = serial_poster[0]["poster_url"] if serial_poster else None
-                    preview_url = serial_poster[0]["preview_url"] if serial_poster else None
-                    text_url = serial_poster[0]["text_url"] if serial_poster else None
-                    video_url = serial_video_url[0]["serial_url"] if serial_video_url else None
-                except Exception as e:
-                    logger.error(f"Ошибка загрузки данных из S3: {str(e)}")
-                    preview_url = text_url = video_url = None
-
-                # Обработка комментариев
-                processed_comments = []
-                for comment in serial.comments:
-                    try:
-                        user_image = await s3_repository.get_user_profile_image(user_id=str(comment.user_id))
-                        comment_model = CommentModel(
-                            film_id=comment.film_id,
-                            username=comment.username,
-                            rating=comment.rating,
-                            comment=comment.comment,
-                            user_image=user_image,
-                        )
-                        processed_comments.append(comment_model)
-                    except Exception as e:
-                        logger.error(f"Ошибка при получении изображения пользователя {comment.user_id}: {e}")
-                        comment_model = CommentModel(
-                            film_id=comment.film_id,
-                            username=comment.username,
-                            rating=comment.rating,
-                            comment=comment.comment,
-                            user_image=None,  # Используем None в случае ошибки
-                        )
-                        processed_comments.append(comment_model)
-
-                # Обработка стран
-                processed_countries = [
-                    CountryModel(country_name=country.country_name)
-                    for country in serial.countries
-                ]
-
-                # Обработка жанров
-                processed_genres = [
-                    GenreModel(genre_name=genre.genre_name)
-                    for genre in serial.genres
-                ]
-
-                # Обработка актеров
-                processed_actors = []
-                for film_actor in serial.film_actors:
-                    actor = film_actor.actor
-                    if not actor:
-                        logger.warning(f"⚠️ Actor missing for FilmActor {film_actor.id}")
-                        continue
-
-                    try:
-                        actor_poster = await s3_repository.get_poster_actor(actor.actor_name)
-                        poster_url_actor = None
-                        if actor_poster:
-                            if isinstance(actor_poster, list) and len(actor_poster) > 0:
-                                first_item = actor_poster[0]
-                                poster_url_actor = (
-                                        first_item.get("url")
-                                        or first_item.get("poster_url")
-                                        or first_item.get("image_url")
-                                )
-                            elif isinstance(actor_poster, dict):
-                                poster_url_actor = (
-                                        actor_poster.get("url")
-                                        or actor_poster.get("poster_url")
-                                        or actor_poster.get("image_url")
-                                )
-
-                        processed_actors.append(
-                            ActorModel(
-                                actor_name=actor.actor_name,
-                                career=actor.career,
-                                date_of_birth=actor.date_of_birth,
-                                place_of_birth=actor.place_of_birth,
-                                sex=actor.sex,
-                                age=actor.age,
-                                growth=actor.growth,
-                                biography=actor.biography,
-                                poster_url=poster_url_actor,
-                            )
-                        )
-                    except Exception as e:
-                        logger.error(f"❌ Ошибка при обработке актера {actor.actor_name}: {str(e)}")
-                        continue
-
-                # Создаем объект FilmModel
-                film_data = FilmModel(
-                    film_name=serial.film_name,
-                    description=serial.description,
-                    type=serial.type,
-                    year_prod=serial.year_prod,
-                    age_rating=serial.age_rating,
-                    watch_time=serial.watch_time,
-                    rating=serial.rating,
-                    comments=processed_comments,
-                    countries=processed_countries,
-                    genres=processed_genres,
-                    actors=processed_actors,
-                    poster_url=poster_url,
-                    preview_url=preview_url,
-                    text_url=text_url,
-                    video_url=video_url,
-                )
-
-                return film_data
-
             except Exception as e:
                 logger.error(f"Ошибка при получении данных о сериале {serial_name}: {e}")
                 return None
 
+        if serial is None:
+            logger.error(f"Сериал '{serial_name}' не найден в базе данных!")
+            return None
+
+        return self._listing_serial_model(serial)
+
     async def get_serial_filter_info(
-        self, genre_name: str = None, country_name: str = None, rating: str = None
-    ) -> Optional[List[FilmModel]]:
+        self,
+        genre_name: str = None,
+        country_name: str = None,
+        rating: str = None,
+        first: int = settings.page_size_max,
+        after: Optional[str] = None,
+    ) -> Optional[FilmPage]:
         """
         Получение фильмов по фильтрам
         """
         async with async_session() as session:
             try:
-                # Инициализация запроса с подгрузкой связанных данных
+                # Связи и ссылки S3 догружают DataLoader-ы GraphQL
                 query = (
                     select(FilmTable)
                     .options(
+                        noload(FilmTable.comments),
                         selectinload(FilmTable.genres),
                         selectinload(FilmTable.countries),
-                        selectinload(FilmTable.film_actors).joinedload(FilmActor.actor),
-                        selectinload(FilmTable.comments),
                     )
                     .where(FilmTable.type == "serial")
                 )
@@ -521,151 +364,25 @@ class SerialRepository(AbstractSerialRepository):
                         CountryTable.country_name == country_name
                     )
 
+                first = clamp_page_size(first)
+                query = paginate_films(query, first=first, after=after)
+
                 result = await session.execute(query)
                 serials = result.scalars().all()
+                has_next_page = len(serials) > first
+                serials = serials[:first]
 
                 if not serials:
                     logger.error("Сериалы по заданным параметрам не найдены!")
-                    return None
-
-                # Загружаем постеры для всех фильмов
-                serial_posters = await asyncio.gather(
-                    *[
-                        s3_repository.get_poster_film(serial.film_name)
-                        for serial in serials
-                    ],
-                    return_exceptions=True,  # Позволяет продолжить выполнение, даже если один из запросов завершится с ошибкой
-                )
+                    return FilmPage(items=[])
 
-                serial_video_url = await asyncio.gather(
-                    *[
-                        s3_repository.get_url_serial(serial.film_name)
-                        for serial in serials
-                    ],
-                    return_exceptions=True,
+                return FilmPage(
+                    items=[self._listing_serial_model(serial) for serial in serials],
+                    end_cursor=encode_cursor(serials[-1]),
+                    has_next_page=has_next_page,
                 )
-
-                serial_list = []
-                for serial, posters_data, serial_video_urls in zip(
-                    serials, serial_posters, serial_video_url
-                ):
-                    try:
-                        if isinstance(posters_data, Exception):
-                            logger.error(
-                                f"Ошибка загрузки постера для сериала {serial.film_name}: {str(posters_data)}"
-                            )
-                            posters_data = None
-
-                        poster_url = None
-                        preview_url = None
-                        text_url = None
-
-                        if (
-                            posters_data
-                            and isinstance(posters_data, list)
-                            and len(posters_data) > 0
-                        ):
-                            poster_data = posters_data[
-                                0
-                            ]  # Получаем первый (и единственный) элемент
-                            video_urls = serial_video_urls[0]
-                            poster_url = poster_data.get("poster_url")
-                            preview_url = poster_data.get(
-                                "preview_url"
-                            )  # Исправлена опечатка в ключе (preview_url)
-                            text_url = poster_data.get("text_url")
-                            video_url = video_urls.get("serial_url")
-
-                        actor_posters = await asyncio.gather(
-                            *[
-                                s3_repository.get_poster_actor(
-                                    film_actor.actor.actor_name
-                                )
-                                for film_actor in serial.film_actors
-                            ],
-                            return_exceptions=True,  # Позволяет продолжить выполнение, даже если один из запросов завершится с ошибкой
-                        )
-
-                        processed_actors = []
-                        for film_actor, actor_posters_data in zip(
-                            serial.film_actors, actor_posters
-                        ):
-                            try:
-                                # Проверяем, что actor_posters_data не является исключением
-                                if isinstance(actor_posters_data, Exception):
-                                    logger.error(
-                                        f"Ошибка загрузки постера актера {film_actor.actor.actor_name}: {str(actor_posters_data)}"
-                                    )
-                                    actor_posters_data = None
-
-                                # Если actor_posters_data является списком и содержит данные
-                                actor_poster_url = None
-                                if (
-                                    actor_posters_data
-                                    and isinstance(actor_posters_data, list)
-                                    and len(actor_posters_data) > 0
-                                ):
-                                    actor_poster_url = actor_posters_data[0].get(
-                                        "poster_url"
-                                    )  # Получаем URL первого постера
-
-                                processed_actors.append(
-                                    ActorModel(
-                                        actor_name=film_actor.actor.actor_name,
-                                        career=film_actor.actor.career,
-                                        date_of_birth=film_actor.actor.date_of_birth,
-                                        place_of_birth=film_actor.actor.place_of_birth,
-                                        sex=film_actor.actor.sex,
-                                        age=film_actor.actor.age,
-                                        growth=film_actor.actor.growth,
-                                        biography=film_actor.actor.biography,
-                                        poster_url=actor_poster_url,
-                                    )
-                                )
-                            except Exception as e:
-                                logger.error(
-                                    f"Ошибка обработки данных актера {film_actor.actor.actor_name}: {str(e)}"
-                                )
-
-                        # Создаём объект для фильма с актёрами и постерами
-                        film_data = FilmModel(
-                            film_name=serial.film_name,
-                            description=serial.description,
-                            type=serial.type,
-                            year_prod=serial.year_prod,
-                            age_rating=serial.age_rating,
-                            watch_time=serial.watch_time,
-                            rating=serial.rating,
-                            comments=[
-                                CommentModel(
-                                    film_id=comment.film_id,
-                                    user_id=comment.user_id,
-                                    rating=comment.rating,
-                                    comment=comment.comment,
-                                )
-                                for comment in serial.comments
-                            ],
-                            countries=[
-                                CountryModel(country_name=country.country_name)
-                                for country in serial.countries
-                            ],
-                            genres=[
-                                GenreModel(genre_name=genre.genre_name)
-                                for genre in serial.genres
-                            ],
-                            actors=processed_actors,
-                            poster_url=poster_url,
-                            preview_url=preview_url,
-                            text_url=text_url,
-                            video_url=video_url,
-                        )
-                        serial_list.append(film_data)
-                    except Exception as e:
-                        logger.error(
-                            f"Ошибка обработки данных сериала {serial.film_name}: {str(e)}"
-                        )
-
-                return serial_list
+            except ValueError:
+                raise
             except Exception as e:
                 logger.error(f"Ошибка выполнения запроса: {str(e)}")
                 return None
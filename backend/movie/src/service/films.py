@@ -1,10 +1,14 @@
 from typing import List, Optional
 from fastapi import HTTPException, status
 from src.controller.schema.schemas import FilmResponse
-from src.core.schemas import FilmModel, CreateCommentModel, GenresCountries, FiltersResponse
+from src.core.config import get_settings
+from src.repositories.card.cards import CardRepository
+from src.core.schemas import FilmModel, FilmPage, FilmCardPage, CreateCommentModel, GenresCountries, FiltersResponse
 from src.repositories.film.films import FilmRepository
 
+settings = get_settings()
 film_repository = FilmRepository()
+card_repository = CardRepository()
 
 
 class FilmService:
@@ -25,32 +29,24 @@ class FilmService:
         return FilmResponse(message="Комментарии успешно добавлен к фильму")
 
     @staticmethod
-    async def get_all_films() -> List[FilmModel]:
+    async def get_all_films(
+        first: int = settings.page_size_default, after: Optional[str] = None
+    ) -> FilmPage:
         """
-        Возвращает список из 10 фильмов из базы данных
+        Возвращает страницу фильмов из базы данных
         """
-        films_data = await film_repository.get_films()
+        return await film_repository.get_films(first=first, after=after)
 
-        return [
-            FilmModel(
-                film_name=film.film_name,
-                type=film.type,
-                age_rating=film.age_rating,
-                description=film.description,
-                watch_time=film.watch_time,
-                year_prod=film.year_prod,
-                rating=film.rating,
-                genres=film.genres,
-                actors=film.actors,
-                countries=film.countries,
-                poster_url=film.poster_url,
-                comments=film.comments,
-                preview_url=film.preview_url,
-                text_url=film.text_url,
-                video_url=film.video_url,
-            )
-            for film in films_data
-        ]
+    @staticmethod
+    async def get_film_cards(
+        first: int = settings.page_size_default, after: Optional[str] = None
+    ) -> FilmCardPage:
+        """
+        Возвращает страницу карточек фильмов без актеров и комментариев
+        """
+        return await card_repository.get_cards(
+            film_type="movie", first=first, after=after
+        )
 
     @staticmethod
     async def get_film_name(film_name: str) -> FilmModel:
@@ -60,6 +56,7 @@ class FilmService:
         film_data = await film_repository.get_film_name_info(film_name=film_name)
 
         return FilmModel(
+            id=film_data.id,
             film_name=film_data.film_name,
             type=film_data.type,
             age_rating=film_data.age_rating,
@@ -79,40 +76,29 @@ class FilmService:
 
     @staticmethod
     async def get_film_filter(
-        film_genre: str = None, country_name: str = None, rating: float = None
-    ) -> Optional[List[FilmModel]]:
+        film_genre: str = None,
+        country_name: str = None,
+        rating: float = None,
+        first: int = settings.page_size_max,
+        after: Optional[str] = None,
+    ) -> FilmPage:
         """
-        Возвращает фильмы по фильтрам
+        Возвращает страницу фильмов по фильтрам
         """
         film_data = await film_repository.get_film_filter_info(
-            genre_name=film_genre, country_name=country_name, rating=rating
+            genre_name=film_genre,
+            country_name=country_name,
+            rating=rating,
+            first=first,
+            after=after,
         )
-        if not film_data:
+        if not film_data or (not film_data.items and after is None):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Не найдены фильмы в данной категории",
             )
 
-        return [
-            FilmModel(
-                film_name=film.film_name,
-                type=film.type,
-                age_rating=film.age_rating,
-                description=film.description,
-                watch_time=film.watch_time,
-                year_prod=film.year_prod,
-                rating=film.rating,
-                genres=film.genres,
-                actors=film.actors,
-                comments=film.comments,
-                countries=film.countries,
-                poster_url=film.poster_url,
-                preview_url=film.preview_url,
-                text_url=film.text_url,
-                video_url=film.video_url,
-            )
-            for film in film_data
-        ]
+        return film_data
 
     @staticmethod
     async def get_filters():
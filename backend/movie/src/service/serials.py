@@ -2,9 +2,13 @@ from typing import List, Optional
 from fastapi import HTTPException, status
 from src.controller.schema.schemas import FilmResponse
 from src.repositories.serial.serials import SerialRepository
-from src.core.schemas import FilmModel, CreateCommentModel, GenresCountries
+from src.core.config import get_settings
+from src.repositories.card.cards import CardRepository
+from src.core.schemas import FilmModel, FilmPage, FilmCardPage, CreateCommentModel, GenresCountries
 
+settings = get_settings()
 serial_repository = SerialRepository()
+card_repository = CardRepository()
 
 
 class SerialService:
@@ -25,35 +29,24 @@ class SerialService:
         return FilmResponse(message="Комментарии успешно добавлен к сериалу")
 
     @staticmethod
-    async def get_all_serials() -> List[FilmModel]:
+    async def get_all_serials(
+        first: int = settings.page_size_default, after: Optional[str] = None
+    ) -> FilmPage:
         """
-        Возвращает список из 10 сериалов из базы данных
+        Возвращает страницу сериалов из базы данных
         """
-        serials_data = await serial_repository.get_serials()
+        return await serial_repository.get_serials(first=first, after=after)
 
-        # Преобразуем каждый фильм в модель FilmModel
-        serial_data = [
-            FilmModel(
-                film_name=serial.film_name,
-                type=serial.type,
-                age_rating=serial.age_rating,
-                description=serial.description,
-                watch_time=serial.watch_time,
-                year_prod=serial.year_prod,
-                rating=serial.rating,
-                genres=serial.genres,
-                actors=serial.actors,
-                comments=serial.comments,
-                countries=serial.countries,
-                poster_url=serial.poster_url,
-                preview_url=serial.preview_url,
-                text_url=serial.text_url,
-                video_url=serial.video_url,
-            )
-            for serial in serials_data
-        ]
-
-        return serial_data
+    @staticmethod
+    async def get_serial_cards(
+        first: int = settings.page_size_default, after: Optional[str] = None
+    ) -> FilmCardPage:
+        """
+        Возвращает страницу карточек сериалов без актеров и комментариев
+        """
+        return await card_repository.get_cards(
+            film_type="serial", first=first, after=after
+        )
 
     @staticmethod
     async def get_serial_name(serial_name: str) -> FilmModel:
@@ -65,6 +58,7 @@ class SerialService:
         )
 
         return FilmModel(
+            id=serial_data.id,
             film_name=serial_data.film_name,
             type=serial_data.type,
             age_rating=serial_data.age_rating,
@@ -84,37 +78,26 @@ class SerialService:
 
     @staticmethod
     async def get_serial_filter(
-        film_genre: str = None, country_name: str = None, rating: float = None
-    ) -> Optional[List[FilmModel]]:
+        film_genre: str = None,
+        country_name: str = None,
+        rating: float = None,
+        first: int = settings.page_size_max,
+        after: Optional[str] = None,
+    ) -> FilmPage:
         serial_data = await serial_repository.get_serial_filter_info(
-            genre_name=film_genre, country_name=country_name, rating=rating
+            genre_name=film_genre,
+            country_name=country_name,
+            rating=rating,
+            first=first,
+            after=after,
         )
-        if not serial_data:
+        if not serial_data or (not serial_data.items and after is None):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Не найдены сериалы в данной категории",
             )
 
-        return [
-            FilmModel(
-                film_name=serial.film_name,
-                type=serial.type,
-                age_rating=serial.age_rating,
-                description=serial.description,
-                watch_time=serial.watch_time,
-                year_prod=serial.year_prod,
-                rating=serial.rating,
-                genres=serial.genres,
-                actors=serial.actors,
-                comments=serial.comments,
-                countries=serial.countries,
-                poster_url=serial.poster_url,
-                preview_url=serial.preview_url,
-                text_url=serial.text_url,
-                video_url=serial.video_url,
-            )
-            for serial in serial_data
-        ]
+        return serial_data
 
     @staticmethod
     async def get_filters():
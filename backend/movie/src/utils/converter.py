@@ -1,10 +1,22 @@
 from typing import Optional
 
-from src.controller.schema.schemas import FilmInput, CommentInput
+from src.controller.schema.schemas import (
+    FilmInput,
+    CommentInput,
+    ActorType,
+    FilmActorType,
+    FilmType,
+    FilmPageType,
+    FilmCardType,
+    FilmCardPageType,
+    PageInfoType,
+)
 from src.core.schemas import (
     GenreModel,
     CountryModel,
     FilmModel,
+    FilmPage,
+    FilmCardPage,
     ActorModel,
     CreateCommentModel,
 )
@@ -56,3 +68,89 @@ async def convert_comment_film_model(comment_input: CommentInput) -> CreateComme
     )
 
     return comment
+
+
+def convert_film_type(film: FilmModel) -> FilmType:
+    """
+    Преобразует Pydantic-модель (FilmModel) в strawberry-тип (FilmType).
+    Актеры, комментарии и ссылки S3 резолвятся DataLoader-ами по запросу
+    клиента, как в листингах, так и на странице фильма.
+    """
+    return FilmType(
+        film_name=film.film_name,
+        type=film.type,
+        description=film.description,
+        year_prod=film.year_prod,
+        age_rating=film.age_rating,
+        watch_time=film.watch_time,
+        rating=film.rating,
+        genres=[genre.genre_name for genre in film.genres],
+        countries=[country.country_name for country in film.countries],
+        film_id=film.id,
+    )
+
+
+def convert_actor_type(actor: ActorModel) -> ActorType:
+    """
+    Преобразует Pydantic-модель (ActorModel) со списком фильмов в strawberry-тип.
+    """
+    return ActorType(
+        actor_name=actor.actor_name,
+        career=actor.career,
+        date_of_birth=actor.date_of_birth,
+        place_of_birth=actor.place_of_birth,
+        sex=actor.sex,
+        age=actor.age,
+        growth=actor.growth,
+        biography=actor.biography,
+        films=[
+            FilmActorType(
+                film_name=film.film_name,
+                type=film.type,
+                year_prod=film.year_prod,
+                rating=film.rating,
+                poster_url=film.poster_url,
+            )
+            for film in actor.films or []
+        ],
+        loaded_poster_url=actor.poster_url,
+        prefetched=True,
+    )
+
+
+def convert_film_page_type(page: FilmPage) -> FilmPageType:
+    """
+    Преобразует страницу фильмов (FilmPage) в strawberry-тип (FilmPageType).
+    """
+    return FilmPageType(
+        items=[convert_film_type(film) for film in page.items],
+        page_info=PageInfoType(
+            end_cursor=page.end_cursor,
+            has_next_page=page.has_next_page,
+        ),
+    )
+
+
+def convert_film_card_page_type(page: FilmCardPage) -> FilmCardPageType:
+    """
+    Преобразует страницу карточек (FilmCardPage) в strawberry-тип (FilmCardPageType).
+    """
+    return FilmCardPageType(
+        items=[
+            FilmCardType(
+                film_name=card.film_name,
+                type=card.type,
+                year_prod=card.year_prod,
+                rating=card.rating,
+                genres=card.genres,
+                poster_url=card.poster_url,
+                preview_url=card.preview_url,
+                text_url=card.text_url,
+            )
+            for card in page.items
+        ],
+        page_info=PageInfoType(
+            end_cursor=page.end_cursor,
+            has_next_page=page.has_next_page,
+        ),
+    )
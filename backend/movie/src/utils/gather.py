@@ -0,0 +1,24 @@
+import asyncio
+from typing import Any, Awaitable, Iterable, List
+from src.core.config import get_settings
+
+settings = get_settings()
+
+
+async def gather_limited(
+    coros: Iterable[Awaitable[Any]],
+    limit: int = settings.s3_conf.fanout_limit,
+    timeout: float = settings.s3_conf.item_timeout,
+) -> List[Any]:
+    """
+    Выполняет корутины параллельно, но не более limit одновременно. Каждая
+    корутина ограничена timeout секундами; ошибки и таймауты возвращаются
+    в результатах вместо значений, как при return_exceptions=True.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await asyncio.wait_for(coro, timeout)
+
+    return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=True)
@@ -0,0 +1,109 @@
+"""
+Бенчмарк отправки писем: отдельная SMTP-сессия на письмо (как FastMail)
+против пула соединений EmailSender.
+
+Поднимает локальный SMTP-сервер aiosmtpd, который принимает и отбрасывает
+письма (опционально с задержкой ответа на DATA, имитирующей удаленный
+сервер), и замеряет письма в секунду для обоих вариантов.
+
+Запуск: uv run python -m benchmarks.smtp_delivery [--messages 500] [--pool-size 3]
+"""
+
+import argparse
+import asyncio
+import socket
+import time
+import aiosmtplib
+from aiosmtpd.controller import Controller
+from src.core.email.base import EmailSender
+
+HOST = "127.0.0.1"
+
+
+class SinkHandler:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.received = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.received += 1
+        return "250 OK"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+async def send_per_session(sender: EmailSender, messages, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(message):
+        async with semaphore:
+            await aiosmtplib.send(message, hostname=HOST, port=sender.port)
+
+    await asyncio.gather(*(send(message) for message in messages))
+
+
+async def send_pooled(sender: EmailSender, messages):
+    await asyncio.gather(*(sender.send_message(message) for message in messages))
+    await sender.close()
+
+
+async def measure(name: str, coro, count: int):
+    started = time.perf_counter()
+    await coro
+    elapsed = time.perf_counter() - started
+    print(f"{name:<28}{count / elapsed:>12.1f} писем/с")
+
+
+async def main(messages: int, pool_size: int, latency: float):
+    port = free_port()
+    handler = SinkHandler(latency)
+    controller = Controller(handler, hostname=HOST, port=port)
+    controller.start()
+    try:
+        def make_sender() -> EmailSender:
+            return EmailSender(
+                hostname=HOST,
+                port=port,
+                username=None,
+                password=None,
+                sender="bench@filmflood.local",
+                start_tls=False,
+                use_tls=False,
+                pool_size=pool_size,
+                send_rate=0,
+            )
+
+        sender = make_sender()
+        batch = [
+            sender.build_message(
+                subject=f"bench {i}",
+                recipients=[f"user{i}@filmflood.local"],
+                html="<p>bench</p>",
+            )
+            for i in range(messages)
+        ]
+
+        print(f"{messages} писем, пул {pool_size}, задержка DATA {latency * 1000:.0f} мс")
+        await measure(
+            "сессия на письмо",
+            send_per_session(sender, batch, concurrency=pool_size),
+            messages,
+        )
+        await measure("пул EmailSender", send_pooled(make_sender(), batch), messages)
+    finally:
+        controller.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--pool-size", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.messages, args.pool_size, args.latency))
@@ -0,0 +1,69 @@
+"""
+Бенчмарк рендера шаблонов писем auth-success.html и payment-receipt.html.
+
+Сравнивает три способа:
+  - новое Environment и разбор шаблона на каждый рендер (как было в
+    payment/src/utils/html_to_pdf.py);
+  - общее Environment с auto_reload и get_template на каждый рендер (как
+    было с Jinja2Templates в сервисе уведомлений);
+  - TemplateRegistry: шаблоны скомпилированы при старте.
+
+Запуск: uv run python -m benchmarks.template_render [--renders 2000]
+"""
+
+import argparse
+import time
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from src.core.templates.base import TemplateRegistry
+
+CONTEXTS = {
+    "auth-success.html": {"username": "bench", "email": "bench@filmflood.local"},
+    "payment-receipt.html": {
+        "order_number": "Заказ №00042",
+        "amountValue": 299.0,
+        "paymentDate": "2026-10-18T12:00:00",
+    },
+}
+
+
+def per_render_environment(name: str, context: dict) -> str:
+    env = Environment(loader=FileSystemLoader("templates"))
+    return env.get_template(name).render(context)
+
+
+def measure(render, name: str, renders: int) -> float:
+    render(name, CONTEXTS[name])  # прогрев
+    started = time.perf_counter()
+    for _ in range(renders):
+        render(name, CONTEXTS[name])
+    return renders / (time.perf_counter() - started)
+
+
+def main(renders: int):
+    shared = Environment(
+        loader=FileSystemLoader("templates"),
+        autoescape=select_autoescape(["html"]),
+        auto_reload=True,
+    )
+    registry = TemplateRegistry(auto_reload=False)
+    registry.load()
+
+    variants = {
+        "Environment на рендер": per_render_environment,
+        "get_template на рендер": lambda name, context: shared.get_template(
+            name
+        ).render(context),
+        "TemplateRegistry": registry.render,
+    }
+
+    print(f"{'шаблон':<24}{'способ':<26}{'рендеров/с':>12}")
+    for name in CONTEXTS:
+        for variant, render in variants.items():
+            print(f"{name:<24}{variant:<26}{measure(render, name, renders):>12.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--renders", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.renders)
@@ -1,14 +1,23 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-from src.controller.payment import router as payment_router
-from src.controller.auth import router as auth_router
+from src.controller.metrics import router as metrics_router
+from src.core.email.base import email_sender
+from src.service.worker import notification_worker
 from loguru import logger
+from src.core.templates.base import template_registry
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("FastAPI service start...")
+    template_registry.load()
+    try:
+        await notification_worker.start()
+    except Exception as e:
+        logger.error(f"Kafka недоступна, обработчик уведомлений подключится позже: {e}")
     yield
+    await notification_worker.stop()
+    await email_sender.close()
     logger.info("FastAPI service end...")
 
 
@@ -18,8 +27,7 @@ app = FastAPI(
     root_path='/api/notifications'
 )
 
-app.include_router(payment_router)
-app.include_router(auth_router)
+app.include_router(metrics_router)
 
 app.add_middleware(
     CORSMiddleware,
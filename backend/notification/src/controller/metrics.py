@@ -0,0 +1,8 @@
+from fastapi import APIRouter
+from src.service.worker import notification_worker
+
+router = APIRouter(tags=["Metrics"])
+
+@router.get("/metrics/worker")
+async def worker_metrics():
+    return await notification_worker.metrics()
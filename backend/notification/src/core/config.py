@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
@@ -8,6 +9,13 @@ class EmailConfig(BaseSettings):
     MAIL_FROM: str = Field(..., alias='MAIL_USERNAME')
     MAIL_PORT: int = Field(..., alias='MAIL_PORT')
     MAIL_SERVER: str = Field(..., alias='MAIL_SERVER')
+    MAIL_STARTTLS: bool = Field(True, alias='MAIL_STARTTLS')
+    MAIL_SSL_TLS: bool = Field(False, alias='MAIL_SSL_TLS')
+    MAIL_TIMEOUT: float = Field(30, alias='MAIL_TIMEOUT')
+    MAIL_POOL_SIZE: int = Field(3, alias='MAIL_POOL_SIZE')
+    MAIL_SEND_RATE: float = Field(0, alias='MAIL_SEND_RATE')
+    MAIL_MAX_RETRIES: int = Field(3, alias='MAIL_MAX_RETRIES')
+    MAIL_RETRY_BACKOFF: float = Field(1, alias='MAIL_RETRY_BACKOFF')
 
     model_config = SettingsConfigDict(
         extra='allow',
@@ -16,15 +24,42 @@ class EmailConfig(BaseSettings):
 
 class KafkaConfig(BaseSettings):
     bootstrap_servers: str = Field(..., alias='KAFKA_BOOTSTRAP_SERVERS')
+    group_id: str = Field('notification', alias='KAFKA_GROUP_ID')
 
     model_config = SettingsConfigDict(
         extra='allow',
         env_prefix='KAFKA_'
     )
 
+class WorkerConfig(BaseSettings):
+    batch_size: int = Field(100, alias='WORKER_BATCH_SIZE')
+    poll_timeout_ms: int = Field(1000, alias='WORKER_POLL_TIMEOUT_MS')
+    concurrency: int = Field(10, alias='WORKER_CONCURRENCY')
+    retry_backoff: float = Field(5, alias='WORKER_RETRY_BACKOFF')
+    max_attempts: int = Field(5, alias='WORKER_MAX_ATTEMPTS')
+    throughput_window: float = Field(60, alias='WORKER_THROUGHPUT_WINDOW')
+
+    model_config = SettingsConfigDict(
+        extra='allow',
+        env_prefix='WORKER_'
+    )
+
+class TemplatesConfig(BaseSettings):
+    directory: str = Field('templates', alias='TEMPLATES_DIRECTORY')
+    auto_reload: bool = Field(False, alias='TEMPLATES_AUTO_RELOAD')
+    bytecode_cache: bool = Field(True, alias='TEMPLATES_BYTECODE_CACHE')
+    bytecode_cache_dir: Optional[str] = Field(None, alias='TEMPLATES_BYTECODE_CACHE_DIR')
+
+    model_config = SettingsConfigDict(
+        extra='allow',
+        env_prefix='TEMPLATES_'
+    )
+
 class Settings(BaseSettings):
     email: EmailConfig = Field(default_factory=EmailConfig)
     kafka: KafkaConfig = Field(default_factory=KafkaConfig)
+    templates: TemplatesConfig = Field(default_factory=TemplatesConfig)
+    worker: WorkerConfig = Field(default_factory=WorkerConfig)
 
     model_config = SettingsConfigDict(
         extra='allow'
@@ -1,18 +1,194 @@
+import asyncio
+import time
+from email.message import EmailMessage
+from typing import List, Optional
+import aiosmtplib
+from loguru import logger
 from src.core.config import get_settings
-from fastapi_mail import ConnectionConfig, FastMail
 
 settings = get_settings()
 
+
 class EmailSender:
-    def __init__(self):
-        self.conf = ConnectionConfig(
-            MAIL_USERNAME=settings.email.MAIL_USERNAME,
-            MAIL_PASSWORD=settings.email.MAIL_PASSWORD,
-            MAIL_FROM=settings.email.MAIL_FROM,
-            MAIL_PORT=settings.email.MAIL_PORT,
-            MAIL_SERVER=settings.email.MAIL_SERVER,
-            MAIL_STARTTLS=True,
-            MAIL_SSL_TLS=False,
-            USE_CREDENTIALS=True
+    """
+    Отправка писем через пул авторизованных SMTP-соединений. Соединение
+    открывается (STARTTLS + LOGIN) один раз и отправляет подряд много писем,
+    а не одно письмо на сессию. Скорость отправки ограничивается send_rate
+    писем в секунду (0 — без ограничения); на временные ошибки сервера (4xx)
+    все соединения делают паузу с экспоненциальной задержкой.
+    """
+
+    def __init__(
+        self,
+        hostname: str = settings.email.MAIL_SERVER,
+        port: int = settings.email.MAIL_PORT,
+        username: Optional[str] = settings.email.MAIL_USERNAME,
+        password: Optional[str] = settings.email.MAIL_PASSWORD,
+        sender: str = settings.email.MAIL_FROM,
+        start_tls: bool = settings.email.MAIL_STARTTLS,
+        use_tls: bool = settings.email.MAIL_SSL_TLS,
+        pool_size: int = settings.email.MAIL_POOL_SIZE,
+        send_rate: float = settings.email.MAIL_SEND_RATE,
+        max_retries: int = settings.email.MAIL_MAX_RETRIES,
+        retry_backoff: float = settings.email.MAIL_RETRY_BACKOFF,
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.sender = sender
+        self.start_tls = start_tls
+        self.use_tls = use_tls
+        self.pool_size = pool_size
+        self.send_rate = send_rate
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+        # Место в пуле занимает и свободное, и открываемое соединение: release
+        # и discard возвращают место, и ожидающий может открыть новое
+        self._slots = asyncio.Semaphore(pool_size)
+        self._idle: List[aiosmtplib.SMTP] = []
+        self._rate_lock = asyncio.Lock()
+        self._next_send_at = 0.0
+        self._paused_until = 0.0
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        smtp = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            start_tls=self.start_tls,
+            use_tls=self.use_tls,
+            timeout=settings.email.MAIL_TIMEOUT,
         )
-        self.mailer = FastMail(self.conf)
+        await smtp.connect()
+        return smtp
+
+    async def _acquire(self) -> aiosmtplib.SMTP:
+        """
+        Занимает место в пуле и отдает свободное соединение или открывает
+        новое. Если соединение открыть не удалось, место освобождается.
+        """
+        await self._slots.acquire()
+        smtp = self._idle.pop() if self._idle else None
+        try:
+            if smtp is None:
+                return await self._connect()
+            if not smtp.is_connected:
+                await smtp.connect()
+            return smtp
+        except BaseException:
+            if smtp is not None:
+                smtp.close()
+            self._slots.release()
+            raise
+
+    def _release(self, smtp: aiosmtplib.SMTP):
+        self._idle.append(smtp)
+        self._slots.release()
+
+    def _discard(self, smtp: aiosmtplib.SMTP):
+        smtp.close()
+        self._slots.release()
+
+    def _pause(self, attempt: int) -> float:
+        """Пауза retry_backoff * 2^attempt для всех соединений"""
+        delay = self.retry_backoff * 2**attempt
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        return delay
+
+    async def _throttle(self):
+        """Ждет своей очереди по лимиту скорости и паузы после 4xx"""
+        async with self._rate_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_send_at, self._paused_until)
+            if self.send_rate > 0:
+                self._next_send_at = start_at + 1 / self.send_rate
+        delay = start_at - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _is_transient(error: Exception) -> bool:
+        if isinstance(error, aiosmtplib.SMTPRecipientsRefused):
+            return all(400 <= r.code < 500 for r in error.recipients)
+        if isinstance(error, aiosmtplib.SMTPResponseException):
+            return 400 <= error.code < 500
+        return False
+
+    @staticmethod
+    def is_permanent(error: Exception) -> bool:
+        """
+        Постоянная ошибка (5xx, в том числе отклоненные адресаты): повтор
+        того же письма ничего не изменит.
+        """
+        if isinstance(
+            error, (aiosmtplib.SMTPRecipientsRefused, aiosmtplib.SMTPResponseException)
+        ):
+            return not EmailSender._is_transient(error)
+        return False
+
+    def build_message(self, subject: str, recipients: List[str], html: str) -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = ", ".join(recipients)
+        message["Subject"] = subject
+        message.set_content(html, subtype="html")
+        return message
+
+    async def send_html(self, subject: str, recipients: List[str], html: str):
+        await self.send_message(self.build_message(subject, recipients, html))
+
+    async def send_message(self, message: EmailMessage):
+        """
+        Отправляет письмо через свободное соединение пула. Оборванное
+        соединение заменяется новым, недоступность сервера и 4xx повторяются
+        с задержкой retry_backoff * 2^attempt, 5xx пробрасывается сразу.
+        """
+        for attempt in range(self.max_retries + 1):
+            await self._throttle()
+            smtp = None
+            try:
+                smtp = await self._acquire()
+                await smtp.send_message(message)
+            except (aiosmtplib.SMTPTimeoutError, OSError) as e:
+                # Обрыв, таймаут или отказ в подключении
+                if smtp is not None:
+                    self._discard(smtp)
+                if attempt == self.max_retries:
+                    raise
+                if smtp is None:
+                    delay = self._pause(attempt)
+                    logger.warning(f"SMTP-сервер недоступен ({e}), повтор через {delay} с")
+                else:
+                    logger.warning(f"SMTP-соединение потеряно, повтор: {e}")
+                continue
+            except Exception as e:
+                if smtp is not None:
+                    self._release(smtp)
+                if not self._is_transient(e) or attempt == self.max_retries:
+                    raise
+                delay = self._pause(attempt)
+                logger.warning(f"Временная ошибка SMTP ({e}), повтор через {delay} с")
+                continue
+            except BaseException:
+                # Отмена посреди диалога с сервером: соединение в неизвестном
+                # состоянии
+                if smtp is not None:
+                    self._discard(smtp)
+                raise
+
+            self._release(smtp)
+            return
+
+    async def close(self):
+        while self._idle:
+            smtp = self._idle.pop()
+            try:
+                await smtp.quit()
+            except Exception:
+                smtp.close()
+
+
+email_sender = EmailSender()
@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict
+from typing import Any, Dict, List, Optional
+from aiokafka import ConsumerRecord, TopicPartition
 
 class KafkaAbstractConsumer(ABC):
     @abstractmethod
-    def __init__(self, topic: str): ...
+    def __init__(self, *topics: str): ...
 
     @abstractmethod
     async def start(self): ...
@@ -12,4 +13,18 @@ class KafkaAbstractConsumer(ABC):
     async def stop(self): ...
 
     @abstractmethod
-    async def get_messages(self, timeout_ms: int = 5000) -> list[Any] | List[Dict[str, Any]] | Dict[str, str]: ...
\ No newline at end of file
+    async def get_batch(
+        self, timeout_ms: int, max_records: int
+    ) -> Dict[TopicPartition, List[ConsumerRecord]]: ...
+
+    @abstractmethod
+    async def commit(self, offsets: Dict[TopicPartition, int]): ...
+
+    @abstractmethod
+    def seek(self, partition: TopicPartition, offset: int): ...
+
+    @abstractmethod
+    async def backlog(self) -> Dict[str, int]: ...
+
+    @abstractmethod
+    def decode(self, record: ConsumerRecord) -> Optional[Dict[str, Any]]: ...
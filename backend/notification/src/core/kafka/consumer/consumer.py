@@ -1,72 +1,98 @@
 import json
-from aiokafka import AIOKafkaConsumer
+from aiokafka import AIOKafkaConsumer, ConsumerRecord, TopicPartition
 from src.core.config import get_settings
 from loguru import logger
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from src.core.kafka.consumer.base import KafkaAbstractConsumer
 
 settings = get_settings()
 
 class KafkaConsumer(KafkaAbstractConsumer):
-    def __init__(self, topic: str):
-        self.consumer = AIOKafkaConsumer(
-            topic,
-            bootstrap_servers=f"{settings.kafka.bootstrap_servers}",
-            security_protocol="PLAINTEXT",
-            group_id="notification",
-            enable_auto_commit=True,
-            auto_offset_reset="earliest",
-        )
+    """
+    Потребитель с ручным коммитом: смещения фиксируются вызывающим кодом
+    только после успешной обработки сообщений.
+    """
+
+    def __init__(self, *topics: str):
+        self.topics = topics
+        self.consumer: Optional[AIOKafkaConsumer] = None
         self._is_started = False
 
     async def start(self):
         """Запуск потребителя"""
         if not self._is_started:
-            await self.consumer.start()
+            consumer = AIOKafkaConsumer(
+                *self.topics,
+                bootstrap_servers=f"{settings.kafka.bootstrap_servers}",
+                security_protocol="PLAINTEXT",
+                group_id=settings.kafka.group_id,
+                enable_auto_commit=False,
+                auto_offset_reset="earliest",
+            )
+            try:
+                await consumer.start()
+            except Exception:
+                # Клиент мог успеть открыть соединения и фоновые задачи
+                await consumer.stop()
+                raise
+            self.consumer = consumer
             self._is_started = True
 
+    @property
+    def is_started(self) -> bool:
+        return self._is_started
+
     async def stop(self):
         """Остановка потребителя"""
         if self._is_started:
             await self.consumer.stop()
+            self.consumer = None
             self._is_started = False
 
-    async def get_messages(self, timeout_ms: int = 5000) -> list[Any] | List[Dict[str, Any]] | Dict[str, str]:
-        """Получение сообщений с декодированием текста и возвратом в формате JSON"""
-        messages = []
-        try:
-            records = await self.consumer.getmany(timeout_ms=timeout_ms, max_records=1)
-            for tp, batch in records.items():
-                for msg in batch:
-                    decoded_msg = msg.value.decode("utf-8")
-                    if not decoded_msg.strip():
-                        logger.warning("Пустое сообщение.")
-                        continue
+    async def get_batch(
+        self, timeout_ms: int, max_records: int
+    ) -> Dict[TopicPartition, List[ConsumerRecord]]:
+        """Получение пачки сообщений, сгруппированных по партициям"""
+        return await self.consumer.getmany(
+            timeout_ms=timeout_ms, max_records=max_records
+        )
 
-                    try:
-                        parsed_message = json.loads(decoded_msg)
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Ошибка парсинга JSON: {e} для сообщения: {decoded_msg}")
-                        continue
+    async def commit(self, offsets: Dict[TopicPartition, int]):
+        """Фиксация смещений: offset — номер следующего непрочитанного сообщения"""
+        await self.consumer.commit(offsets)
 
-                    data = parsed_message.get("data", {})
-                    # Извлекаем данные из ключа "data"
-                    if not all([data.get("number_order"), data.get("amount"), data.get("order_date"), data.get("email")]):
-                        logger.error(f"Некорректные данные для шаблона: {data}")
-                        return {
-                            "message": "Ошибка: некорректные данные для рендеринга шаблона"
-                        }
+    def seek(self, partition: TopicPartition, offset: int):
+        """Возврат позиции партиции, чтобы сообщение было прочитано повторно"""
+        self.consumer.seek(partition, offset)
 
-                    messages.append({
-                        "number_order": data.get("number_order"),
-                        "order_date": data.get("order_date"),
-                        "order_id": data.get("order_id"),
-                        "user_id": data.get("user_id"),
-                        "amount": data.get("amount"),
-                        "email": data.get("email"),
-                    })
+    async def backlog(self) -> Dict[str, int]:
+        """Отставание по каждой назначенной партиции: highwater - позиция"""
+        if not self._is_started:
+            return {}
+
+        lag = {}
+        for tp in self.consumer.assignment():
+            highwater = self.consumer.highwater(tp)
+            if highwater is None:
+                continue
+            position = await self.consumer.position(tp)
+            lag[f"{tp.topic}:{tp.partition}"] = max(highwater - position, 0)
+        return lag
+
+    def decode(self, record: ConsumerRecord) -> Optional[Dict[str, Any]]:
+        """Декодирование сообщения из JSON; None для пустых и битых сообщений"""
+        decoded_msg = record.value.decode("utf-8") if record.value else ""
+        if not decoded_msg.strip():
+            logger.warning("Пустое сообщение.")
+            return None
+
+        try:
+            parsed_message = json.loads(decoded_msg)
+        except json.JSONDecodeError as e:
+            logger.error(f"Ошибка парсинга JSON: {e} для сообщения: {decoded_msg}")
+            return None
 
-            return messages
-        except Exception as e:
-            logger.error(f"Ошибка получения сообщений: {e}")
-            return []
\ No newline at end of file
+        if not isinstance(parsed_message, dict):
+            logger.error(f"Некорректный формат сообщения: {parsed_message}")
+            return None
+        return parsed_message
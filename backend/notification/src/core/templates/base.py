@@ -0,0 +1,56 @@
+from typing import Any, Dict, Optional
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    select_autoescape,
+)
+from loguru import logger
+from src.core.config import get_settings
+
+settings = get_settings()
+
+
+class TemplateRegistry:
+    """
+    Общий реестр шаблонов процесса. Все шаблоны компилируются один раз при
+    старте (load) и дальше берутся из кэша окружения без обращения к диску.
+    Скомпилированный байткод сохраняется в bytecode_cache_dir, поэтому
+    следующий старт не парсит шаблоны заново. В dev-режиме (auto_reload)
+    измененные на диске шаблоны перекомпилируются при следующем рендере.
+    """
+
+    def __init__(
+        self,
+        directory: str = settings.templates.directory,
+        auto_reload: bool = settings.templates.auto_reload,
+        bytecode_cache_dir: Optional[str] = settings.templates.bytecode_cache_dir,
+    ):
+        self.env = Environment(
+            loader=FileSystemLoader(directory),
+            autoescape=select_autoescape(["html"]),
+            auto_reload=auto_reload,
+            bytecode_cache=(
+                FileSystemBytecodeCache(bytecode_cache_dir)
+                if settings.templates.bytecode_cache
+                else None
+            ),
+            cache_size=-1,
+        )
+
+    def load(self):
+        """Компилирует все шаблоны каталога"""
+        names = self.env.list_templates(extensions=["html"])
+        for name in names:
+            self.env.get_template(name)
+        logger.info(f"Скомпилировано шаблонов: {len(names)}")
+
+    def get(self, name: str) -> Template:
+        return self.env.get_template(name)
+
+    def render(self, name: str, context: Dict[str, Any]) -> str:
+        return self.get(name).render(context)
+
+
+template_registry = TemplateRegistry()
@@ -0,0 +1,196 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+from aiokafka import ConsumerRecord, TopicPartition
+from loguru import logger
+from src.core.config import get_settings
+from src.core.email.base import email_sender
+from src.core.kafka.consumer.consumer import KafkaConsumer
+from src.service.auth import AuthService
+from src.service.payment import PaymentService
+
+settings = get_settings()
+
+HANDLERS: Dict[str, Callable[[Dict[str, Any]], Awaitable[None]]] = {
+    "auth": AuthService.send_to_email,
+    "payment": PaymentService.send_to_email,
+}
+
+
+class NotificationWorker:
+    """
+    Фоновый обработчик топиков auth и payment. Читает сообщения пачками и
+    отправляет письма параллельно, в том числе внутри одной партиции (не
+    более concurrency писем одновременно). Смещение партиции коммитится до
+    первого неуспешного письма, и с него партиция перечитывается после паузы
+    retry_backoff; уже обработанные сообщения после него запоминаются и при
+    перечитывании повторно не уходят. Постоянные ошибки SMTP (5xx,
+    отклоненные адреса) и сообщения, не отправленные за max_attempts
+    попыток, пропускаются, чтобы не блокировать партицию.
+    """
+
+    def __init__(self):
+        self.consumer = KafkaConsumer(*HANDLERS)
+        self._semaphore = asyncio.Semaphore(settings.worker.concurrency)
+        self._task: Optional[asyncio.Task] = None
+        self._started_at: Optional[float] = None
+        self._delivered_at: Deque[float] = deque()
+        self.processed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.dropped = 0
+        self._attempts: Dict[Tuple[str, int, int], int] = {}
+        # Обработанные, но еще не закоммиченные смещения за неуспешным письмом
+        self._done: Dict[TopicPartition, Set[int]] = {}
+
+    async def start(self):
+        """
+        Запускает обработчик. Если Kafka недоступна, ошибка пробрасывается,
+        а фоновая задача продолжает подключаться каждые retry_backoff секунд.
+        """
+        if self._task is not None:
+            return
+        self._started_at = time.monotonic()
+        try:
+            await self.consumer.start()
+        finally:
+            self._task = asyncio.create_task(self._run())
+        logger.info("Notification worker started.")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.consumer.stop()
+        logger.info("Notification worker stopped.")
+
+    async def _run(self):
+        while True:
+            try:
+                if not self.consumer.is_started:
+                    await self.consumer.start()
+                    logger.info("Notification worker connected to Kafka.")
+                batch = await self.consumer.get_batch(
+                    timeout_ms=settings.worker.poll_timeout_ms,
+                    max_records=settings.worker.batch_size,
+                )
+                if batch and not await self._process_batch(batch):
+                    await asyncio.sleep(settings.worker.retry_backoff)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Ошибка обработчика уведомлений: {e}")
+                await asyncio.sleep(settings.worker.retry_backoff)
+
+    async def _process_batch(
+        self, batch: Dict[TopicPartition, List[ConsumerRecord]]
+    ) -> bool:
+        """Обрабатывает пачку; возвращает False, если были неуспешные письма"""
+        results = await asyncio.gather(
+            *(self._process_partition(tp, records) for tp, records in batch.items())
+        )
+
+        offsets = {tp: offset for tp, offset, _ in results if offset is not None}
+        if offsets:
+            await self.consumer.commit(offsets)
+        return all(ok for _, _, ok in results)
+
+    async def _process_partition(
+        self, tp: TopicPartition, records: List[ConsumerRecord]
+    ) -> Tuple[TopicPartition, Optional[int], bool]:
+        results = await asyncio.gather(*(self._handle(tp, record) for record in records))
+
+        failed = next((record for record, ok in zip(records, results) if not ok), None)
+        done = self._done.setdefault(tp, set())
+        if failed is None:
+            commit_offset = records[-1].offset + 1
+        else:
+            commit_offset = failed.offset if failed is not records[0] else None
+            done.update(record.offset for record, ok in zip(records, results) if ok)
+            self.consumer.seek(tp, failed.offset)
+
+        if commit_offset is not None:
+            self._done[tp] = {offset for offset in done if offset >= commit_offset}
+        return tp, commit_offset, failed is None
+
+    async def _handle(self, tp: TopicPartition, record: ConsumerRecord) -> bool:
+        if record.offset in self._done.get(tp, ()):
+            return True
+
+        message = self.consumer.decode(record)
+        if message is None:
+            self.skipped += 1
+            return True
+
+        async with self._semaphore:
+            try:
+                await HANDLERS[record.topic](message)
+            except ValueError as e:
+                logger.warning(
+                    f"Сообщение {record.topic}:{record.partition}:{record.offset} пропущено: {e}"
+                )
+                self.skipped += 1
+                return True
+            except Exception as e:
+                return self._on_failure(record, e)
+
+        self._attempts.pop(self._attempt_key(record), None)
+        self.processed += 1
+        self._delivered_at.append(time.monotonic())
+        return True
+
+    @staticmethod
+    def _attempt_key(record: ConsumerRecord) -> Tuple[str, int, int]:
+        return record.topic, record.partition, record.offset
+
+    def _on_failure(self, record: ConsumerRecord, error: Exception) -> bool:
+        """
+        Решает судьбу неотправленного сообщения: True — пропустить и
+        двигаться дальше, False — перечитать партицию с этого смещения.
+        """
+        position = f"{record.topic}:{record.partition}:{record.offset}"
+        key = self._attempt_key(record)
+        attempts = self._attempts.get(key, 0) + 1
+
+        if email_sender.is_permanent(error) or attempts >= settings.worker.max_attempts:
+            self._attempts.pop(key, None)
+            self.dropped += 1
+            logger.error(
+                f"Сообщение {position} отброшено после {attempts} попыток: {error}"
+            )
+            return True
+
+        self._attempts[key] = attempts
+        self.failed += 1
+        logger.error(
+            f"Не удалось обработать {position} (попытка {attempts}): {error}"
+        )
+        return False
+
+    async def metrics(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        window = settings.worker.throughput_window
+        while self._delivered_at and self._delivered_at[0] < now - window:
+            self._delivered_at.popleft()
+
+        backlog = await self.consumer.backlog()
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "connected": self.consumer.is_started,
+            "uptime": now - self._started_at if self._started_at else 0,
+            "processed": self.processed,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "dropped": self.dropped,
+            "throughput_per_sec": len(self._delivered_at) / window,
+            "backlog": backlog,
+            "backlog_total": sum(backlog.values()),
+        }
+
+
+notification_worker = NotificationWorker()
@@ -0,0 +1,61 @@
+"""
+Бенчмарк генерации PDF-чеков в success-payment: синхронный pdfkit.from_string
+прямо в event loop (как раньше) против html_to_pdf_async.
+
+Запускает --requests одновременных "запросов" success-payment, каждый из
+которых рендерит чек, и замеряет чеки в секунду и максимальную задержку
+event loop (насколько опаздывает тикающий каждые 10 мс heartbeat). Нужен
+установленный wkhtmltopdf.
+
+Запуск: uv run python -m benchmarks.receipt_pdf [--requests 50]
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from src.core.templates.base import template_registry
+from src.utils.html_to_pdf import html_to_pdf_async, html_to_pdf_reportlab
+
+HEARTBEAT = 0.01
+
+
+async def heartbeat(lags: list[float]):
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(HEARTBEAT)
+        lags.append(time.perf_counter() - started - HEARTBEAT)
+
+
+async def success_payment_sync(number: int):
+    html_to_pdf_reportlab(f"bench-{number}", 399.0, datetime.now().isoformat())
+
+
+async def success_payment_async(number: int):
+    await html_to_pdf_async(f"bench-{number}", 399.0, datetime.now().isoformat())
+
+
+async def measure(name: str, handler, requests: int):
+    lags: list[float] = []
+    ticker = asyncio.create_task(heartbeat(lags))
+    started = time.perf_counter()
+    await asyncio.gather(*(handler(number) for number in range(requests)))
+    elapsed = time.perf_counter() - started
+    ticker.cancel()
+    max_lag = max(lags, default=elapsed) * 1000
+    print(f"{name:<28}{requests / elapsed:>12.1f} чеков/с{max_lag:>16.0f} мс лаг")
+
+
+async def main(requests: int):
+    template_registry.load()
+    await success_payment_async(-1)  # прогрев
+
+    await measure("pdfkit в event loop", success_payment_sync, requests)
+    await measure("html_to_pdf_async", success_payment_async, requests)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
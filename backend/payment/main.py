@@ -3,11 +3,26 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from src.controller.payment import router as payment_router
 from loguru import logger
+from src.core.templates.base import template_registry
+from src.core.kafka.producer.producer import kafka_producer
+from src.core.config import get_settings
+from src.service.worker import receipt_worker
+
+settings = get_settings()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("FastAPI service start...")
+    template_registry.load()
+    try:
+        await kafka_producer.start()
+    except Exception as e:
+        logger.error(f"Kafka недоступна, продюсер запустится при первой отправке: {e}")
+    if settings.receipt.worker_enabled:
+        await receipt_worker.start()
     yield
+    await receipt_worker.stop()
+    await kafka_producer.stop()
     logger.info("FastAPI service end...")
 
 
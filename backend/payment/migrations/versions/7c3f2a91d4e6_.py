@@ -0,0 +1,54 @@
+"""receipt queue columns and unique order_id
+
+Revision ID: 7c3f2a91d4e6
+Revises: 00932a5e2b40
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3f2a91d4e6'
+down_revision: Union[str, None] = '00932a5e2b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Чеки уже существующих платежей были сформированы синхронно
+    op.add_column('payments', sa.Column('receipt_status', sa.String(), nullable=False, server_default='sent'))
+    op.add_column('payments', sa.Column('receipt_attempts', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('payments', sa.Column('receipt_next_attempt_at', sa.DateTime(), nullable=True))
+    op.alter_column('payments', 'receipt_status', server_default=None)
+    op.alter_column('payments', 'receipt_attempts', server_default=None)
+    # Дубли от повторной доставки webhook'а: у заказа остается первая строка,
+    # по которой чек уже был отправлен
+    op.execute(
+        """
+        DELETE FROM payments p
+        USING payments older
+        WHERE p.order_id = older.order_id AND p.ctid > older.ctid
+        """
+    )
+    op.create_unique_constraint('payments_order_id_key', 'payments', ['order_id'])
+    op.create_index(
+        'ix_payments_receipt_queue',
+        'payments',
+        ['receipt_next_attempt_at'],
+        unique=False,
+        postgresql_where=sa.text("receipt_status IN ('pending', 'uploaded')"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_payments_receipt_queue', table_name='payments')
+    op.drop_constraint('payments_order_id_key', 'payments', type_='unique')
+    op.drop_column('payments', 'receipt_next_attempt_at')
+    op.drop_column('payments', 'receipt_attempts')
+    op.drop_column('payments', 'receipt_status')
@@ -16,12 +16,17 @@ async def get_redis():
         await redis_service.close()
 
 @router.get('/success-payment', status_code=status.HTTP_200_OK)
-async def success_payment(user_id: UUID, redis: RedisService = Depends(get_redis)):
+async def success_payment(
+    user_id: UUID,
+    redis: RedisService = Depends(get_redis),
+):
     """
     Эндопоинт обработки успешного платежа.
     """
     try:
-        payment = await PaymentService.success_payment(user_id=user_id, redis=redis)
+        payment = await PaymentService.success_payment(
+            user_id=user_id, redis=redis
+        )
         return payment
     except HTTPException as e:
         raise e
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
@@ -16,6 +17,9 @@ class S3Config(BaseSettings):
 
 class KafkaConfig(BaseSettings):
     bootstrap_servers: str = Field(..., alias='KAFKA_BOOTSTRAP_SERVERS')
+    linger_ms: int = Field(5, alias='KAFKA_LINGER_MS')
+    max_batch_size: int = Field(16384, alias='KAFKA_MAX_BATCH_SIZE')
+    compression_type: Optional[str] = Field(None, alias='KAFKA_COMPRESSION_TYPE')
 
     model_config = SettingsConfigDict(
         extra='allow',
@@ -31,11 +35,48 @@ class YookassaConfig(BaseSettings):
         env_prefix='YOOKASSA_'
     )
 
+class TemplatesConfig(BaseSettings):
+    directory: str = Field('templates', alias='TEMPLATES_DIRECTORY')
+    auto_reload: bool = Field(False, alias='TEMPLATES_AUTO_RELOAD')
+    bytecode_cache: bool = Field(True, alias='TEMPLATES_BYTECODE_CACHE')
+    bytecode_cache_dir: Optional[str] = Field(None, alias='TEMPLATES_BYTECODE_CACHE_DIR')
+
+    model_config = SettingsConfigDict(
+        extra='allow',
+        env_prefix='TEMPLATES_'
+    )
+
+class PdfConfig(BaseSettings):
+    max_workers: int = Field(4, alias='PDF_MAX_WORKERS')
+    timeout: float = Field(30, alias='PDF_TIMEOUT')
+
+    model_config = SettingsConfigDict(
+        extra='allow',
+        env_prefix='PDF_'
+    )
+
+class ReceiptConfig(BaseSettings):
+    worker_enabled: bool = Field(True, alias='RECEIPT_WORKER_ENABLED')
+    batch_size: int = Field(10, alias='RECEIPT_BATCH_SIZE')
+    poll_interval: float = Field(1.0, alias='RECEIPT_POLL_INTERVAL')
+    lease: float = Field(120, alias='RECEIPT_LEASE')
+    max_attempts: int = Field(8, alias='RECEIPT_MAX_ATTEMPTS')
+    retry_backoff: float = Field(2.0, alias='RECEIPT_RETRY_BACKOFF')
+    retry_backoff_max: float = Field(300, alias='RECEIPT_RETRY_BACKOFF_MAX')
+
+    model_config = SettingsConfigDict(
+        extra='allow',
+        env_prefix='RECEIPT_'
+    )
+
 class Settings(BaseSettings):
     database_url: str = Field(..., alias='PAYMENT_DATABASE_URL')
     redis_url: str = Field(..., alias='REDIS_URL')
     yookassa: YookassaConfig = Field(default_factory=YookassaConfig)
     kafka: KafkaConfig = Field(default_factory=KafkaConfig)
+    templates: TemplatesConfig = Field(default_factory=TemplatesConfig)
+    pdf: PdfConfig = Field(default_factory=PdfConfig)
+    receipt: ReceiptConfig = Field(default_factory=ReceiptConfig)
     s3_conf: S3Config = Field(default_factory=S3Config)
 
     model_config = SettingsConfigDict(
@@ -1,16 +1,34 @@
 from src.core.database.base import Base
-from sqlalchemy import String, DateTime, Float
+from sqlalchemy import String, DateTime, Float, Integer, Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 from pydantic import EmailStr
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
+from typing import Optional
+
+# Этапы фоновой обработки чека: pending -> uploaded -> sent, либо failed
+# после RECEIPT_MAX_ATTEMPTS неудачных попыток
+RECEIPT_PENDING = 'pending'
+RECEIPT_UPLOADED = 'uploaded'
+RECEIPT_SENT = 'sent'
+RECEIPT_FAILED = 'failed'
 
 class PaymentsTable(Base):
     __tablename__ = 'payments'
+    __table_args__ = (
+        Index(
+            'ix_payments_receipt_queue',
+            'receipt_next_attempt_at',
+            postgresql_where=text("receipt_status IN ('pending', 'uploaded')"),
+        ),
+    )
 
     user_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     order_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     number_order: Mapped[str] = mapped_column(String, nullable=False)
-    order_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    order_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), nullable=False, unique=True)
     amount: Mapped[float] = mapped_column(Float, nullable=False)
-    email: Mapped[EmailStr] = mapped_column(String, nullable=False)
\ No newline at end of file
+    email: Mapped[EmailStr] = mapped_column(String, nullable=False)
+    receipt_status: Mapped[str] = mapped_column(String, nullable=False, default=RECEIPT_PENDING)
+    receipt_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    receipt_next_attempt_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import EmailStr
+from typing import Optional
 from uuid import UUID
 from datetime import datetime
 
@@ -9,4 +10,10 @@ class PaymentAbstract(ABC):
     async def add_payment(self, session: AsyncSession, user_id: UUID, order_date: datetime, email: EmailStr, number_order: str, amount: float, order_id: UUID): ...
 
     @abstractmethod
-    async def get_payments(self, session: AsyncSession, user_id: UUID): ...
\ No newline at end of file
+    async def get_payments(self, session: AsyncSession, user_id: UUID): ...
+
+    @abstractmethod
+    async def claim_receipt_jobs(self, session: AsyncSession, limit: int, lease: float): ...
+
+    @abstractmethod
+    async def update_receipt(self, session: AsyncSession, order_id: UUID, status: str, attempts: Optional[int] = None, next_attempt_at: Optional[datetime] = None): ...
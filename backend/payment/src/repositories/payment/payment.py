@@ -1,15 +1,21 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Optional
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import select, update, or_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import EmailStr
-from src.core.database.models import PaymentsTable
+from src.core.database.models import PaymentsTable, RECEIPT_PENDING, RECEIPT_UPLOADED
 from src.core.schemas import PaymentModel
 from src.repositories.payment.base import PaymentAbstract
 
 class PaymentRepository(PaymentAbstract):
-    async def add_payment(self, session: AsyncSession, user_id: UUID, order_date: datetime, email: EmailStr, number_order: str, amount: float, order_id: UUID):
-        """Создает запись о платеже в базе данных."""
+    async def add_payment(self, session: AsyncSession, user_id: UUID, order_date: datetime, email: EmailStr, number_order: str, amount: float, order_id: UUID) -> bool:
+        """
+        Создает запись о платеже и ставит чек в очередь одним INSERT.
+        Повторный вызов с тем же order_id ничего не делает; возвращает
+        True, если платеж был записан этим вызовом.
+        """
         if isinstance(order_date, str):
             order_date = datetime.fromisoformat(order_date)
 
@@ -25,22 +31,75 @@ class PaymentRepository(PaymentAbstract):
             email=email
         )
 
-        order = PaymentsTable(
-            user_id=order_schema.user_id,
-            order_date=order_schema.order_date,
-            number_order=order_schema.number_order,
-            amount=order_schema.amount,
-            order_id=order_schema.order_id,
-            email=order_schema.email
+        result = await session.execute(
+            insert(PaymentsTable)
+            .values(
+                **order_schema.model_dump(),
+                receipt_status=RECEIPT_PENDING,
+                receipt_attempts=0,
+            )
+            .on_conflict_do_nothing(index_elements=[PaymentsTable.order_id])
+            .returning(PaymentsTable.id)
         )
-
-        session.add(order)
+        created = result.scalar_one_or_none() is not None
         await session.commit()
-        await session.refresh(order)
 
-        return order
+        return created
 
     async def get_payments(self, session: AsyncSession, user_id: UUID):
         """Получает все платежи пользователя."""
         result = await session.execute(select(PaymentsTable).where(PaymentsTable.user_id == user_id))
         return result.scalars().all()
+
+    async def claim_receipt_jobs(self, session: AsyncSession, limit: int, lease: float):
+        """
+        Забирает до limit чеков, ожидающих обработки, и одним UPDATE
+        откладывает их следующую попытку на lease секунд, чтобы другие
+        обработчики их не взяли. Заблокированные строки пропускаются
+        (SKIP LOCKED).
+        """
+        now = datetime.utcnow()
+        due = (
+            select(PaymentsTable.id)
+            .where(
+                PaymentsTable.receipt_status.in_((RECEIPT_PENDING, RECEIPT_UPLOADED)),
+                or_(
+                    PaymentsTable.receipt_next_attempt_at.is_(None),
+                    PaymentsTable.receipt_next_attempt_at <= now,
+                ),
+            )
+            .order_by(PaymentsTable.receipt_next_attempt_at.nulls_first())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await session.execute(
+            update(PaymentsTable)
+            .where(PaymentsTable.id.in_(due.scalar_subquery()))
+            .values(receipt_next_attempt_at=now + timedelta(seconds=lease))
+            .returning(
+                PaymentsTable.user_id,
+                PaymentsTable.order_date,
+                PaymentsTable.number_order,
+                PaymentsTable.order_id,
+                PaymentsTable.amount,
+                PaymentsTable.email,
+                PaymentsTable.receipt_status,
+                PaymentsTable.receipt_attempts,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        jobs = result.all()
+        await session.commit()
+
+        return jobs
+
+    async def update_receipt(self, session: AsyncSession, order_id: UUID, status: str, attempts: Optional[int] = None, next_attempt_at: Optional[datetime] = None):
+        """Сохраняет этап обработки чека и время следующей попытки."""
+        values = {"receipt_status": status, "receipt_next_attempt_at": next_attempt_at}
+        if attempts is not None:
+            values["receipt_attempts"] = attempts
+
+        await session.execute(
+            update(PaymentsTable).where(PaymentsTable.order_id == order_id).values(**values)
+        )
+        await session.commit()
@@ -1,4 +1,3 @@
-from contextlib import asynccontextmanager
 from uuid import UUID, uuid4
 from random import randint
 from loguru import logger
@@ -7,10 +6,8 @@ from fastapi import HTTPException, status
 from pydantic import EmailStr
 from src.core.config import get_settings
 from src.core.database.base import async_session
-from src.core.kafka.producer.producer import KafkaProducer
 from src.core.redis.base import RedisService
 from src.repositories.s3.s3 import S3Repository
-from src.utils.html_to_pdf import html_to_pdf_reportlab
 from src.repositories.payment.payment import PaymentRepository
 
 settings = get_settings()
@@ -20,16 +17,6 @@ Configuration.secret_key = settings.yookassa.secret_key
 s3_repository = S3Repository()
 payment_repository = PaymentRepository()
 
-@asynccontextmanager
-async def kafka_producer():
-    """Контекстный менеджер для работы с Kafka."""
-    producer = KafkaProducer()
-    try:
-        await producer.start()
-        yield producer
-    finally:
-        await producer.stop()
-
 class PaymentService:
     @staticmethod
     async def create_payment(amount_value: float, redirect_url: str):
@@ -85,46 +72,47 @@ class PaymentService:
 
     @staticmethod
     async def success_payment(user_id: UUID, redis: RedisService):
-        """Обрабатывает успешный платеж: сохраняет данные в БД, загружает чек в S3 и отправляет сообщение в Kafka."""
-        async with kafka_producer() as producer:
-            try:
-                payment_data = await redis.get(key=str(user_id))
-                if not payment_data:
-                    logger.warning(f"Не найдены платежные данные в кэше с user_id: {user_id}")
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND,
-                        detail="Платежные данные не найдены в кэше"
-                    )
-
-                async with async_session() as session:
-                    await payment_repository.add_payment(
-                        session,
-                        user_id=user_id,
-                        order_date=payment_data["order_date"],
-                        number_order=payment_data["number_order"],
-                        amount=payment_data["amount"],
-                        order_id=payment_data["order_id"],
-                        email=payment_data["email"],
-                    )
-
-                pdf_path = html_to_pdf_reportlab(
-                    order_number=payment_data["number_order"],
-                    amount_value=payment_data["amount"],
-                    payment_date=payment_data["order_date"],
+        """
+        Обрабатывает успешный платеж: сохраняет его в БД вместе с заданием на
+        чек и сразу отвечает. PDF, загрузку в S3 и сообщение в Kafka выполняет
+        фоновый ReceiptWorker. Повторный вызов с тем же order_id безопасен.
+        """
+        try:
+            payment_data = await redis.get(key=str(user_id))
+            if not payment_data:
+                logger.warning(f"Не найдены платежные данные в кэше с user_id: {user_id}")
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Платежные данные не найдены в кэше"
                 )
-                await s3_repository.upload_to_s3(file_bytes=pdf_path, s3_path=f"receipts/{payment_data['number_order']}.pdf")
-                await redis.delete(key=str(user_id))
-                await producer.send_json(topic="payment", value={"data": payment_data})
-                logger.info(f"Платежные данные пользователя с user_id {user_id} успешно обработаны и удалены из кэша")
-                return {"message": "Оплата успешно завершена"}
 
-            except Exception as e:
-                logger.error(f"Ошибка при обработке платежа: {e}")
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Ошибка при обработке платежа"
+            async with async_session() as session:
+                created = await payment_repository.add_payment(
+                    session,
+                    user_id=user_id,
+                    order_date=payment_data["order_date"],
+                    number_order=payment_data["number_order"],
+                    amount=payment_data["amount"],
+                    order_id=payment_data["order_id"],
+                    email=payment_data["email"],
                 )
 
+            if not created:
+                logger.info(f"Платеж {payment_data['order_id']} уже был сохранен ранее")
+
+            await redis.delete(key=str(user_id))
+            logger.info(f"Платеж пользователя с user_id {user_id} сохранен, чек поставлен в очередь")
+            return {"message": "Оплата успешно завершена"}
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Ошибка при обработке платежа: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Ошибка при обработке платежа"
+            )
+
     @staticmethod
     async def get_payments(user_id: UUID):
         """Получает платежи пользователя и генерирует ссылки на чеки."""
@@ -0,0 +1,132 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Optional
+from loguru import logger
+from src.core.config import get_settings
+from src.core.database.base import async_session
+from src.core.database.models import RECEIPT_FAILED, RECEIPT_PENDING, RECEIPT_SENT, RECEIPT_UPLOADED
+from src.core.kafka.producer.producer import kafka_producer
+from src.repositories.payment.payment import PaymentRepository
+from src.repositories.s3.s3 import S3Repository
+from src.utils.html_to_pdf import html_to_pdf_async
+
+settings = get_settings()
+
+s3_repository = S3Repository()
+payment_repository = PaymentRepository()
+
+
+class ReceiptWorker:
+    """
+    Фоновый обработчик чеков. Очередь — сами записи payments: success-payment
+    только вставляет платеж со статусом pending, а обработчик забирает
+    такие записи пачками, формирует PDF, загружает его в S3 (uploaded) и
+    публикует сообщение в топик payment (sent). Каждый этап сохраняется,
+    поэтому повтор после ошибки продолжается с незавершенного этапа;
+    повторная загрузка перезаписывает тот же ключ receipts/<номер>.pdf.
+    Несколько обработчиков могут работать параллельно: записи забираются
+    с SKIP LOCKED и арендой RECEIPT_LEASE секунд.
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self.processed = 0
+        self.failed = 0
+
+    async def start(self):
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info("Receipt worker started.")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        logger.info("Receipt worker stopped.")
+
+    async def _run(self):
+        while True:
+            try:
+                async with async_session() as session:
+                    jobs = await payment_repository.claim_receipt_jobs(
+                        session,
+                        limit=settings.receipt.batch_size,
+                        lease=settings.receipt.lease,
+                    )
+                if jobs:
+                    await asyncio.gather(*(self._handle(job) for job in jobs))
+                else:
+                    await asyncio.sleep(settings.receipt.poll_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Ошибка обработчика чеков: {e}")
+                await asyncio.sleep(settings.receipt.poll_interval)
+
+    async def _handle(self, job):
+        status = job.receipt_status
+        try:
+            if status == RECEIPT_PENDING:
+                pdf_bytes = await html_to_pdf_async(
+                    order_number=job.number_order,
+                    amount_value=job.amount,
+                    payment_date=job.order_date,
+                )
+                await s3_repository.upload_to_s3(file_bytes=pdf_bytes, s3_path=f"receipts/{job.number_order}.pdf")
+                status = RECEIPT_UPLOADED
+                await self._save(job.order_id, status)
+
+            await kafka_producer.send_json(topic="payment", value={"data": self._message(job)})
+            await self._save(job.order_id, RECEIPT_SENT)
+        except Exception as e:
+            await self._retry(job, status, e)
+            return
+
+        self.processed += 1
+        logger.info(f"Чек по заказу {job.order_id} сформирован и отправлен")
+
+    async def _retry(self, job, status: str, error: Exception):
+        attempts = job.receipt_attempts + 1
+        self.failed += 1
+
+        if attempts >= settings.receipt.max_attempts:
+            logger.error(f"Чек по заказу {job.order_id} не обработан за {attempts} попыток: {error}")
+            await self._save(job.order_id, RECEIPT_FAILED, attempts)
+            return
+
+        delay = min(
+            settings.receipt.retry_backoff * 2 ** (attempts - 1),
+            settings.receipt.retry_backoff_max,
+        )
+        logger.warning(f"Ошибка обработки чека по заказу {job.order_id}, повтор через {delay:.0f} с: {error}")
+        await self._save(job.order_id, status, attempts, datetime.utcnow() + timedelta(seconds=delay))
+
+    @staticmethod
+    async def _save(order_id, status: str, attempts: Optional[int] = None, next_attempt_at: Optional[datetime] = None):
+        async with async_session() as session:
+            await payment_repository.update_receipt(
+                session,
+                order_id=order_id,
+                status=status,
+                attempts=attempts,
+                next_attempt_at=next_attempt_at,
+            )
+
+    @staticmethod
+    def _message(job) -> dict:
+        return {
+            "number_order": job.number_order,
+            "order_date": job.order_date.isoformat(),
+            "order_id": str(job.order_id),
+            "user_id": str(job.user_id),
+            "email": job.email,
+            "amount": job.amount,
+        }
+
+
+receipt_worker = ReceiptWorker()
@@ -1,7 +1,11 @@
-from jinja2 import Environment, FileSystemLoader
+import asyncio
 import shutil
 import pdfkit
 from datetime import datetime
+from src.core.config import get_settings
+from src.core.templates.base import template_registry
+
+settings = get_settings()
 
 wkhtmltopdf_path = shutil.which("wkhtmltopdf") or r"C:\Program Files\wkhtmltopdf\bin\wkhtmltopdf.exe" or r"usr/bin/wkhtmltopdf"
 
@@ -10,27 +14,70 @@ if not wkhtmltopdf_path:
 
 config = pdfkit.configuration(wkhtmltopdf=wkhtmltopdf_path)
 
-def html_to_pdf_reportlab(order_number: list[str], amount_value: float, payment_date: list[str]) -> bytes:
-    """
-    Генерирует PDF из HTML-шаблона и возвращает содержимое PDF в виде байтов.
-    """
+# Одновременно работающих процессов wkhtmltopdf не больше pdf.max_workers
+pdf_semaphore = asyncio.Semaphore(settings.pdf.max_workers)
+
+
+def render_receipt_html(order_number: list[str], amount_value: float, payment_date: list[str]) -> str:
     if isinstance(payment_date, str):
         order_date = datetime.fromisoformat(payment_date)
 
         if order_date.tzinfo is not None:
             payment_date = order_date.replace(tzinfo=None)
 
-    env = Environment(loader=FileSystemLoader("templates"))
-    template = env.get_template("payment-receipt.html")
-
     context = {
         "order_number": order_number,
         "amountValue": amount_value,
         "paymentDate": payment_date,
     }
 
-    html_content = template.render(context)
+    return template_registry.render("payment-receipt.html", context)
+
+
+def html_to_pdf_reportlab(order_number: list[str], amount_value: float, payment_date: list[str]) -> bytes:
+    """
+    Генерирует PDF из HTML-шаблона и возвращает содержимое PDF в виде байтов.
+    Блокирует вызывающий поток на время работы wkhtmltopdf; в async-коде
+    используйте html_to_pdf_async.
+    """
+    html_content = render_receipt_html(order_number, amount_value, payment_date)
 
     pdf_bytes = pdfkit.from_string(html_content, output_path=None, configuration=config)
 
-    return pdf_bytes
\ No newline at end of file
+    return pdf_bytes
+
+
+async def html_to_pdf_async(order_number: list[str], amount_value: float, payment_date: list[str]) -> bytes:
+    """
+    Генерирует PDF чека, не блокируя event loop: wkhtmltopdf запускается
+    асинхронным подпроцессом, число одновременных процессов ограничено
+    PDF_MAX_WORKERS, а каждый ограничен PDF_TIMEOUT секундами.
+    """
+    html_content = render_receipt_html(order_number, amount_value, payment_date)
+    command = pdfkit.PDFKit(html_content, "string", configuration=config).command()
+
+    async with pdf_semaphore:
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=config.environ,
+        )
+        try:
+            pdf_bytes, stderr = await asyncio.wait_for(
+                process.communicate(html_content.encode("utf-8")),
+                settings.pdf.timeout,
+            )
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+
+    if process.returncode != 0 or not pdf_bytes:
+        raise IOError(
+            f"wkhtmltopdf завершился с кодом {process.returncode}: "
+            f"{stderr.decode('utf-8', errors='replace')}"
+        )
+
+    return pdf_bytes
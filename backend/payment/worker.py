@@ -0,0 +1,33 @@
+"""
+Отдельный процесс обработчика чеков, без HTTP API. Позволяет
+масштабировать обработку чеков независимо от API: у реплик API
+выставляется RECEIPT_WORKER_ENABLED=false, а обработчики запускаются
+командой make worker в нужном количестве.
+"""
+
+import asyncio
+import signal
+from loguru import logger
+from src.core.kafka.producer.producer import kafka_producer
+from src.core.templates.base import template_registry
+from src.service.worker import receipt_worker
+
+
+async def main():
+    template_registry.load()
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await receipt_worker.start()
+    try:
+        await stop.wait()
+    finally:
+        await receipt_worker.stop()
+        await kafka_producer.stop()
+        logger.info("Receipt worker process end...")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
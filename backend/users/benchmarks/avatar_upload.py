@@ -0,0 +1,115 @@
+"""
+Бенчмарк /users/upload-image: прежняя загрузка (файл целиком в память,
+libmagic по всему буферу, один put_object) против потоковой загрузки
+UserService.upload_profile_image с multipart upload и WebP-миниатюрами.
+
+Генерирует фотографию --width x --height в JPEG, загружает ее --runs раз
+каждым способом для случайного user_id и печатает медиану времени, пик
+памяти Python (tracemalloc) и размер того, что получит клиент для аватарки
+в комментарии. Затем удаляет загруженные объекты. Нужны S3_*.
+
+Запуск: uv run python -m benchmarks.avatar_upload [--width 4000] [--height 3000] [--runs 5]
+"""
+
+import argparse
+import asyncio
+import io
+import mimetypes
+import statistics
+import time
+import tracemalloc
+from tempfile import SpooledTemporaryFile
+from uuid import uuid4
+import magic
+from PIL import Image
+from starlette.datastructures import UploadFile
+from src.core.config import get_settings
+from src.core.redis.base import close_redis
+from src.core.s3.base import s3_client_pool
+from src.core.thumbnails import thumbnail_executor
+from src.repositories.s3.s3 import S3Repository, thumbnail_key
+from src.service.users import UserService
+
+settings = get_settings()
+s3_repository = S3Repository()
+
+
+def make_photo(width: int, height: int) -> bytes:
+    noise = Image.effect_noise((width, height), 80)
+    gradient = Image.linear_gradient("L").resize((width, height))
+    image = Image.merge("RGB", (noise, gradient, gradient.transpose(Image.Transpose.ROTATE_180)))
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=92)
+    return buffer.getvalue()
+
+
+def make_upload(photo: bytes) -> UploadFile:
+    # Как у starlette: до 1 МБ в памяти, дальше во временном файле на диске
+    spool = SpooledTemporaryFile(max_size=1024 * 1024)
+    spool.write(photo)
+    spool.seek(0)
+    return UploadFile(file=spool, filename="photo")
+
+
+async def upload_in_memory(user_id, uploaded_file: UploadFile) -> str:
+    file_bytes = await uploaded_file.read()
+    mime_type = magic.from_buffer(file_bytes, mime=True)
+    file_key = f"userimage/{user_id}{mimetypes.guess_extension(mime_type)}"
+    await s3_repository.put_object(file_key, file_bytes, mime_type)
+    return file_key
+
+
+async def measure(name: str, upload, photo: bytes, user_id, runs: int):
+    samples = []
+    peaks = []
+    for _ in range(runs):
+        uploaded_file = make_upload(photo)
+        tracemalloc.start()
+        started = time.perf_counter()
+        await upload(user_id, uploaded_file)
+        samples.append((time.perf_counter() - started) * 1000)
+        peaks.append(tracemalloc.get_traced_memory()[1] / 1024 / 1024)
+        tracemalloc.stop()
+        await uploaded_file.close()
+
+    print(f"{name:<20}{statistics.median(samples):>10.0f} мс{max(peaks):>10.1f} МБ пик")
+
+
+async def object_size(file_key: str) -> int:
+    async with s3_client_pool.client() as client:
+        response = await client.head_object(Bucket=settings.s3_conf.bucket_name, Key=file_key)
+    return response["ContentLength"]
+
+
+async def main(width: int, height: int, runs: int):
+    photo = make_photo(width, height)
+    user_id = uuid4()
+    print(f"Фото {width}x{height}: {len(photo) / 1024 / 1024:.1f} МБ")
+
+    keys = [thumbnail_key(user_id, size) for size in settings.avatar.thumbnail_sizes]
+    try:
+        # Прогрев пула процессов и S3 клиента
+        await UserService.upload_profile_image(user_id, make_upload(photo))
+
+        await measure("в памяти", upload_in_memory, photo, user_id, runs)
+        await measure("потоковая", UserService.upload_profile_image, photo, user_id, runs)
+
+        keys.extend(await s3_repository.list_profile_image_keys(str(user_id)))
+        print(f"{'аватарка в комментарии':<24}{'байт':>10}")
+        print(f"{'оригинал':<24}{len(photo):>10}")
+        for size in sorted(settings.avatar.thumbnail_sizes):
+            print(f"{f'WebP {size} px':<24}{await object_size(thumbnail_key(user_id, size)):>10}")
+    finally:
+        await s3_repository.delete_objects(keys)
+        await s3_client_pool.stop()
+        await close_redis()
+        thumbnail_executor.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--width", type=int, default=4000)
+    parser.add_argument("--height", type=int, default=3000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.width, args.height, args.runs))
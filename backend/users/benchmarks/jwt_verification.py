@@ -0,0 +1,59 @@
+"""
+Микробенчмарк проверки access-токенов: jwt.decode с PEM-строкой (как
+раньше), jwt.decode с заранее разобранным ключом и
+TokenService.validate_access_token с кэшем проверенных токенов.
+
+Проверки идут по --tokens разным токенам по кругу, как от разных
+пользователей; результат — проверок в секунду.
+
+Запуск: uv run python -m benchmarks.jwt_verification [--verifications 20000] [--tokens 100]
+"""
+
+import argparse
+import asyncio
+import time
+import jwt
+from src.core.config import get_settings
+from src.core.token_cache import access_token_cache
+from src.service.tokens import TokenService, public_key
+
+settings = get_settings()
+
+
+async def measure(name: str, verify, tokens: list[str], verifications: int):
+    started = time.perf_counter()
+    for i in range(verifications):
+        assert await verify(tokens[i % len(tokens)])
+    elapsed = time.perf_counter() - started
+    print(f"{name:<32}{verifications / elapsed:>14.0f} проверок/с")
+
+
+async def main(verifications: int, tokens_count: int):
+    tokens = [
+        (await TokenService.generate_tokens({"user_id": str(i), "username": f"user-{i}"}))["access_token"]
+        for i in range(tokens_count)
+    ]
+    public_key_pem = settings.jwt_keys.get_public_key()
+    try:
+        jwt.decode(tokens[0], public_key, algorithms=["RS256"])
+    except jwt.InvalidSignatureError:
+        raise SystemExit("Ключи из src/core/jwt_key не составляют пару: подпись не проверяется")
+
+    async def decode_pem(token: str):
+        return jwt.decode(token, public_key_pem, algorithms=["RS256"])
+
+    async def decode_prepared(token: str):
+        return jwt.decode(token, public_key, algorithms=["RS256"])
+
+    await measure("jwt.decode, PEM-строка", decode_pem, tokens, verifications)
+    await measure("jwt.decode, разобранный ключ", decode_prepared, tokens, verifications)
+    access_token_cache.clear()
+    await measure("validate_access_token (кэш)", TokenService.validate_access_token, tokens, verifications)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--verifications", type=int, default=20_000)
+    parser.add_argument("--tokens", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.verifications, args.tokens))
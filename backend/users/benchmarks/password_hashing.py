@@ -0,0 +1,64 @@
+"""
+Бенчмарк проверки паролей при входе: bcrypt.checkpw прямо в event loop
+(как раньше) против AuthRequest.verify_password в пуле потоков.
+
+Запускает --logins одновременных проверок пароля (основная CPU-нагрузка
+входа) и замеряет входы в секунду и максимальную задержку event loop —
+насколько опаздывает тикающий каждые 10 мс heartbeat, то есть сколько
+ждали бы остальные запросы воркера.
+
+Запуск: uv run python -m benchmarks.password_hashing [--logins 64] [--rounds 12]
+"""
+
+import argparse
+import asyncio
+import time
+import bcrypt
+from src.core.database.requests import AuthRequest, password_executor
+
+HEARTBEAT = 0.01
+PASSWORD = "Bench-Password-123"
+
+
+async def heartbeat(lags: list[float]):
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(HEARTBEAT)
+        lags.append(time.perf_counter() - started - HEARTBEAT)
+
+
+async def login_inline(hashed: str):
+    assert bcrypt.checkpw(PASSWORD.encode("utf-8"), hashed.encode("utf-8"))
+
+
+async def login_executor(hashed: str):
+    assert await AuthRequest.verify_password(PASSWORD, hashed)
+
+
+async def measure(name: str, handler, hashed: str, logins: int):
+    lags: list[float] = []
+    ticker = asyncio.create_task(heartbeat(lags))
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    await asyncio.gather(*(handler(hashed) for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    ticker.cancel()
+    max_lag = max(lags, default=elapsed) * 1000
+    print(f"{name:<28}{logins / elapsed:>12.1f} входов/с{max_lag:>16.0f} мс лаг")
+
+
+async def main(logins: int, rounds: int):
+    hashed = bcrypt.hashpw(PASSWORD.encode("utf-8"), bcrypt.gensalt(rounds=rounds)).decode("utf-8")
+    print(f"bcrypt rounds={rounds}, потоков в пуле: {password_executor._max_workers}")
+
+    await measure("checkpw в event loop", login_inline, hashed, logins)
+    await measure("verify_password (пул)", login_executor, hashed, logins)
+    password_executor.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=12)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.rounds))
@@ -0,0 +1,92 @@
+"""
+Бенчмарк /users/profile: UserService.get_user_profile без кэша профилей
+(Postgres + list_objects_v2 на каждый запрос) и с кэшем в Redis.
+
+Создает временного пользователя bench-profile-* с аватаркой в S3,
+выполняет --requests запросов профиля с --concurrency одновременными и
+печатает p50/p99 задержки и запросы в секунду, затем удаляет пользователя,
+аватарку и запись кэша. Нужны USERS_DATABASE_URL, REDIS_URL и S3_*.
+
+Запуск: uv run python -m benchmarks.profile_cache [--requests 2000] [--concurrency 20]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from uuid import uuid4
+from sqlalchemy import delete
+from src.core.config import get_settings
+from src.core.database.base import async_session, engine
+from src.core.database.models import UsersTable
+from src.core.redis.base import close_redis
+from src.core.s3.base import s3_client_pool
+from src.repositories.auth.auth import AuthRepository
+from src.repositories.s3.s3 import S3Repository
+from src.repositories.users.cache import profile_cache
+from src.service.users import UserService
+
+settings = get_settings()
+
+# PNG 1x1
+AVATAR = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000001e221bc330000000049454e44ae426082"
+)
+
+
+async def measure(name: str, user_id, requests: int, concurrency: int):
+    await UserService.get_user_profile(user_id=user_id)  # прогрев
+    semaphore = asyncio.Semaphore(concurrency)
+    samples = []
+
+    async def request():
+        async with semaphore:
+            started = time.perf_counter()
+            profile = await UserService.get_user_profile(user_id=user_id)
+            samples.append((time.perf_counter() - started) * 1000)
+            assert profile.userImage
+
+    started = time.perf_counter()
+    await asyncio.gather(*(request() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    p50 = statistics.median(samples)
+    p99 = statistics.quantiles(samples, n=100)[98]
+    print(f"{name:<20}{p50:>10.2f} мс p50{p99:>10.2f} мс p99{requests / elapsed:>12.0f} запросов/с")
+
+
+async def main(requests: int, concurrency: int):
+    s3_repository = S3Repository()
+    user_id = await AuthRepository().create_user(
+        f"bench-profile-{uuid4()}", f"bench-profile-{uuid4()}@filmflood.local", "-"
+    )
+
+    image_key = f"userimage/{user_id}.png"
+    await s3_repository.put_object(image_key, AVATAR, "image/png")
+    try:
+        ttl = settings.profile_cache.ttl
+        settings.profile_cache.ttl = 0
+        await measure("без кэша", user_id, requests, concurrency)
+
+        settings.profile_cache.ttl = ttl
+        await profile_cache.invalidate(user_id)
+        await measure("кэш профилей", user_id, requests, concurrency)
+    finally:
+        await profile_cache.invalidate(user_id)
+        async with s3_client_pool.client() as client:
+            await client.delete_object(Bucket=settings.s3_conf.bucket_name, Key=image_key)
+        async with async_session() as session:
+            await session.execute(delete(UsersTable).where(UsersTable.id == user_id))
+            await session.commit()
+        await s3_client_pool.stop()
+        await close_redis()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,134 @@
+"""
+Бенчмарк поиска и отзыва refresh-токенов на растущей таблице: прежняя
+схема (полный JWT в неиндексированном refresh_token) против token_hash —
+SHA-256 с уникальным индексом.
+
+Создает отдельную схему bench_token_lookup в базе USERS_DATABASE_URL,
+последовательно дозаполняет обе таблицы до каждого размера из --sizes
+синтетическими токенами длиной ~640 символов и замеряет медиану
+поиска user_id по токену (refresh) и DELETE ... RETURNING user_id (logout,
+откатывается, чтобы таблица не уменьшалась). В конце схема удаляется.
+
+Запуск: uv run python -m benchmarks.token_lookup [--sizes 10000,100000,1000000] [--runs 20]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import random
+import statistics
+import time
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.core.config import get_settings
+
+settings = get_settings()
+
+SCHEMA = "bench_token_lookup"
+
+DDL = [
+    f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE",
+    f"CREATE SCHEMA {SCHEMA}",
+    f"""CREATE TABLE {SCHEMA}.tokens_legacy (
+        id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+        refresh_token varchar NOT NULL,
+        user_id uuid NOT NULL
+    )""",
+    f"""CREATE TABLE {SCHEMA}.tokens (
+        id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+        token_hash varchar(64) NOT NULL UNIQUE,
+        user_id uuid NOT NULL UNIQUE
+    )""",
+]
+
+# Токен n: 20 md5 подряд, ~640 символов, как у RS256 JWT
+TOKEN_SQL = "(SELECT string_agg(md5(n::text || '.' || i::text), '') FROM generate_series(1, 20) AS i)"
+
+SEED = [
+    f"""INSERT INTO {SCHEMA}.tokens_legacy (refresh_token, user_id)
+        SELECT {TOKEN_SQL}, gen_random_uuid()
+        FROM generate_series(CAST(:start AS integer), CAST(:stop AS integer)) AS n""",
+    f"""INSERT INTO {SCHEMA}.tokens (token_hash, user_id)
+        SELECT encode(sha256(convert_to({TOKEN_SQL}, 'UTF8')), 'hex'), gen_random_uuid()
+        FROM generate_series(CAST(:start AS integer), CAST(:stop AS integer)) AS n""",
+]
+
+QUERIES = {
+    "refresh, refresh_token": (
+        f"SELECT user_id FROM {SCHEMA}.tokens_legacy WHERE refresh_token = :token",
+        False,
+    ),
+    "refresh, token_hash": (
+        f"SELECT user_id FROM {SCHEMA}.tokens WHERE token_hash = :digest",
+        True,
+    ),
+    "logout, refresh_token": (
+        f"DELETE FROM {SCHEMA}.tokens_legacy WHERE refresh_token = :token RETURNING user_id",
+        False,
+    ),
+    "logout, token_hash": (
+        f"DELETE FROM {SCHEMA}.tokens WHERE token_hash = :digest RETURNING user_id",
+        True,
+    ),
+}
+
+
+def token(n: int) -> str:
+    return "".join(hashlib.md5(f"{n}.{i}".encode()).hexdigest() for i in range(1, 21))
+
+
+async def measure(engine, size: int, runs: int) -> dict:
+    timings = {}
+    for name, (query, by_digest) in QUERIES.items():
+        samples = []
+        for _ in range(runs + 1):
+            value = token(random.randint(1, size))
+            params = (
+                {"digest": hashlib.sha256(value.encode("utf-8")).hexdigest()}
+                if by_digest
+                else {"token": value}
+            )
+            async with engine.connect() as conn:
+                started = time.perf_counter()
+                user_id = (await conn.execute(text(query), params)).scalar_one_or_none()
+                samples.append((time.perf_counter() - started) * 1000)
+                await conn.rollback()
+            assert user_id is not None, f"{name}: токен не найден"
+        timings[name] = statistics.median(samples[1:])  # первый замер — прогрев
+    return timings
+
+
+async def main(sizes: list[int], runs: int):
+    engine = create_async_engine(settings.database_url)
+    try:
+        async with engine.begin() as conn:
+            for statement in DDL:
+                await conn.execute(text(statement))
+
+        results = {}
+        seeded = 0
+        for size in sorted(sizes):
+            print(f"Заполнение таблиц до {size} токенов...")
+            async with engine.begin() as conn:
+                for statement in SEED:
+                    await conn.execute(text(statement), {"start": seeded + 1, "stop": size})
+                await conn.execute(text(f"ANALYZE {SCHEMA}.tokens_legacy"))
+                await conn.execute(text(f"ANALYZE {SCHEMA}.tokens"))
+            seeded = size
+            results[size] = await measure(engine, size, runs)
+
+        print(f"{'запрос, мс':<26}" + "".join(f"{size:>14}" for size in results))
+        for name in QUERIES:
+            print(f"{name:<26}" + "".join(f"{results[size][name]:>14.2f}" for size in results))
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main([int(size) for size in args.sizes.split(",")], args.runs))
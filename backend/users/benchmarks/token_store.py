@@ -0,0 +1,119 @@
+"""
+Бенчмарк сохранения refresh-токенов при входе: PostgresTokenStore
+(SELECT/commit/refresh в двух сессиях) против RedisTokenStore (один
+скрипт Lua на вход).
+
+Выполняет --logins входов с --concurrency одновременными запросами: у
+каждого входа свой токен, пользователи повторяются (--users), так что новый
+токен заменяет предыдущий, как при реальных повторных входах. В конце все
+токены отзываются, как при выходе. Бенчмарк Redis использует REDIS_URL;
+Postgres (--postgres) — USERS_DATABASE_URL, создает временных пользователей
+bench-token-* и удаляет их после замера.
+
+Запуск: uv run python -m benchmarks.token_store [--logins 5000] [--users 500] [--concurrency 50] [--postgres]
+"""
+
+import argparse
+import asyncio
+import secrets
+import time
+from uuid import UUID, uuid4
+from sqlalchemy import delete
+from src.core.database.base import async_session
+from src.core.database.models import TokensTable, UsersTable
+from src.core.redis.base import close_redis
+from src.repositories.tokens.base import AbstractTokenStore
+from src.repositories.tokens.postgres import PostgresTokenStore
+from src.repositories.tokens.redis import RedisTokenStore
+
+TTL = 14 * 24 * 60 * 60
+
+
+async def run(store: AbstractTokenStore, user_ids: list[UUID], tokens: list[str], concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def login(i: int):
+        async with semaphore:
+            await store.save(user_ids[i % len(user_ids)], tokens[i], TTL)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(login(i) for i in range(len(tokens))))
+    return time.perf_counter() - started
+
+
+async def measure(name: str, store: AbstractTokenStore, user_ids: list[UUID], logins: int, concurrency: int):
+    # Токен примерно того же размера, что и RS256 JWT
+    tokens = [secrets.token_urlsafe(640) for _ in range(logins)]
+    elapsed = await run(store, user_ids, tokens, concurrency)
+    # Журнал входов дописывается до замера выходов, чтобы его очередь не
+    # делила с ними пул соединений Postgres
+    await store.close()
+
+    # Действуют только последние токены каждого пользователя
+    active = tokens[-len(user_ids):]
+    started = time.perf_counter()
+    revoked = await asyncio.gather(*(store.revoke(token) for token in active))
+    revoke_elapsed = time.perf_counter() - started
+    await store.close()
+
+    assert all(revoked), "последний токен каждого пользователя должен отзываться"
+    print(
+        f"{name:<28}{logins / elapsed:>12.0f} входов/с"
+        f"{len(active) / revoke_elapsed:>14.0f} выходов/с"
+    )
+
+
+async def create_bench_users(count: int) -> list[UUID]:
+    async with async_session() as session:
+        users = [
+            UsersTable(
+                username=f"bench-token-{uuid4()}",
+                email=f"bench-token-{uuid4()}@filmflood.local",
+                password="-",
+            )
+            for _ in range(count)
+        ]
+        session.add_all(users)
+        await session.flush()
+        user_ids = [user.id for user in users]
+        await session.commit()
+        return user_ids
+
+
+async def drop_bench_users(user_ids: list[UUID]):
+    async with async_session() as session:
+        await session.execute(delete(TokensTable).where(TokensTable.user_id.in_(user_ids)))
+        await session.execute(delete(UsersTable).where(UsersTable.id.in_(user_ids)))
+        await session.commit()
+
+
+async def main(logins: int, users: int, concurrency: int, postgres: bool):
+    try:
+        if postgres:
+            user_ids = await create_bench_users(users)
+            try:
+                await measure("PostgresTokenStore", PostgresTokenStore(), user_ids, logins, concurrency)
+                await measure(
+                    "RedisTokenStore + журнал",
+                    RedisTokenStore(db_store=PostgresTokenStore(), audit=True),
+                    user_ids,
+                    logins,
+                    concurrency,
+                )
+            finally:
+                await drop_bench_users(user_ids)
+
+        user_ids = [uuid4() for _ in range(users)]
+        await measure("RedisTokenStore", RedisTokenStore(), user_ids, logins, concurrency)
+    finally:
+        await close_redis()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=5000)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--postgres", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.users, args.concurrency, args.postgres))
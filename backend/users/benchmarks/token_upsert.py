@@ -0,0 +1,136 @@
+"""
+Бенчмарк и проверка гонки при сохранении refresh-токена на входе: прежний
+SELECT-then-INSERT/UPDATE против одного INSERT ... ON CONFLICT (user_id)
+DO UPDATE ... RETURNING id.
+
+Создает отдельную схему bench_token_upsert в базе USERS_DATABASE_URL с
+таблицами users и tokens, выполняет --logins одновременных входов (по
+--per-user на пользователя) обоими способами, печатает входы в секунду и
+число лишних строк tokens (дублей по user_id), и удаляет схему. Прежний
+способ выполняется без уникального ограничения, как в исходной схеме.
+
+Запуск: uv run python -m benchmarks.token_upsert [--logins 2000] [--per-user 10] [--concurrency 20]
+"""
+
+import argparse
+import asyncio
+import secrets
+import time
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.core.config import get_settings
+
+settings = get_settings()
+
+SCHEMA = "bench_token_upsert"
+
+DDL = [
+    f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE",
+    f"CREATE SCHEMA {SCHEMA}",
+    f"CREATE TABLE {SCHEMA}.users (id uuid PRIMARY KEY DEFAULT gen_random_uuid())",
+    f"""CREATE TABLE {SCHEMA}.tokens (
+        id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+        refresh_token varchar NOT NULL,
+        user_id uuid NOT NULL REFERENCES {SCHEMA}.users(id)
+    )""",
+]
+
+DUPLICATES = f"SELECT count(*) - count(DISTINCT user_id) FROM {SCHEMA}.tokens"
+
+
+async def login_legacy(engine, user_id, refresh_token: str):
+    """Прежний путь: SELECT, затем INSERT или UPDATE отдельными запросами"""
+    async with engine.connect() as conn:
+        existing = (
+            await conn.execute(
+                text(f"SELECT id FROM {SCHEMA}.tokens WHERE user_id = :user_id"),
+                {"user_id": user_id},
+            )
+        ).first()
+        await conn.commit()
+        if existing:
+            await conn.execute(
+                text(f"UPDATE {SCHEMA}.tokens SET refresh_token = :token WHERE id = :id"),
+                {"token": refresh_token, "id": existing.id},
+            )
+        else:
+            await conn.execute(
+                text(f"INSERT INTO {SCHEMA}.tokens (user_id, refresh_token) VALUES (:user_id, :token)"),
+                {"user_id": user_id, "token": refresh_token},
+            )
+        await conn.commit()
+        await conn.execute(
+            text(f"SELECT id FROM {SCHEMA}.users WHERE id = :user_id"),
+            {"user_id": user_id},
+        )
+        await conn.commit()
+
+
+async def login_upsert(engine, user_id, refresh_token: str):
+    """Новый путь: один INSERT ... ON CONFLICT ... RETURNING id"""
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                f"""INSERT INTO {SCHEMA}.tokens (user_id, refresh_token)
+                VALUES (:user_id, :token)
+                ON CONFLICT (user_id) DO UPDATE SET refresh_token = excluded.refresh_token
+                RETURNING id"""
+            ),
+            {"user_id": user_id, "token": refresh_token},
+        )
+
+
+async def measure(name: str, engine, login, user_ids, per_user: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(user_id):
+        async with semaphore:
+            await login(engine, user_id, secrets.token_urlsafe(640))
+
+    logins = [user_id for user_id in user_ids for _ in range(per_user)]
+    started = time.perf_counter()
+    await asyncio.gather(*(run(user_id) for user_id in logins))
+    elapsed = time.perf_counter() - started
+
+    async with engine.connect() as conn:
+        duplicates = (await conn.execute(text(DUPLICATES))).scalar_one()
+    print(f"{name:<28}{len(logins) / elapsed:>12.0f} входов/с{duplicates:>12} дублей")
+
+
+async def main(logins: int, per_user: int, concurrency: int):
+    engine = create_async_engine(settings.database_url, pool_size=concurrency, max_overflow=0)
+    try:
+        async with engine.begin() as conn:
+            for statement in DDL:
+                await conn.execute(text(statement))
+            result = await conn.execute(
+                text(
+                    f"INSERT INTO {SCHEMA}.users SELECT gen_random_uuid() "
+                    f"FROM generate_series(1, :users) RETURNING id"
+                ),
+                {"users": max(1, logins // per_user)},
+            )
+            user_ids = result.scalars().all()
+
+        await measure("SELECT-then-INSERT/UPDATE", engine, login_legacy, user_ids, per_user, concurrency)
+
+        async with engine.begin() as conn:
+            await conn.execute(text(f"TRUNCATE {SCHEMA}.tokens"))
+            await conn.execute(
+                text(f"ALTER TABLE {SCHEMA}.tokens ADD CONSTRAINT tokens_user_id_key UNIQUE (user_id)")
+            )
+
+        await measure("INSERT ... ON CONFLICT", engine, login_upsert, user_ids, per_user, concurrency)
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=2000)
+    parser.add_argument("--per-user", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.per_user, args.concurrency))
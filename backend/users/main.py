@@ -6,11 +6,27 @@ from src.controller.users import router as users_router
 from src.controller.auth import router as auth_router
 from contextlib import asynccontextmanager
 from loguru import logger
+from src.core.kafka.producer.producer import kafka_producer
+from src.core.database.requests import password_executor
+from src.core.redis.base import close_redis
+from src.core.s3.base import s3_client_pool
+from src.core.thumbnails import thumbnail_executor
+from src.repositories.tokens.store import token_store
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info(f"FastApi server is starting...")
+    try:
+        await kafka_producer.start()
+    except Exception as e:
+        logger.error(f"Kafka недоступна, продюсер запустится при первой отправке: {e}")
     yield
+    await kafka_producer.stop()
+    await token_store.close()
+    await close_redis()
+    await s3_client_pool.stop()
+    password_executor.shutdown(wait=False, cancel_futures=True)
+    thumbnail_executor.shutdown(wait=False, cancel_futures=True)
     logger.info(f"FastApi server is shutting down...")
 
 app = FastAPI(
@@ -0,0 +1,37 @@
+"""unique tokens.user_id for refresh token upsert
+
+Revision ID: 5e1c9b7a3f02
+Revises: 2ad806b80484
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e1c9b7a3f02'
+down_revision: Union[str, None] = '2ad806b80484'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Дубли, оставшиеся от гонки SELECT-then-INSERT: у пользователя
+    # остается одна строка
+    op.execute(
+        """
+        DELETE FROM tokens t
+        USING tokens newer
+        WHERE t.user_id = newer.user_id AND t.ctid < newer.ctid
+        """
+    )
+    op.create_unique_constraint('tokens_user_id_key', 'tokens', ['user_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('tokens_user_id_key', 'tokens', type_='unique')
@@ -0,0 +1,41 @@
+"""store refresh tokens by sha256 digest with unique index
+
+Revision ID: 9a4d2f6c8b15
+Revises: 5e1c9b7a3f02
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4d2f6c8b15'
+down_revision: Union[str, None] = '5e1c9b7a3f02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tokens', sa.Column('token_hash', sa.String(length=64), nullable=True))
+    # Тот же дайджест, что token_digest: hex SHA-256 от UTF-8 байтов токена
+    op.execute(
+        "UPDATE tokens SET token_hash = encode(sha256(convert_to(refresh_token, 'UTF8')), 'hex')"
+    )
+    op.alter_column('tokens', 'token_hash', nullable=False)
+    op.create_unique_constraint('tokens_token_hash_key', 'tokens', ['token_hash'])
+    op.drop_column('tokens', 'refresh_token')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Исходные токены по дайджесту не восстановить: сохраненные сессии
+    # перестанут обновляться, пользователям нужно войти заново
+    op.add_column('tokens', sa.Column('refresh_token', sa.String(), nullable=True))
+    op.execute("UPDATE tokens SET refresh_token = token_hash")
+    op.alter_column('tokens', 'refresh_token', nullable=False)
+    op.drop_constraint('tokens_token_hash_key', 'tokens', type_='unique')
+    op.drop_column('tokens', 'token_hash')
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Response, Request
+from fastapi import APIRouter, Depends, Response, Request
 from src.core.schemas import validate_user_data
 from pydantic import ValidationError
 from src.service.auth import AuthService
 from src.core.schemas import UserModel
+from src.core.kafka.producer.producer import KafkaProducer, get_kafka_producer
 
 router = APIRouter(tags=["Auth"], prefix="/users")
 
@@ -26,13 +27,20 @@ async def auth_user(user: UserModel, response: Response):
 
 
 @router.post("/register")
-async def register_user(user: UserModel, response: Response):
+async def register_user(
+    user: UserModel,
+    response: Response,
+    producer: KafkaProducer = Depends(get_kafka_producer),
+):
     try:
         validate_user_data(user.username, user.email, user.password)
     except ValidationError as e:
         raise ValueError(f"Ошибка валидации: {e}")
     user_validate = await AuthService.register_user(
-        username=user.username, password=user.password, email=user.email
+        username=user.username,
+        password=user.password,
+        email=user.email,
+        producer=producer,
     )
     response.set_cookie(
         key="refresh_token",
@@ -1,6 +1,7 @@
 from functools import lru_cache
+from typing import List, Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import Field, FilePath, BaseModel
+from pydantic import Field, FilePath, BaseModel, field_validator
 from pathlib import Path
 import os
 
@@ -13,6 +14,12 @@ class S3Config(BaseSettings):
     AWS_SECRET_ACCESS_KEY: str = Field(..., alias="S3_AWS_SECRET_ACCESS_KEY")
     AWS_ACCESS_KEY_ID: str = Field(..., alias="S3_AWS_ACCESS_KEY_ID")
     endpoint_url: str = Field(..., alias="S3_ENDPOINT_URL")
+    max_pool_connections: int = Field(50, alias="S3_MAX_POOL_CONNECTIONS")
+    connect_timeout: float = Field(5, alias="S3_CONNECT_TIMEOUT")
+    read_timeout: float = Field(30, alias="S3_READ_TIMEOUT")
+    tcp_keepalive: bool = Field(True, alias="S3_TCP_KEEPALIVE")
+    keepalive_timeout: float = Field(60, alias="S3_KEEPALIVE_TIMEOUT")
+    presigned_url_expires: int = Field(36000, alias="S3_PRESIGNED_URL_EXPIRES")
 
     model_config = SettingsConfigDict(
         extra="allow",
@@ -47,6 +54,9 @@ class JWTKeysSettings(BaseModel):
 
 class KafkaConfig(BaseSettings):
     bootstrap_servers: str = Field(..., alias="KAFKA_BOOTSTRAP_SERVERS")
+    linger_ms: int = Field(5, alias="KAFKA_LINGER_MS")
+    max_batch_size: int = Field(16384, alias="KAFKA_MAX_BATCH_SIZE")
+    compression_type: Optional[str] = Field(None, alias="KAFKA_COMPRESSION_TYPE")
 
     model_config = SettingsConfigDict(
         env_file=os.path.join(os.path.dirname(__file__), "../../.env"),
@@ -55,10 +65,78 @@ class KafkaConfig(BaseSettings):
     )
 
 
+class PasswordHashConfig(BaseSettings):
+    workers: Optional[int] = Field(None, alias="PASSWORD_HASH_WORKERS")
+    rounds: int = Field(12, alias="PASSWORD_HASH_ROUNDS")
+
+    model_config = SettingsConfigDict(
+        extra="allow",
+        env_prefix="PASSWORD_HASH_",
+    )
+
+
+class JWTCacheConfig(BaseSettings):
+    max_size: int = Field(10000, alias="JWT_CACHE_MAX_SIZE")
+
+    model_config = SettingsConfigDict(
+        extra="allow",
+        env_prefix="JWT_CACHE_",
+    )
+
+
+class TokenStoreConfig(BaseSettings):
+    backend: Literal["postgres", "redis"] = Field("postgres", alias="TOKEN_STORE_BACKEND")
+    audit: bool = Field(True, alias="TOKEN_STORE_AUDIT")
+    migrate: bool = Field(False, alias="TOKEN_STORE_MIGRATE")
+
+    model_config = SettingsConfigDict(
+        extra="allow",
+        env_prefix="TOKEN_STORE_",
+    )
+
+
+class ProfileCacheConfig(BaseSettings):
+    ttl: int = Field(3600, alias="PROFILE_CACHE_TTL")
+
+    model_config = SettingsConfigDict(
+        extra="allow",
+        env_prefix="PROFILE_CACHE_",
+    )
+
+
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+class AvatarConfig(BaseSettings):
+    max_size: int = Field(20 * 1024 * 1024, alias="AVATAR_MAX_SIZE")
+    part_size: int = Field(8 * 1024 * 1024, alias="AVATAR_PART_SIZE")
+    thumbnail_sizes: List[int] = Field([64, 256], alias="AVATAR_THUMBNAIL_SIZES")
+    thumbnail_workers: Optional[int] = Field(None, alias="AVATAR_THUMBNAIL_WORKERS")
+    thumbnail_timeout: float = Field(30, alias="AVATAR_THUMBNAIL_TIMEOUT")
+
+    model_config = SettingsConfigDict(
+        extra="allow",
+        env_prefix="AVATAR_",
+    )
+
+    @field_validator("part_size")
+    def validate_part_size(cls, v):
+        # S3 отклоняет multipart upload, где части, кроме последней, меньше 5 МБ
+        if v < MIN_PART_SIZE:
+            raise ValueError(f"AVATAR_PART_SIZE должен быть не меньше {MIN_PART_SIZE} байт (5 МБ)")
+        return v
+
+
 class Settings(BaseSettings):
     database_url: str = Field(..., alias="USERS_DATABASE_URL")
+    redis_url: Optional[str] = Field(None, alias="REDIS_URL")
     jwt_keys: JWTKeysSettings = Field(default_factory=JWTKeysSettings)
+    jwt_cache: JWTCacheConfig = Field(default_factory=JWTCacheConfig)
     kafka: KafkaConfig = Field(default_factory=KafkaConfig)
+    avatar: AvatarConfig = Field(default_factory=AvatarConfig)
+    profile_cache: ProfileCacheConfig = Field(default_factory=ProfileCacheConfig)
+    token_store: TokenStoreConfig = Field(default_factory=TokenStoreConfig)
+    password_hash: PasswordHashConfig = Field(default_factory=PasswordHashConfig)
     s3_conf: S3Config = Field(default_factory=S3Config)
 
     model_config = SettingsConfigDict(
@@ -27,9 +27,10 @@ class UsersTable(Base):
 class TokensTable(Base):
     __tablename__ = "tokens"
 
-    refresh_token: Mapped[str] = mapped_column(String, nullable=False)
+    # SHA-256 refresh-токена в hex (см. token_digest): сам JWT не хранится
+    token_hash: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
     user_id: Mapped[UUID] = mapped_column(
-        PSUUID(as_uuid=True), ForeignKey("users.id"), nullable=False
+        PSUUID(as_uuid=True), ForeignKey("users.id"), nullable=False, unique=True
     )
 
     user = relationship("UsersTable", back_populates="token")
@@ -1,63 +1,67 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from uuid import UUID
 import bcrypt
-from sqlalchemy.future import select
-from sqlalchemy import update, delete
+from sqlalchemy import delete
 from src.core.database.base import async_session
+from src.core.config import get_settings
 from src.core.database.models import TokensTable
+from src.repositories.auth.auth import upsert_refresh_token
+from src.repositories.tokens.base import token_digest
+
+settings = get_settings()
+
+# bcrypt отпускает GIL на время хеширования, поэтому пул потоков дает
+# настоящий параллелизм и не блокирует event loop
+password_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash.workers or os.cpu_count(),
+    thread_name_prefix="bcrypt",
+)
+
+
+def _hash_password(password: str) -> str:
+    salt = bcrypt.gensalt(rounds=settings.password_hash.rounds)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    return bcrypt.checkpw(
+        plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+    )
 
 
 class AuthRequest:
     @staticmethod
     async def hash_password(password: str) -> str:
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+        """Хеширует пароль в пуле password_executor с PASSWORD_HASH_ROUNDS раундами."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(password_executor, _hash_password, password)
 
     @staticmethod
     async def verify_password(plain_password: str, hashed_password: str) -> bool:
-        return bcrypt.checkpw(
-            plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+        """Проверяет пароль в пуле password_executor; стоимость берется из хеша."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            password_executor, _verify_password, plain_password, hashed_password
         )
 
 
 class TokenRequest:
     @staticmethod
     async def save_token(user_id: str, refresh_token: str):
-        # Поиск существующего токена
         async with async_session() as session:
-            user_ids = UUID(user_id)
-            stmt = select(TokensTable).where(TokensTable.user_id == user_ids)
-            result = await session.execute(stmt)
-            existing_token = result.scalar_one_or_none()
-
-            if existing_token:
-                # Обновление существующего токена
-                stmt = (
-                    update(TokensTable)
-                    .where(TokensTable.user_id == user_id)
-                    .values(refresh_token=refresh_token)
-                )
-                await session.execute(stmt)
-            else:
-                # Создание нового токена
-                new_token = TokensTable(user_id=user_ids, refresh_token=refresh_token)
-                session.add(new_token)
-
+            await session.execute(upsert_refresh_token(UUID(str(user_id)), refresh_token))
             await session.commit()
 
     @staticmethod
     async def remove_token(refresh_token: str):
-        # Поиск токена для удаления
         async with async_session() as session:
-            stmt = select(TokensTable).where(TokensTable.refresh_token == refresh_token)
+            stmt = (
+                delete(TokensTable)
+                .where(TokensTable.token_hash == token_digest(refresh_token))
+                .returning(TokensTable.user_id)
+            )
             result = await session.execute(stmt)
-            token_to_delete = result.scalar_one_or_none()
-
-            if token_to_delete:
-                # Удаление токена
-                stmt = delete(TokensTable).where(
-                    TokensTable.refresh_token == refresh_token
-                )
-                await session.execute(stmt)
-                await session.commit()
-                return True
-            else:
-                return False
+            await session.commit()
+            return result.scalar_one_or_none() is not None
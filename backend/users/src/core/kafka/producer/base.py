@@ -13,3 +13,6 @@ class KafkaAbstractProducer(ABC):
 
     @abstractmethod
     async def send_json(self, topic: str, value): ...
+
+    @abstractmethod
+    async def send(self, topic: str, value): ...
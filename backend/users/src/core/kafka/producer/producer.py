@@ -1,3 +1,5 @@
+import asyncio
+from typing import Optional, Set
 from uuid import uuid4
 from aiokafka import AIOKafkaProducer
 from src.core.config import get_settings
@@ -10,44 +12,100 @@ settings = get_settings()
 
 
 class KafkaProducer(KafkaAbstractProducer):
+    """
+    Продюсер, общий для всего процесса: запускается в lifespan и
+    переиспользует соединения с брокерами между запросами. Сообщения
+    копятся в пакеты до linger_ms / max_batch_size и сжимаются
+    compression_type.
+    """
+
     def __init__(self):
-        self.producer = AIOKafkaProducer(
-            bootstrap_servers=f"{settings.kafka.bootstrap_servers}",
-            security_protocol="PLAINTEXT",
-        )
+        self.producer: Optional[AIOKafkaProducer] = None
         self._is_started = False
+        self._start_lock = asyncio.Lock()
+        self._pending: Set[asyncio.Future] = set()
 
     async def start(self):
         """Запуск продюсера"""
-        if not self._is_started:
+        async with self._start_lock:
+            if self._is_started:
+                return
+            producer = AIOKafkaProducer(
+                bootstrap_servers=f"{settings.kafka.bootstrap_servers}",
+                security_protocol="PLAINTEXT",
+                linger_ms=settings.kafka.linger_ms,
+                max_batch_size=settings.kafka.max_batch_size,
+                compression_type=settings.kafka.compression_type or None,
+            )
             try:
-                await self.producer.start()
+                await producer.start()
+                self.producer = producer
                 self._is_started = True
                 logger.info("Kafka producer started.")
             except Exception as e:
                 logger.error(f"Ошибка подключения к Kafka: {e}")
+                # Клиент мог успеть открыть соединения и фоновые задачи
+                try:
+                    await producer.stop()
+                except Exception as stop_error:
+                    logger.error(f"Ошибка при остановке продюсера: {stop_error}")
                 raise
 
     async def stop(self):
-        """Остановка продюсера"""
+        """Остановка продюсера: дожидается отправки накопленных сообщений"""
         if self._is_started:
             try:
                 await self.producer.stop()
                 self._is_started = False
+                self.producer = None
                 logger.info("Kafka producer stopped.")
             except Exception as e:
                 logger.error(f"Ошибка при остановке продюсера: {e}")
                 raise
 
-    async def send_json(self, topic: str, value):
-        """Отправка JSON-сообщения в Kafka"""
+    async def _enqueue(self, topic: str, value) -> asyncio.Future:
         if not self._is_started:
             await self.start()
+        value_bytes = json.dumps(value).encode("utf-8")
+        key = str(uuid4()).encode("utf-8")
+        return await self.producer.send(topic, value=value_bytes, key=key)
+
+    async def send_json(self, topic: str, value):
+        """Отправка JSON-сообщения в Kafka с ожиданием подтверждения брокера"""
         try:
-            value_bytes = json.dumps(value).encode("utf-8")
-            key = str(uuid4()).encode("utf-8")
-            await self.producer.send_and_wait(topic, value=value_bytes, key=key)
+            future = await self._enqueue(topic, value)
+            await future
             logger.info(f"Сообщение отправлено в топик {topic}: {value}")
         except Exception as e:
             logger.error(f"Ошибка при отправке сообщения: {e}")
             raise
+
+    async def send(self, topic: str, value):
+        """
+        Отправка JSON-сообщения без ожидания подтверждения: сообщение
+        ставится в очередь продюсера, ошибка доставки только логируется.
+        """
+        try:
+            future = await self._enqueue(topic, value)
+        except Exception as e:
+            logger.error(f"Ошибка при отправке сообщения в топик {topic}: {e}")
+            return
+
+        self._pending.add(future)
+        future.add_done_callback(lambda f: self._on_delivered(f, topic))
+
+    def _on_delivered(self, future: asyncio.Future, topic: str):
+        self._pending.discard(future)
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            logger.error(
+                f"Сообщение не доставлено в топик {topic}: {future.exception()}"
+            )
+
+
+kafka_producer = KafkaProducer()
+
+
+def get_kafka_producer() -> KafkaProducer:
+    return kafka_producer
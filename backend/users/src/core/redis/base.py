@@ -0,0 +1,33 @@
+from typing import Optional
+from redis.asyncio import Redis
+from src.core.config import get_settings
+
+settings = get_settings()
+
+_redis: Optional[Redis] = None
+
+
+def get_redis() -> Redis:
+    """
+    Общий для процесса клиент Redis с пулом соединений. Создается при первом
+    обращении (REDIS_URL нужен только хранилищам на Redis) и закрывается
+    в lifespan через close_redis.
+    """
+    global _redis
+    if _redis is None:
+        if not settings.redis_url:
+            raise RuntimeError("REDIS_URL не задан")
+        _redis = Redis.from_url(
+            settings.redis_url,
+            decode_responses=True,
+            socket_connect_timeout=5,
+            socket_keepalive=True,
+        )
+    return _redis
+
+
+async def close_redis():
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
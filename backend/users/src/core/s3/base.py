@@ -0,0 +1,78 @@
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Optional
+from aiobotocore.config import AioConfig
+from aiobotocore.session import get_session
+from loguru import logger
+from src.core.config import get_settings
+
+settings = get_settings()
+
+
+class S3ClientPool:
+    def __init__(self):
+        self._client = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._connection_lock = asyncio.Lock()
+
+    async def start(self):
+        """Создает долгоживущий S3 клиент с пулом соединений."""
+        async with self._connection_lock:
+            if self._client is not None:
+                return
+
+            config = AioConfig(
+                max_pool_connections=settings.s3_conf.max_pool_connections,
+                connect_timeout=settings.s3_conf.connect_timeout,
+                read_timeout=settings.s3_conf.read_timeout,
+                tcp_keepalive=settings.s3_conf.tcp_keepalive,
+                connector_args={
+                    "keepalive_timeout": settings.s3_conf.keepalive_timeout
+                },
+            )
+            exit_stack = AsyncExitStack()
+            try:
+                self._client = await exit_stack.enter_async_context(
+                    get_session().create_client(
+                        "s3",
+                        region_name=settings.s3_conf.region_name,
+                        endpoint_url=settings.s3_conf.endpoint_url,
+                        aws_secret_access_key=settings.s3_conf.AWS_SECRET_ACCESS_KEY,
+                        aws_access_key_id=settings.s3_conf.AWS_ACCESS_KEY_ID,
+                        verify=False,
+                        config=config,
+                    )
+                )
+            except Exception as e:
+                await exit_stack.aclose()
+                logger.error(f"Ошибка при создании S3 клиента: {e}")
+                raise
+            self._exit_stack = exit_stack
+            logger.info(
+                f"S3 клиент запущен (max_pool_connections="
+                f"{settings.s3_conf.max_pool_connections})"
+            )
+
+    async def stop(self):
+        """Закрывает S3 клиент и все соединения пула."""
+        async with self._connection_lock:
+            if self._exit_stack is None:
+                return
+            try:
+                await self._exit_stack.aclose()
+                logger.info("S3 клиент остановлен")
+            except Exception as e:
+                logger.error(f"Ошибка при закрытии S3 клиента: {e}")
+            finally:
+                self._client = None
+                self._exit_stack = None
+
+    @asynccontextmanager
+    async def client(self):
+        """Отдает общий S3 клиент, запуская его при первом обращении."""
+        if self._client is None:
+            await self.start()
+        yield self._client
+
+
+s3_client_pool = S3ClientPool()
@@ -19,6 +19,15 @@ class UserBaseModel(BaseModel):
     userImage: Optional[str]
 
 
+class CachedProfile(BaseModel):
+    """Профиль в кэше: строка users и ключ аватарки в S3 (без подписанной ссылки)."""
+    email: str
+    username: str
+    created_at: datetime
+    updated_at: datetime
+    image_key: Optional[str]
+
+
 def validate_user_data(username: str, email: EmailStr, password: str) -> UserModel:
     try:
         user_model = UserModel(username=username, email=email, password=password)
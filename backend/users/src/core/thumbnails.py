@@ -0,0 +1,55 @@
+import asyncio
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable
+from PIL import Image, ImageOps
+from src.core.config import get_settings
+
+settings = get_settings()
+
+THUMBNAIL_CONTENT_TYPE = "image/webp"
+
+# Декодирование и ресайз фотографии упираются в CPU и держат GIL, поэтому
+# выполняются в отдельных процессах. spawn вместо fork: родитель к этому
+# моменту уже многопоточный (event loop, пул bcrypt)
+thumbnail_executor = ProcessPoolExecutor(
+    max_workers=settings.avatar.thumbnail_workers or os.cpu_count(),
+    mp_context=multiprocessing.get_context("spawn"),
+)
+
+
+def _render_thumbnails(path: str, sizes: Iterable[int]) -> Dict[int, bytes]:
+    sizes = sorted(set(sizes), reverse=True)
+    with Image.open(path) as image:
+        # Для JPEG декодер сразу уменьшает картинку в 2-8 раз, не разворачивая
+        # в память полный кадр с камеры телефона
+        image.draft("RGB", (sizes[0], sizes[0]))
+        image = ImageOps.exif_transpose(image)
+        image = image.convert("RGBA" if image.has_transparency_data else "RGB")
+
+    thumbnails = {}
+    for size in sizes:
+        image = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        image.save(buffer, format="WEBP", quality=80, method=4)
+        thumbnails[size] = buffer.getvalue()
+    return thumbnails
+
+
+async def render_thumbnails(path: str) -> Dict[int, bytes]:
+    """
+    Строит квадратные WebP-копии изображения из файла path для размеров
+    AVATAR_THUMBNAIL_SIZES в пуле thumbnail_executor.
+    """
+    loop = asyncio.get_running_loop()
+    return await asyncio.wait_for(
+        loop.run_in_executor(
+            thumbnail_executor,
+            _render_thumbnails,
+            path,
+            settings.avatar.thumbnail_sizes,
+        ),
+        timeout=settings.avatar.thumbnail_timeout,
+    )
@@ -0,0 +1,57 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from src.core.config import get_settings
+
+settings = get_settings()
+
+
+class VerifiedTokenCache:
+    """
+    Ограниченный LRU-кэш уже проверенных JWT. Ключ — SHA-256 токена (сам
+    токен в памяти не хранится), значение — payload и момент exp, после
+    которого запись считается отсутствующей и удаляется. Отзыва access
+    токенов в сервисе нет, поэтому payload до exp не меняется.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[bytes, Tuple[Dict[str, Any], float]]" = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        payload, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return dict(payload)
+
+    def set(self, token: str, payload: Dict[str, Any]):
+        if self.max_size <= 0 or not isinstance(payload.get("exp"), (int, float)):
+            return
+
+        key = self._key(token)
+        self._entries[key] = (dict(payload), float(payload["exp"]))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+access_token_cache = VerifiedTokenCache(settings.jwt_cache.max_size)
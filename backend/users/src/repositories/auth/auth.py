@@ -2,12 +2,25 @@ from typing import Optional
 from uuid import UUID
 from fastapi import HTTPException
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy import delete
 from sqlalchemy.future import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import selectinload
 from pydantic import EmailStr
 from src.core.database.base import async_session
 from src.core.database.models import UsersTable, TokensTable
 from src.repositories.auth.base import AuthAbstract
+from src.repositories.tokens.base import token_digest
+
+
+def upsert_refresh_token(user_id: UUID, refresh_token: str):
+    stmt = insert(TokensTable).values(
+        user_id=user_id, token_hash=token_digest(refresh_token)
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[TokensTable.user_id],
+        set_={"token_hash": stmt.excluded.token_hash},
+    ).returning(TokensTable.id)
 
 
 class AuthRepository(AuthAbstract):
@@ -69,66 +82,45 @@ class AuthRepository(AuthAbstract):
                 await session.rollback()
                 raise e
 
-    async def update_user_tokens(self, user_id: UUID, token_id: Optional[UUID]):
-        async with async_session() as session:
-            stmt = select(UsersTable).where(UsersTable.id == user_id)
-            result = await session.execute(stmt)
-            user = result.scalar_one_or_none()
-            if not user:
-                raise ValueError(f"Пользователь с ID {user_id} не найден")
-
-            user.token_id = token_id
-            await session.commit()
-            await session.refresh(user)
-
-    async def save_refresh_token(self, user_id: UUID, refresh_token: str):
+    async def save_refresh_token(self, user_id: UUID, refresh_token: str) -> UUID:
+        """
+        Сохраняет refresh-токен пользователя одним INSERT ... ON CONFLICT
+        (user_id) DO UPDATE ... RETURNING id: новый токен заменяет предыдущий,
+        а уникальность tokens.user_id исключает дубли при одновременных входах.
+        """
         async with async_session() as session:
             try:
-                # Проверяем, есть ли уже токен у пользователя
-                stmt = select(TokensTable).where(TokensTable.user_id == user_id)
-                result = await session.execute(stmt)
-                existing_token = result.scalar_one_or_none()
-
-                if existing_token:
-                    existing_token.refresh_token = refresh_token
-                    token_id = existing_token.id
-                else:
-                    new_token = TokensTable(
-                        user_id=user_id, refresh_token=refresh_token
-                    )
-                    session.add(new_token)
-                    await session.commit()
-                    await session.refresh(new_token)
-                    token_id = new_token.id
-
-                # Обновляем поле token_id в User
-                stmt = select(UsersTable).where(UsersTable.id == user_id)
-                result = await session.execute(stmt)
-                user = result.scalar_one_or_none()
-                if user:
-                    user.token_id = token_id
-                    await session.commit()
-                    await session.refresh(user)
-
+                result = await session.execute(
+                    upsert_refresh_token(user_id, refresh_token)
+                )
+                token_id = result.scalar_one()
+                await session.commit()
                 return token_id
             except SQLAlchemyError as e:
                 await session.rollback()
                 raise SQLAlchemyError(f"Ошибка при добавлении токена: {e}")
 
-    async def delete_refresh_token(self, refresh_token: str):
+    async def get_refresh_token_user_id(self, refresh_token: str) -> Optional[UUID]:
+        async with async_session() as session:
+            stmt = select(TokensTable.user_id).where(
+                TokensTable.token_hash == token_digest(refresh_token)
+            )
+            result = await session.execute(stmt)
+            return result.scalar_one_or_none()
+
+    async def delete_refresh_token(self, refresh_token: str) -> Optional[UUID]:
+        """Удаляет токен по дайджесту одним DELETE ... RETURNING user_id."""
         async with async_session() as session:
             try:
-                stmt = select(TokensTable).where(TokensTable.refresh_token == refresh_token)
+                stmt = (
+                    delete(TokensTable)
+                    .where(TokensTable.token_hash == token_digest(refresh_token))
+                    .returning(TokensTable.user_id)
+                )
                 result = await session.execute(stmt)
-                token_to_delete = result.scalar_one_or_none()
-
-                if token_to_delete:
-                    user_id = token_to_delete.user_id
-                    await session.delete(token_to_delete)
-                    await session.commit()
-                    return user_id  # Вернуть только user_id, а не словарь
-
-                return None
+                user_id = result.scalar_one_or_none()
+                await session.commit()
+                return user_id
             except SQLAlchemyError as e:
                 await session.rollback()
-                raise SQLAlchemyError(f"Ошибка при удалении токена: {e}")
\ No newline at end of file
+                raise SQLAlchemyError(f"Ошибка при удалении токена: {e}")
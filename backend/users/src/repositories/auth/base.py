@@ -19,10 +19,10 @@ class AuthAbstract(ABC):
     ) -> UUID: ...
 
     @abstractmethod
-    async def update_user_tokens(self, user_id: str, token_id: str): ...
+    async def save_refresh_token(self, user_id: str, refresh_token: str): ...
 
     @abstractmethod
-    async def save_refresh_token(self, user_id: str, refresh_token: str): ...
+    async def get_refresh_token_user_id(self, refresh_token: str): ...
 
     @abstractmethod
     async def delete_refresh_token(self, refresh_token: str): ...
@@ -1,11 +1,28 @@
 from abc import abstractmethod, ABC
+from typing import AsyncIterator, List
 
 
 class S3Abstract(ABC):
     @abstractmethod
-    async def upload_to_s3(
-        self, file_bytes: bytes, user_id: str, mime_type: str = None
+    async def put_object(self, file_key: str, body: bytes, content_type: str): ...
+
+    @abstractmethod
+    async def upload_stream(
+        self,
+        file_key: str,
+        chunks: AsyncIterator[bytes],
+        content_type: str,
+        part_size: int,
     ): ...
 
     @abstractmethod
-    async def get_profile_image(self, user_id: str): ...
+    async def delete_objects(self, file_keys: List[str]): ...
+
+    @abstractmethod
+    async def list_profile_image_keys(self, user_id: str): ...
+
+    @abstractmethod
+    async def find_profile_image_key(self, user_id: str): ...
+
+    @abstractmethod
+    async def presign(self, file_key: str): ...
@@ -1,104 +1,156 @@
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 from loguru import logger
-from aiobotocore.session import get_session
-from botocore.exceptions import NoCredentialsError
 from src.core.config import get_settings
-from fastapi import HTTPException, status
-import mimetypes
+from src.core.s3.base import S3ClientPool, s3_client_pool
 
 from src.repositories.s3.base import S3Abstract
 
 settings = get_settings()
 
 
+def thumbnail_key(user_id: UUID, size: int) -> str:
+    """Ключ квадратной WebP-копии аватарки; эту схему ключей читает и сервис movie."""
+    return f"userimage/thumbs/{user_id}/{size}.webp"
+
+
 class S3Repository(S3Abstract):
-    async def upload_to_s3(
-        self, file_bytes: bytes, user_id: str, mime_type: str = None
-    ):
+    def __init__(self, client_pool: S3ClientPool = s3_client_pool):
+        self._client_pool = client_pool
+
+    async def put_object(self, file_key: str, body: bytes, content_type: str):
         """
-        Загружает файл в S3 в виде байтов.
+        Загружает небольшой объект в S3 одним запросом.
         """
-        user_ids = UUID(user_id)
-        session = get_session()
-        if mime_type:
-            extension = mimetypes.guess_extension(mime_type)
-        else:
-            import magic
+        async with self._client_pool.client() as client:
+            await client.put_object(
+                Bucket=settings.s3_conf.bucket_name,
+                Key=file_key,
+                Body=body,
+                ContentType=content_type,
+            )
 
-            mime_type = magic.from_buffer(file_bytes, mime=True)
-            extension = mimetypes.guess_extension(mime_type)
+    async def upload_stream(
+        self,
+        file_key: str,
+        chunks: AsyncIterator[bytes],
+        content_type: str,
+        part_size: int,
+    ) -> int:
+        """
+        Загружает файл в S3 по частям из chunks, не собирая его в памяти.
+        Каждый chunk, кроме последнего, должен быть ровно part_size байт (не
+        меньше 5 МБ). Если первый chunk короче, это весь файл, и он уходит
+        одним put_object; иначе — multipart upload, по части на chunk. При
+        ошибке multipart upload отменяется, исключение пробрасывается.
+        Возвращает размер загруженного файла.
+        """
+        chunks = aiter(chunks)
+        body = await anext(chunks, b"")
+        if len(body) < part_size:
+            await self.put_object(file_key, body, content_type)
+            return len(body)
 
-        if not extension:
-            logger.error("Не удалось определить расширение файла.")
-            return None
+        async with self._client_pool.client() as client:
+            upload = await client.create_multipart_upload(
+                Bucket=settings.s3_conf.bucket_name,
+                Key=file_key,
+                ContentType=content_type,
+            )
+            upload_id = upload["UploadId"]
+            parts = []
+            size = 0
+            try:
+                while body is not None:
+                    response = await client.upload_part(
+                        Bucket=settings.s3_conf.bucket_name,
+                        Key=file_key,
+                        UploadId=upload_id,
+                        PartNumber=len(parts) + 1,
+                        Body=body,
+                    )
+                    parts.append(
+                        {"PartNumber": len(parts) + 1, "ETag": response["ETag"]}
+                    )
+                    size += len(body)
+                    # Отпускаем загруженную часть до чтения следующей, чтобы
+                    # в памяти была только одна
+                    body = None
+                    body = await anext(chunks, None)
 
-        file_name = f"userimage/{user_ids}{extension}"
-
-        try:
-            async with session.create_client(
-                "s3",
-                region_name=settings.s3_conf.region_name,
-                endpoint_url=settings.s3_conf.endpoint_url,
-                aws_secret_access_key=settings.s3_conf.AWS_SECRET_ACCESS_KEY,
-                aws_access_key_id=settings.s3_conf.AWS_ACCESS_KEY_ID,
-                verify=False,
-            ) as client:
-                await client.put_object(
+                await client.complete_multipart_upload(
                     Bucket=settings.s3_conf.bucket_name,
-                    Key=file_name,
-                    Body=file_bytes,
-                    ContentType=mime_type,
+                    Key=file_key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
                 )
-                logger.info(f"Файл успешно загружен в {file_name}")
-                return file_name
-        except NoCredentialsError:
-            logger.error("Ошибка: не удалось найти учетные данные AWS.")
-        except Exception as e:
-            logger.error(f"Ошибка при загрузке файла: {e}")
-        return None
-
-    async def get_profile_image(self, user_id: str):
+            except BaseException:
+                try:
+                    await client.abort_multipart_upload(
+                        Bucket=settings.s3_conf.bucket_name,
+                        Key=file_key,
+                        UploadId=upload_id,
+                    )
+                except Exception as e:
+                    logger.error(f"Не удалось отменить загрузку {file_key}: {e}")
+                raise
+
+        logger.info(f"Файл загружен в {file_key} ({len(parts)} частей, {size} байт)")
+        return size
+
+    async def delete_objects(self, file_keys: List[str]):
         """
-        Получает URL изображения профиля пользователя из S3.
+        Удаляет объекты из S3 одним запросом.
         """
-        user_ids = UUID(user_id)
-        session = get_session()
-        try:
-            async with session.create_client(
-                "s3",
-                region_name=settings.s3_conf.region_name,
-                endpoint_url=settings.s3_conf.endpoint_url,
-                aws_secret_access_key=settings.s3_conf.AWS_SECRET_ACCESS_KEY,
-                aws_access_key_id=settings.s3_conf.AWS_ACCESS_KEY_ID,
-                verify=False,
-            ) as client:
-                # Ищем файл с любым расширением
-                response = await client.list_objects_v2(
-                    Bucket=settings.s3_conf.bucket_name,
-                    Prefix=f"userimage/{user_ids}.",
-                )
-                if "Contents" not in response or len(response["Contents"]) == 0:
-                    logger.info(
-                        f"Аватарка для пользователя с user_id {user_ids} не найдена!"
-                    )
-                    raise HTTPException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        detail="Аватарка для пользователя с таким user_id не найдена!",
-                    )
+        if not file_keys:
+            return
+        async with self._client_pool.client() as client:
+            await client.delete_objects(
+                Bucket=settings.s3_conf.bucket_name,
+                Delete={"Objects": [{"Key": key} for key in file_keys]},
+            )
 
-                file_key = response["Contents"][0]["Key"]
+    async def list_profile_image_keys(self, user_id: str) -> List[str]:
+        """
+        Возвращает ключи всех оригиналов аватарки пользователя (с любым
+        расширением).
+        """
+        user_ids = UUID(user_id)
+        async with self._client_pool.client() as client:
+            response = await client.list_objects_v2(
+                Bucket=settings.s3_conf.bucket_name,
+                Prefix=f"userimage/{user_ids}.",
+            )
+        return [obj["Key"] for obj in response.get("Contents", [])]
 
-                url = await client.generate_presigned_url(
-                    ClientMethod="get_object",
-                    Params={
-                        "Bucket": settings.s3_conf.bucket_name,
-                        "Key": file_key,
-                    },
-                    ExpiresIn=36000,  # Срок действия ссылки (в секундах)
-                )
-                return url
-        except Exception as e:
-            logger.error(
-                f"Ошибка при генерации URL для пользователя с user_id {user_id}: {e}"
+    async def _find_key(self, prefix: str) -> Optional[str]:
+        async with self._client_pool.client() as client:
+            response = await client.list_objects_v2(
+                Bucket=settings.s3_conf.bucket_name,
+                Prefix=prefix,
+                MaxKeys=1,
             )
+        if "Contents" not in response or len(response["Contents"]) == 0:
             return None
+        return response["Contents"][0]["Key"]
+
+    async def find_profile_image_key(self, user_id: str) -> Optional[str]:
+        """
+        Ищет ключ аватарки пользователя с любым расширением (list_objects_v2).
+        """
+        return await self._find_key(f"userimage/{UUID(user_id)}.")
+
+    async def presign(self, file_key: str) -> str:
+        """
+        Подписывает ссылку на объект. Подпись считается локально, без сетевых
+        запросов к S3.
+        """
+        async with self._client_pool.client() as client:
+            return await client.generate_presigned_url(
+                ClientMethod="get_object",
+                Params={
+                    "Bucket": settings.s3_conf.bucket_name,
+                    "Key": file_key,
+                },
+                ExpiresIn=settings.s3_conf.presigned_url_expires,
+            )
@@ -0,0 +1,28 @@
+import hashlib
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+
+def token_digest(refresh_token: str) -> str:
+    """SHA-256 токена в hex: ключ хранилища вместо самого JWT (~1 КБ)."""
+    return hashlib.sha256(refresh_token.encode("utf-8")).hexdigest()
+
+
+class AbstractTokenStore(ABC):
+    """
+    Хранилище refresh-токенов: у пользователя один действующий токен,
+    новый токен заменяет предыдущий.
+    """
+
+    @abstractmethod
+    async def save(self, user_id: UUID, refresh_token: str, ttl: int): ...
+
+    @abstractmethod
+    async def get_user_id(self, refresh_token: str) -> Optional[UUID]: ...
+
+    @abstractmethod
+    async def revoke(self, refresh_token: str) -> Optional[UUID]: ...
+
+    async def close(self):
+        pass
@@ -0,0 +1,19 @@
+from typing import Optional
+from uuid import UUID
+from src.repositories.auth.auth import AuthRepository
+from src.repositories.tokens.base import AbstractTokenStore
+
+auth_repository = AuthRepository()
+
+
+class PostgresTokenStore(AbstractTokenStore):
+    """Хранилище refresh-токенов в таблице tokens."""
+
+    async def save(self, user_id: UUID, refresh_token: str, ttl: int):
+        await auth_repository.save_refresh_token(user_id, refresh_token)
+
+    async def get_user_id(self, refresh_token: str) -> Optional[UUID]:
+        return await auth_repository.get_refresh_token_user_id(refresh_token)
+
+    async def revoke(self, refresh_token: str) -> Optional[UUID]:
+        return await auth_repository.delete_refresh_token(refresh_token)
@@ -0,0 +1,178 @@
+import asyncio
+import time
+from functools import partial
+from typing import Awaitable, Dict, Optional
+from uuid import UUID
+import jwt
+from loguru import logger
+from redis.commands.core import AsyncScript
+from src.core.redis.base import get_redis
+from src.repositories.tokens.base import AbstractTokenStore, token_digest
+
+TOKEN_PREFIX = "refresh_token:"
+USER_PREFIX = "refresh_token_user:"
+
+# Один round trip на вход: новый токен пользователя заменяет предыдущий
+SAVE_SCRIPT = """
+local previous = redis.call('SET', KEYS[2], ARGV[1], 'EX', ARGV[3], 'GET')
+if previous and previous ~= ARGV[1] then
+    redis.call('DEL', ARGV[4] .. previous)
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+"""
+
+# Один round trip на выход. При переносе из Postgres вместо токена до конца
+# его срока (ARGV[3] секунд) остается пустая метка: копия токена в Postgres
+# удаляется позже и не должна вернуться в Redis. Ссылка пользователя
+# удаляется, только если она указывает на отзываемый токен
+REVOKE_SCRIPT = """
+local user_id = redis.call('GET', KEYS[1])
+if tonumber(ARGV[3]) > 0 then
+    redis.call('SET', KEYS[1], '', 'EX', ARGV[3])
+else
+    redis.call('DEL', KEYS[1])
+end
+if not user_id or user_id == '' then
+    return false
+end
+local user_key = ARGV[2] .. user_id
+if redis.call('GET', user_key) == ARGV[1] then
+    redis.call('DEL', user_key)
+end
+return user_id
+"""
+
+# Перенос токена из Postgres: только если он не отозван и у пользователя в
+# Redis нет другого, более нового токена
+MIGRATE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+local current = redis.call('GET', KEYS[2])
+if current and current ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[2], ARGV[1], 'EX', ARGV[3])
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
+
+
+def _remaining_ttl(refresh_token: str) -> int:
+    """
+    Сколько секунд осталось до exp токена; 0 для истекших и нечитаемых
+    токенов. Подпись здесь не проверяется.
+    """
+    try:
+        payload = jwt.decode(refresh_token, options={"verify_signature": False})
+        return max(int(payload["exp"] - time.time()), 0)
+    except (jwt.PyJWTError, KeyError, TypeError, ValueError):
+        return 0
+
+
+class RedisTokenStore(AbstractTokenStore):
+    """
+    Хранилище refresh-токенов в Redis. refresh_token:<sha256> хранит
+    user_id с TTL, равным сроку жизни токена, refresh_token_user:<user_id> —
+    дайджест действующего токена пользователя. Сохранение, проверка и отзыв
+    — O(1) и один round trip.
+
+    db_store — прежнее хранилище в Postgres, все записи в него идут после
+    ответа (write-behind) по очереди для каждого пользователя, а ошибки
+    только логируются. При audit=True в него дописываются новые токены, при
+    отзыве токен удаляется и оттуда. При migrate=True токен, которого нет в
+    Redis (выдан до переключения TOKEN_STORE_BACKEND), ищется в db_store и
+    переносится в Redis при первом обращении.
+    """
+
+    def __init__(
+        self,
+        db_store: Optional[AbstractTokenStore] = None,
+        audit: bool = False,
+        migrate: bool = False,
+    ):
+        self.db_store = db_store
+        self.audit = audit
+        self.migrate = migrate and db_store is not None
+        self._save_script: Optional[AsyncScript] = None
+        self._revoke_script: Optional[AsyncScript] = None
+        self._migrate_script: Optional[AsyncScript] = None
+        # Последняя запись в db_store для каждого пользователя
+        self._tails: Dict[UUID, asyncio.Task] = {}
+
+    def _scripts(self):
+        if self._save_script is None:
+            redis = get_redis()
+            self._save_script = redis.register_script(SAVE_SCRIPT)
+            self._revoke_script = redis.register_script(REVOKE_SCRIPT)
+            self._migrate_script = redis.register_script(MIGRATE_SCRIPT)
+        return self._save_script, self._revoke_script, self._migrate_script
+
+    async def save(self, user_id: UUID, refresh_token: str, ttl: int):
+        save_script, _, _ = self._scripts()
+        digest = token_digest(refresh_token)
+        await save_script(
+            keys=[f"{TOKEN_PREFIX}{digest}", f"{USER_PREFIX}{user_id}"],
+            args=[digest, str(user_id), ttl, TOKEN_PREFIX],
+        )
+        if self.db_store is not None and self.audit:
+            self._in_order(user_id, self.db_store.save(user_id, refresh_token, ttl))
+
+    async def get_user_id(self, refresh_token: str) -> Optional[UUID]:
+        digest = token_digest(refresh_token)
+        token_key = f"{TOKEN_PREFIX}{digest}"
+        user_id = await get_redis().get(token_key)
+        if user_id is not None:
+            return UUID(user_id) if user_id else None
+        if not self.migrate:
+            return None
+
+        user_id = await self.db_store.get_user_id(refresh_token)
+        ttl = _remaining_ttl(refresh_token)
+        if user_id is None or ttl <= 0:
+            return None
+        _, _, migrate_script = self._scripts()
+        migrated = await migrate_script(
+            keys=[token_key, f"{USER_PREFIX}{user_id}"],
+            args=[digest, str(user_id), ttl],
+        )
+        return user_id if migrated else None
+
+    async def revoke(self, refresh_token: str) -> Optional[UUID]:
+        _, revoke_script, _ = self._scripts()
+        digest = token_digest(refresh_token)
+        user_id = await revoke_script(
+            keys=[f"{TOKEN_PREFIX}{digest}"],
+            args=[digest, USER_PREFIX, _remaining_ttl(refresh_token) if self.migrate else 0],
+        )
+        if user_id:
+            if self.db_store is not None:
+                self._in_order(UUID(user_id), self.db_store.revoke(refresh_token))
+            return UUID(user_id)
+        if self.migrate:
+            # Токен, выданный до переключения, есть только в Postgres
+            return await self.db_store.revoke(refresh_token)
+        return None
+
+    def _in_order(self, user_id: UUID, coro: Awaitable) -> asyncio.Task:
+        task = asyncio.create_task(self._after(self._tails.get(user_id), coro))
+        self._tails[user_id] = task
+        task.add_done_callback(partial(self._on_written, user_id))
+        return task
+
+    @staticmethod
+    async def _after(previous: Optional[asyncio.Task], coro: Awaitable):
+        if previous is not None:
+            await asyncio.wait([previous])
+        return await coro
+
+    def _on_written(self, user_id: UUID, task: asyncio.Task):
+        if self._tails.get(user_id) is task:
+            del self._tails[user_id]
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Не удалось записать токен в Postgres: {task.exception()}")
+
+    async def close(self):
+        """Дожидается незавершенных записей в Postgres"""
+        if self._tails:
+            await asyncio.gather(*self._tails.values(), return_exceptions=True)
@@ -0,0 +1,18 @@
+from src.core.config import get_settings
+from src.repositories.tokens.base import AbstractTokenStore
+from src.repositories.tokens.postgres import PostgresTokenStore
+from src.repositories.tokens.redis import RedisTokenStore
+
+settings = get_settings()
+
+
+def create_token_store() -> AbstractTokenStore:
+    """Хранилище refresh-токенов по TOKEN_STORE_BACKEND (postgres или redis)."""
+    if settings.token_store.backend == "redis":
+        config = settings.token_store
+        db_store = PostgresTokenStore() if config.audit or config.migrate else None
+        return RedisTokenStore(db_store=db_store, audit=config.audit, migrate=config.migrate)
+    return PostgresTokenStore()
+
+
+token_store = create_token_store()
@@ -0,0 +1,84 @@
+from typing import Optional, Tuple
+from uuid import UUID
+from loguru import logger
+from redis.commands.core import AsyncScript
+from src.core.config import get_settings
+from src.core.redis.base import get_redis
+from src.core.schemas import CachedProfile
+
+settings = get_settings()
+
+# Профиль сохраняется, только если поколение не сменилось с момента промаха:
+# иначе запрос, прочитавший источники до загрузки аватарки, вернул бы в кэш
+# старый ключ после invalidate
+SET_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '0') == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+end
+"""
+
+
+class ProfileCache:
+    """
+    Кэш профилей в Redis по user_id: строка users и ключ аватарки в S3.
+    Подписанные ссылки в кэш не попадают — они подписываются локально при
+    каждом чтении. Без REDIS_URL или при PROFILE_CACHE_TTL=0 кэш выключен;
+    ошибки Redis только логируются, профиль тогда читается из источников.
+
+    profile_version:<user_id> — поколение профиля: invalidate увеличивает
+    его, а set сохраняет профиль, только если поколение совпадает с
+    прочитанным в get.
+    """
+
+    KEY_PREFIX = "profile:"
+    VERSION_PREFIX = "profile_version:"
+
+    def __init__(self):
+        self._set_script: Optional[AsyncScript] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(settings.redis_url) and settings.profile_cache.ttl > 0
+
+    async def get(self, user_id: UUID) -> Tuple[Optional[CachedProfile], Optional[str]]:
+        """Профиль из кэша и поколение, которое нужно передать в set при промахе"""
+        if not self.enabled:
+            return None, None
+        try:
+            data, version = await get_redis().mget(
+                f"{self.KEY_PREFIX}{user_id}", f"{self.VERSION_PREFIX}{user_id}"
+            )
+        except Exception as e:
+            logger.warning(f"Кэш профилей недоступен, user_id {user_id}: {e}")
+            return None, None
+        profile = CachedProfile.model_validate_json(data) if data else None
+        return profile, version or "0"
+
+    async def set(self, user_id: UUID, profile: CachedProfile, version: Optional[str]):
+        if not self.enabled or version is None:
+            return
+        try:
+            if self._set_script is None:
+                self._set_script = get_redis().register_script(SET_SCRIPT)
+            await self._set_script(
+                keys=[f"{self.KEY_PREFIX}{user_id}", f"{self.VERSION_PREFIX}{user_id}"],
+                args=[version, profile.model_dump_json(), settings.profile_cache.ttl],
+            )
+        except Exception as e:
+            logger.warning(f"Не удалось сохранить профиль в кэш, user_id {user_id}: {e}")
+
+    async def invalidate(self, user_id: UUID):
+        if not self.enabled:
+            return
+        version_key = f"{self.VERSION_PREFIX}{user_id}"
+        try:
+            async with get_redis().pipeline(transaction=True) as pipe:
+                pipe.incr(version_key)
+                pipe.expire(version_key, settings.profile_cache.ttl)
+                pipe.delete(f"{self.KEY_PREFIX}{user_id}")
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Не удалось сбросить кэш профиля, user_id {user_id}: {e}")
+
+
+profile_cache = ProfileCache()
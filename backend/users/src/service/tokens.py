@@ -1,27 +1,46 @@
 import jwt
+from jwt.algorithms import RSAAlgorithm
 from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException, status
 from typing import Optional, Dict, Any
 from src.core.config import get_settings
-from src.core.database.models import UsersTable, TokensTable
+from src.core.database.models import UsersTable
 from src.core.database.base import async_session
 from sqlalchemy import select
-from src.core.database.requests import TokenRequest
+from src.repositories.tokens.store import token_store
+from src.core.token_cache import access_token_cache
 
 settings = get_settings()
-private_key = settings.jwt_keys.get_private_key()
-public_key = settings.jwt_keys.get_public_key()
+
+# Ключи разбираются из PEM один раз при импорте, а не при каждом encode/decode
+_rsa = RSAAlgorithm(RSAAlgorithm.SHA256)
+private_key = _rsa.prepare_key(settings.jwt_keys.get_private_key())
+public_key = _rsa.prepare_key(settings.jwt_keys.get_public_key())
+
+ACCESS_TOKEN_TTL = timedelta(days=20)
+REFRESH_TOKEN_TTL = timedelta(days=14)
 
 
 class TokenService:
     @staticmethod
     async def validate_access_token(access_token: str) -> Optional[Dict[str, Any]]:
+        """
+        Проверяет access-токен. Успешно проверенные токены кэшируются в
+        access_token_cache до своего exp, поэтому повторная проверка того же
+        токена обходится без RSA.
+        """
+        payload = access_token_cache.get(access_token)
+        if payload is not None:
+            return payload
+
         try:
             payload = jwt.decode(access_token, public_key, algorithms=["RS256"])
-            return payload
         except jwt.PyJWTError:
             return None
 
+        access_token_cache.set(access_token, payload)
+        return payload
+
     @staticmethod
     async def validate_refresh_token(refresh_token: str) -> Optional[Dict[str, Any]]:
         try:
@@ -33,13 +52,13 @@ class TokenService:
     @staticmethod
     async def generate_tokens(payload: Dict[str, Any]) -> Dict[str, str]:
         access_token = jwt.encode(
-            {**payload, "exp": datetime.now(timezone.utc) + timedelta(days=20)},
+            {**payload, "exp": datetime.now(timezone.utc) + ACCESS_TOKEN_TTL},
             private_key,
             algorithm="RS256",
         )
 
         refresh_token = jwt.encode(
-            {**payload, "exp": datetime.now(timezone.utc) + timedelta(days=14)},
+            {**payload, "exp": datetime.now(timezone.utc) + REFRESH_TOKEN_TTL},
             private_key,
             algorithm="RS256",
         )
@@ -50,50 +69,53 @@ class TokenService:
         }
 
     async def refresh_token(self, refresh_token: str):
-        async with async_session() as session:
-            if not refresh_token:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Токена не существует!",
-                )
-
-            # Проверяем валидность refresh-токена
-            token_data = await self.validate_refresh_token(refresh_token)
-            if not token_data:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED, detail="Неверный токен!"
-                )
-
-            # Ищем токен в базе данных
-            stmt = select(TokensTable).where(
-                TokensTable.refresh_token == token_data["refresh_token"]
+        if not refresh_token:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Токена не существует!",
             )
-            result = await session.execute(stmt)
-            token_from_db = result.scalar_one_or_none()
 
-            if not token_from_db:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Токен не найден в базе данных!",
-                )
+        # Проверяем валидность refresh-токена
+        token_data = await self.validate_refresh_token(refresh_token)
+        if not token_data:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="Неверный токен!"
+            )
+
+        # Ищем токен в хранилище refresh-токенов
+        user_id = await token_store.get_user_id(refresh_token)
+        if not user_id:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Токен не найден в базе данных!",
+            )
 
-            # Ищем пользователя по user_id из токена
-            stmt = select(UsersTable).where(UsersTable.id == token_from_db.user_id)
+        # Ищем пользователя по user_id из токена
+        async with async_session() as session:
+            stmt = select(UsersTable).where(UsersTable.id == user_id)
             result = await session.execute(stmt)
             user = result.scalar_one_or_none()
 
-            if not user:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Пользователь не найден!",
-                )
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Пользователь не найден!",
+            )
 
-            # Генерируем новые токены
-            tokens = await self.generate_tokens(user.model_dump())
+        # Генерируем новые токены
+        tokens = await self.generate_tokens(
+            payload={
+                "user_id": str(user.id),
+                "username": user.username,
+                "email": user.email,
+            }
+        )
 
-            # Сохраняем новый refresh-токен в базе данных
-            await TokenRequest.save_token(
-                user_id=token_from_db.user_id, refresh_token=tokens["refresh_token"]
-            )
+        # Новый refresh-токен заменяет предыдущий
+        await token_store.save(
+            user_id=user.id,
+            refresh_token=tokens["refresh_token"],
+            ttl=int(REFRESH_TOKEN_TTL.total_seconds()),
+        )
 
-            return tokens
+        return tokens
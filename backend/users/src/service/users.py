@@ -1,65 +1,198 @@
-from contextlib import asynccontextmanager
+import asyncio
+import mimetypes
+import tempfile
+from typing import Optional
 from uuid import UUID
-from fastapi import HTTPException, status
+from fastapi import HTTPException, UploadFile, status
+from loguru import logger
 
+from src.core.config import get_settings
 from src.core.kafka.producer.producer import KafkaProducer
+from src.core.thumbnails import THUMBNAIL_CONTENT_TYPE, render_thumbnails
 from src.repositories.users.users import UserRepository
-from src.repositories.s3.s3 import S3Repository
-from src.core.schemas import UserBaseModel, UserResponse
+from src.repositories.s3.s3 import S3Repository, thumbnail_key
+from src.repositories.users.cache import profile_cache
+from src.core.schemas import CachedProfile, UserBaseModel, UserResponse
 
+settings = get_settings()
 s3_repository = S3Repository()
 user_repository = UserRepository()
 
-@asynccontextmanager
-async def kafka_producer():
-    producer = KafkaProducer()
-    try:
-        await producer.start()
-        yield producer
-    finally:
-        await producer.stop()
+# Сколько байт начала файла отдается libmagic для определения MIME-типа
+MIME_SNIFF_SIZE = 2048
+
 
 class UserService:
     @staticmethod
     async def get_user_profile(user_id: UUID):
         """
-        Получает профиль пользователя по его ID.
+        Получает профиль пользователя по его ID. Строка users и ключ аватарки
+        берутся из profile_cache (при промахе — из Postgres и list_objects_v2
+        параллельно), ссылка на аватарку подписывается локально. Промах
+        сохраняется в кэш, только если профиль не сбросили, пока он читался.
         """
-        # Преобразуем UUID в строку
-        user_id_str = str(user_id)
-        user = await user_repository.get_user_by_id(user_id=user_id)
+        profile, version = await profile_cache.get(user_id)
 
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Такого пользователя не существует в базе данных",
+        if profile is None:
+            user, image_key = await asyncio.gather(
+                user_repository.get_user_by_id(user_id=user_id),
+                UserService._find_image_key(user_id),
             )
 
-        # Передаем строку UUID в метод get_profile_image
-        user_image = await s3_repository.get_profile_image(user_id=user_id_str)
+            if not user:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Такого пользователя не существует в базе данных",
+                )
+
+            profile = CachedProfile(
+                username=user.username,
+                email=user.email,
+                created_at=user.created_at,
+                updated_at=user.updated_at,
+                image_key=image_key,
+            )
+            await profile_cache.set(user_id, profile, version)
+
+        user_image = None
+        if profile.image_key:
+            try:
+                user_image = await s3_repository.presign(profile.image_key)
+            except Exception as e:
+                logger.error(f"Ошибка при подписи ссылки {profile.image_key}: {e}")
 
         return UserBaseModel(
-            username=user.username,
-            email=user.email,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-            userImage=user_image if user_image else None,
+            username=profile.username,
+            email=profile.email,
+            created_at=profile.created_at,
+            updated_at=profile.updated_at,
+            userImage=user_image,
         )
 
     @staticmethod
-    async def create_comment(user_id: UUID):
-        async with kafka_producer() as producer:
-            user = await user_repository.get_user_by_id(user_id=user_id)
+    async def _find_image_key(user_id: UUID) -> Optional[str]:
+        try:
+            return await s3_repository.find_profile_image_key(user_id=str(user_id))
+        except Exception as e:
+            logger.error(f"Ошибка при поиске аватарки пользователя {user_id}: {e}")
+            return None
 
-            if not user:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Такого пользователя не существует в базе данных",
+    @staticmethod
+    async def upload_profile_image(user_id: UUID, uploaded_file: UploadFile) -> str:
+        """
+        Загружает аватарку в S3 частями по AVATAR_PART_SIZE, не читая файл
+        в память целиком. MIME-тип без заголовка клиента определяется по первым
+        MIME_SNIFF_SIZE байтам. По ходу загрузки файл пишется во
+        временный файл, из которого в пуле процессов строятся WebP-копии
+        AVATAR_THUMBNAIL_SIZES. Старые оригиналы с другим расширением
+        удаляются, кэш профиля сбрасывается.
+        """
+        head = await uploaded_file.read(MIME_SNIFF_SIZE)
+        if not head:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Файл пустой"
+            )
+
+        mime_type = uploaded_file.content_type
+        if not mime_type or mime_type == "application/octet-stream":
+            import magic
+
+            mime_type = magic.from_buffer(head, mime=True)
+
+        extension = None
+        if mime_type.startswith("image/"):
+            extension = mimetypes.guess_extension(mime_type)
+        if not extension:
+            logger.error(f"Не удалось определить расширение файла ({mime_type}).")
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="Аватарка должна быть изображением",
+            )
+        await uploaded_file.seek(0)
+
+        part_size = settings.avatar.part_size
+        file_key = f"userimage/{user_id}{extension}"
+        with tempfile.NamedTemporaryFile(suffix=extension) as local_copy:
+
+            async def chunks():
+                size = 0
+                while chunk := await uploaded_file.read(part_size):
+                    size += len(chunk)
+                    if size > settings.avatar.max_size:
+                        raise HTTPException(
+                            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            detail="Файл слишком большой",
+                        )
+                    await asyncio.to_thread(local_copy.write, chunk)
+                    yield chunk
+                    del chunk
+
+            await s3_repository.upload_stream(
+                file_key, chunks(), mime_type, part_size
+            )
+            await asyncio.to_thread(local_copy.flush)
+            await UserService._upload_thumbnails(user_id, local_copy.name)
+
+        await UserService._remove_stale_images(user_id, keep=file_key)
+        await profile_cache.invalidate(user_id)
+        return file_key
+
+    @staticmethod
+    async def _upload_thumbnails(user_id: UUID, path: str):
+        """
+        Строит и загружает WebP-копии аватарки. Если копии построить не
+        удалось, старые удаляются, чтобы вместо них отдавался новый оригинал.
+        """
+        try:
+            thumbnails = await render_thumbnails(path)
+        except Exception as e:
+            logger.error(f"Ошибка при создании миниатюр для {user_id}: {e!r}")
+            thumbnails = {}
+
+        try:
+            await asyncio.gather(
+                *(
+                    s3_repository.put_object(
+                        thumbnail_key(user_id, size), body, THUMBNAIL_CONTENT_TYPE
+                    )
+                    for size, body in thumbnails.items()
                 )
+            )
+            await s3_repository.delete_objects(
+                [
+                    thumbnail_key(user_id, size)
+                    for size in settings.avatar.thumbnail_sizes
+                    if size not in thumbnails
+                ]
+            )
+        except Exception as e:
+            logger.error(f"Ошибка при загрузке миниатюр для {user_id}: {e}")
+
+    @staticmethod
+    async def _remove_stale_images(user_id: UUID, keep: str):
+        try:
+            stale = [
+                key
+                for key in await s3_repository.list_profile_image_keys(str(user_id))
+                if key != keep
+            ]
+            await s3_repository.delete_objects(stale)
+        except Exception as e:
+            logger.error(f"Ошибка при удалении старых аватарок {user_id}: {e}")
+
+    @staticmethod
+    async def create_comment(user_id: UUID, producer: KafkaProducer):
+        user = await user_repository.get_user_by_id(user_id=user_id)
 
-            kafka_message = {
-                "username": user.username,
-            }
-            await producer.send_json(topic="comment", value=kafka_message)
-            return UserResponse(message="Комментарии отправляется...")
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Такого пользователя не существует в базе данных",
+            )
 
+        kafka_message = {
+            "user_id": str(user.id),
+            "username": user.username,
+        }
+        await producer.send(topic="comment", value=kafka_message)
+        return UserResponse(message="Комментарии отправляется...")
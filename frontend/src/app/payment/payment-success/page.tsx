@@ -3,16 +3,11 @@ import Link from "next/link"
 import { CheckCircle } from "lucide-react"
 import { Button } from "@/components/ui/button"
 import {PaymentService} from "@/service/PaymentService";
-import { NotificationService } from "@/service/NotificationService";
 
 export default function PaymentSuccessPage() {
     const handleSubmit = async () => {
         try {
             await PaymentService.successPayment();
-            setTimeout(() => {
-                console.log("Это сообщение появится через 3 секунды");
-            }, 3000);
-            await NotificationService.sendPaymentEmailSuccess()
         } catch (error) {
             console.error("Error during payment creation:", error);
         }
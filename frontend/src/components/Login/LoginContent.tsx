@@ -2,7 +2,6 @@ import { AuthService } from "@/service/AuthService";
 import LoginDetails from "@/components/Login/LoginDetails";
 import { useRouter } from "next/navigation";
 import { useState } from "react";
-import {NotificationService} from "@/service/NotificationService";
 
 export default function LoginContent() {
     const router = useRouter();
@@ -14,7 +13,6 @@ export default function LoginContent() {
         try {
             await AuthService.createUser(data.username, data.email, data.password);
             router.push("/");
-            await NotificationService.sendAuthEmailSuccess()
         } catch (error: any) {
             console.error(error);
         } finally {
@@ -38,13 +38,15 @@ export const GetFilmVideo = gql(
 
 export const GetFilms = gql(`
     query GetFilms {
-        getFilms {
-            filmName,
-            yearProd,
-            rating,
-            posterUrl,
-            previewUrl,
-            textUrl,
+        getFilmCards {
+            items {
+                filmName,
+                yearProd,
+                rating,
+                posterUrl,
+                previewUrl,
+                textUrl,
+            }
         }
     }`
 );
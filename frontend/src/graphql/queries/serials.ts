@@ -22,13 +22,15 @@ export const GetSerialNameInfo = gql(
 
 export const GetSerials = gql(
         `query GetSerials {
-            getSerials {
-                filmName,
-                yearProd,
-                rating,
-                posterUrl,
-                previewUrl,
-                textUrl,
+            getSerialCards {
+                items {
+                    filmName,
+                    yearProd,
+                    rating,
+                    posterUrl,
+                    previewUrl,
+                    textUrl,
+                }
             }
     }`
 );
@@ -73,7 +73,7 @@ export class FilmService {
             return null;
         }
 
-        const films = data?.getFilms;
+        const films = data?.getFilmCards?.items;
 
         return {
             films,
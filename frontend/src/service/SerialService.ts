@@ -37,7 +37,7 @@ export class SerialService {
             return null;
         }
 
-        const serials = data?.getSerials;
+        const serials = data?.getSerialCards?.items;
 
         return {
             serials,